@@ -1,6 +1,7 @@
 ################################################################
 # Imports
 
+import os                                      # Configuração por variáveis de ambiente
 from database_instance import app              # Importando a instância do Flask
 from routes.user_routes import user_routes     # Importando as rotas de usuário 
 from routes.categoria_routes import categoria_routes
@@ -8,6 +9,15 @@ from routes.despesa_routes import despesa_routes  # Importando as rotas de despe
 from routes.receita_routes import receita_routes  # Importando as rotas de receita
 from routes.meta_financeira_routes import meta_financeira_routes  # Importando as rotas de meta financeira
 from routes.alert_routes import alert_routes  # Importando as rotas de alerta
+from routes.relatorio_routes import relatorio_routes  # Importando as rotas de relatórios
+from routes.cache_routes import cache_routes  # Importando as rotas do cache
+from routes.importacao_routes import importacao_routes  # Importando as rotas de importação
+from routes.exportacao_routes import exportacao_routes  # Importando as rotas de exportação
+from routes.metricas_routes import metricas_routes  # Importando as rotas de métricas
+from routes.dashboard_routes import dashboard_routes  # Importando as rotas do painel da tela inicial
+from database.migrations import migrar_command  # Importando o comando de migrações
+from commands.resumo_mensal_commands import resumo_mensal_cli  # Importando os comandos do resumo mensal
+from commands.alerta_commands import alerta_cli  # Importando os comandos de disparo dos alertas
 
 ################################################################
 # Main
@@ -19,10 +29,22 @@ app.register_blueprint(despesa_routes)
 app.register_blueprint(receita_routes)
 app.register_blueprint(meta_financeira_routes)
 app.register_blueprint(alert_routes)
+app.register_blueprint(relatorio_routes)
+app.register_blueprint(cache_routes)
+app.register_blueprint(importacao_routes)
+app.register_blueprint(exportacao_routes)
+app.register_blueprint(metricas_routes)
+app.register_blueprint(dashboard_routes)
+
+# Registrando os comandos de linha de comando
+app.cli.add_command(migrar_command)
+app.cli.add_command(resumo_mensal_cli)
+app.cli.add_command(alerta_cli)
 
 ################################################################
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Servidor de desenvolvimento; em produção use o wsgi.py com gunicorn
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1')
 
 ################################################################
\ No newline at end of file
@@ -0,0 +1,68 @@
+################################################################
+# Imports
+
+import argparse                                              # Argumentos de linha de comando
+import sys                                                   # Código de saída
+
+from benchmarks.comum import criar_app, popular_usuario, medir
+from database.config_database import db
+from services.despesa_service import DespesaService
+from services.receita_service import ReceitaService
+from services.categoria_service import CategoriaService
+from utils.cache import CacheMemoria, cache_usuario
+
+################################################################
+# Main
+
+def main() -> int:
+    """ Compara a abertura da tela inicial (totais e categorias) com e sem o cache de leitura """
+
+    parser = argparse.ArgumentParser(description='Benchmark do cache de leitura por usuário')
+    parser.add_argument('--tamanho', type=int, default=10000)
+    parser.add_argument('--repeticoes', type=int, default=50)
+    parser.add_argument('--escritas-a-cada', type=int, default=10,
+                        help='Cria uma despesa a cada N aberturas para medir o efeito da invalidação')
+    args = parser.parse_args()
+
+    app = criar_app()
+    despesa_service = DespesaService(db_conn=db)
+    receita_service = ReceitaService(db_conn=db)
+    categoria_service = CategoriaService(db_conn=db)
+
+    with app.app_context():
+        usuario_id = popular_usuario(args.tamanho)
+        categoria_id = despesa_service.get_categorias_despesas(usuario_id)['categorias'][0]['id']
+        aberturas = {'total': 0}
+
+        def abrir_tela():
+            """ Mesmas leituras que a HomeScreen faz a cada foco """
+            aberturas['total'] += 1
+            if args.escritas_a_cada and aberturas['total'] % args.escritas_a_cada == 0:
+                despesa_service.create_despesa(usuario_id, categoria_id, 1, '2024-01-01', 'Benchmark', None, None, None)
+
+            categoria_service.get_categorias_by_usuario(usuario_id)
+            despesa_service.total_despesa(usuario_id)
+            receita_service.total_receitas(usuario_id)
+            despesa_service.get_categorias_despesas(usuario_id)
+            receita_service.get_categorias_receitas(usuario_id)
+
+        cache_usuario.backend = None
+        sem_cache = medir(abrir_tela, args.repeticoes)
+
+        cache_usuario.backend = CacheMemoria()
+        com_cache = medir(abrir_tela, args.repeticoes)
+        estatisticas = cache_usuario.estatisticas()
+
+    print(f'sem cache: {sem_cache:.2f} ms por abertura')
+    print(f'com cache: {com_cache:.2f} ms por abertura ({sem_cache / com_cache:.1f}x)')
+    print(f"acertos={estatisticas['acertos']} falhas={estatisticas['falhas']} "
+          f"taxa={estatisticas['taxa_acerto']:.0%} invalidações={estatisticas['invalidacoes']}")
+
+    return 0
+
+################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+################################################################
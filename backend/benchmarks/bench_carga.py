@@ -0,0 +1,330 @@
+################################################################
+# Imports
+
+import argparse                                              # Argumentos de linha de comando
+import json                                                  # Resultados e corpo das requisições
+import os                                                    # Banco e configuração por variáveis de ambiente
+import random                                                # Mistura de requisições e dados sintéticos
+import subprocess                                            # Commit atual gravado nos resultados
+import sys                                                   # Código de saída
+import tempfile                                              # Pasta do banco SQLite padrão
+import threading                                             # Clientes concorrentes
+import time                                                  # Medição de tempo
+import urllib.error                                          # Erros HTTP no modo --url
+import urllib.request                                        # Requisições a um servidor em execução
+from datetime import date, datetime, timedelta               # Datas dos dados sintéticos
+
+# A aplicação lê o banco e o custo do bcrypt ao ser importada: configura antes de importar os módulos do backend.
+# O banco é recriado a cada execução (use um banco dedicado em BENCH_DATABASE_URL).
+BANCO = os.environ.get('BENCH_DATABASE_URL') or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'poupabem_carga.db')}"
+os.environ['DATABASE_URL'] = BANCO
+os.environ.setdefault('BCRYPT_ROUNDS', '4')
+
+from benchmarks.comum import percentil, popular_usuario
+from app import app
+from database.config_database import db
+from models.alert_model import Alert
+from models.categoria_model import Categoria
+from models.meta_financeira_model import MetaFinanceira
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from utils.senhas import gerar_hash
+
+################################################################
+# Constants
+
+# Mistura de requisições (peso, método, regra da rota): leituras da tela inicial dominam, como no app
+MISTURA = (
+    (10, 'GET', '/despesa/total/<usuario_id>'),
+    (10, 'GET', '/receita/total/<usuario_id>'),
+    (8, 'GET', '/categoria/<usuario_id>'),
+    (8, 'GET', '/alert/<usuario_id>'),
+    (4, 'GET', '/dashboard/<usuario_id>'),
+    (8, 'GET', '/despesa/<usuario_id>'),
+    (6, 'GET', '/receita/<usuario_id>'),
+    (6, 'GET', '/meta_financeira/<usuario_id>'),
+    (5, 'GET', '/despesa/categorias/<usuario_id>'),
+    (5, 'GET', '/receita/categorias/<usuario_id>'),
+    (3, 'GET', '/categoria/orcamento_status/usuario/<usuario_id>'),
+    (3, 'GET', '/relatorio/graficos/<usuario_id>'),
+    (2, 'GET', '/despesa/dicas/<usuario_id>'),
+    (2, 'GET', '/categoria/total/<categoria_id>'),
+    (2, 'GET', '/despesa/por-categoria/<categoria_id>'),
+    (1, 'GET', '/alert/all'),
+    (5, 'POST', '/despesa/create'),
+    (3, 'POST', '/receita/create'),
+    (1, 'POST', '/alert/create'),
+    (2, 'POST', '/user/login'),
+)
+
+SENHA = 'senha-de-carga'
+
+################################################################
+# Helper Functions
+
+def montar_requisicao(regra: str, usuario: dict) -> tuple:
+    """ Caminho e corpo JSON de uma requisição da mistura para o usuário sorteado """
+
+    hoje = date.today()
+    categoria_despesa = random.choice(usuario['despesa'])
+    caminho = regra.replace('<usuario_id>', str(usuario['id'])).replace('<categoria_id>', str(categoria_despesa))
+
+    corpos = {
+        '/despesa/create': {
+            'usuario_id': usuario['id'], 'categoria_id': categoria_despesa, 'valor': round(random.uniform(1, 300), 2),
+            'data': (hoje - timedelta(days=random.randint(0, 30))).isoformat(), 'descricao': 'Carga',
+        },
+        '/receita/create': {
+            'usuario_id': usuario['id'], 'categoria_id': random.choice(usuario['receita']), 'valor': round(random.uniform(1, 3000), 2),
+            'data': (hoje - timedelta(days=random.randint(0, 30))).isoformat(), 'descricao': 'Carga',
+        },
+        '/alert/create': {
+            'usuario_id': usuario['id'], 'titulo': 'Carga', 'descricao': 'Alerta de carga',
+            'data_alerta': (hoje + timedelta(days=random.randint(0, 30))).isoformat(),
+        },
+        '/user/login': {'email': usuario['email'], 'password': SENHA},
+    }
+    return caminho, corpos.get(regra)
+
+################################################################
+def commit_atual() -> str:
+    """ Hash do commit atual, para identificar os resultados (None fora de um repositório git) """
+
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+################################################################
+def resumir(amostras: list, duracao: float) -> dict:
+    """ Latências (ms), vazão e consultas médias de um conjunto de amostras (segundos, status, consultas) """
+
+    latencias = [amostra[0] for amostra in amostras]
+    consultas = [amostra[2] for amostra in amostras if amostra[2] is not None]
+    return {
+        'requisicoes': len(amostras),
+        'erros': sum(1 for amostra in amostras if amostra[1] >= 400),
+        'por_segundo': round(len(amostras) / duracao, 2) if duracao else 0.0,
+        'p50_ms': round(percentil(latencias, 0.50) * 1000, 3),
+        'p95_ms': round(percentil(latencias, 0.95) * 1000, 3),
+        'p99_ms': round(percentil(latencias, 0.99) * 1000, 3),
+        'media_ms': round(sum(latencias) / len(latencias) * 1000, 3) if latencias else 0.0,
+        'consultas_media': round(sum(consultas) / len(consultas), 2) if consultas else None,
+    }
+
+################################################################
+def comparar(anterior: dict, atual: dict) -> None:
+    """ Mostra a variação do p95 e das consultas por endpoint em relação a um resultado anterior """
+
+    print(f"\ncomparação com {anterior.get('commit') or 'resultado anterior'}")
+    print(f"{'endpoint':<55} {'p95 antes':>10} {'p95 agora':>10} {'variação':>9} {'consultas':>12}")
+    for nome, atual_endpoint in sorted(atual['endpoints'].items()):
+        antes = anterior.get('endpoints', {}).get(nome)
+        if not antes:
+            continue
+        variacao = (atual_endpoint['p95_ms'] / antes['p95_ms'] - 1) if antes['p95_ms'] else 0.0
+        consultas = f"{antes['consultas_media']} -> {atual_endpoint['consultas_media']}"
+        print(f"{nome:<55} {antes['p95_ms']:>10.2f} {atual_endpoint['p95_ms']:>10.2f} {variacao:>+9.0%} {consultas:>12}")
+
+################################################################
+# Main
+
+class ClienteLocal:
+    """ Executa as requisições na própria aplicação (test client), contando as consultas SQL de cada uma """
+
+    def __init__(self, app, contador):
+        self.cliente = app.test_client()
+        self.contador = contador
+
+    ################################################################
+    def requisitar(self, metodo: str, caminho: str, corpo: dict, token: str) -> tuple:
+        """ Retorna (status, consultas SQL executadas) """
+
+        self.contador.consultas = 0
+        cabecalhos = {'Authorization': f'Bearer {token}'} if token else {}
+        resposta = self.cliente.open(caminho, method=metodo, json=corpo, headers=cabecalhos)
+        resposta.close()
+        return resposta.status_code, self.contador.consultas
+
+    ################################################################
+    def entrar(self, corpo: dict) -> str:
+        """ Faz o login e retorna o token """
+        return self.cliente.post('/user/login', json=corpo).get_json()['token']
+
+################################################################
+class ClienteHttp:
+    """ Executa as requisições em um servidor já em execução (gunicorn), sem contagem de consultas """
+
+    def __init__(self, url: str):
+        self.url = url.rstrip('/')
+
+    ################################################################
+    def requisitar(self, metodo: str, caminho: str, corpo: dict, token: str) -> tuple:
+        """ Retorna (status, None) """
+
+        dados = json.dumps(corpo).encode('utf-8') if corpo is not None else None
+        requisicao = urllib.request.Request(self.url + caminho, data=dados, method=metodo)
+        requisicao.add_header('Content-Type', 'application/json')
+        if token:
+            requisicao.add_header('Authorization', f'Bearer {token}')
+
+        try:
+            with urllib.request.urlopen(requisicao) as resposta:
+                resposta.read()
+                return resposta.status, None
+        except urllib.error.HTTPError as erro:
+            return erro.code, None
+
+    ################################################################
+    def entrar(self, corpo: dict) -> str:
+        """ Faz o login e retorna o token """
+
+        requisicao = urllib.request.Request(self.url + '/user/login', data=json.dumps(corpo).encode('utf-8'), method='POST')
+        requisicao.add_header('Content-Type', 'application/json')
+        with urllib.request.urlopen(requisicao) as resposta:
+            return json.loads(resposta.read())['token']
+
+################################################################
+def popular(usuarios: int, transacoes: int, rounds: int) -> list:
+    """ Cria os usuários sintéticos pelos modelos, com despesas, receitas, metas e alertas """
+
+    hash_senha = gerar_hash(SENHA, rounds)
+    por_usuario = max(transacoes // usuarios // 2, 0)
+    agora = datetime.combine(date.today(), datetime.min.time())
+    criados = []
+
+    for indice in range(usuarios):
+        email = f'carga{indice}@poupabem.com'
+        usuario_id = popular_usuario(por_usuario, email=email, senha=hash_senha)
+
+        db.session.execute(db.insert(MetaFinanceira), [{
+            'usuario_id': usuario_id, 'titulo': f'Meta {numero}', 'valor_atual': 0, 'valor_meta': 5000,
+            'data_inicio': agora - timedelta(days=90), 'data_fim': agora + timedelta(days=90), 'tipo': 'geral',
+        } for numero in range(2)])
+        db.session.execute(db.insert(Alert), [{
+            'usuario_id': usuario_id, 'titulo': f'Alerta {numero}', 'descricao': 'Alerta sintético',
+            'data_alerta': agora + timedelta(days=numero), 'criado_em': agora,
+        } for numero in range(3)])
+        db.session.commit()
+
+        categorias = db.session.execute(
+            db.select(Categoria.id, Categoria.tipo).where(Categoria.usuario_id == usuario_id)
+        ).all()
+        criados.append({
+            'id': usuario_id,
+            'email': email,
+            'despesa': [linha.id for linha in categorias if linha.tipo == 'despesa'],
+            'receita': [linha.id for linha in categorias if linha.tipo == 'receita'],
+        })
+
+    return criados
+
+################################################################
+def executar(clientes: list, usuarios: list, requisicoes: int) -> tuple:
+    """ Dispara `requisicoes` requisições da mistura divididas entre os clientes; retorna (amostras por endpoint, duração) """
+
+    pesos = [peso for peso, _, _ in MISTURA]
+    amostras = {}
+    lock = threading.Lock()
+    restantes = {'total': requisicoes}
+
+    def trabalhar(cliente):
+        while True:
+            with lock:
+                if restantes['total'] <= 0:
+                    return
+                restantes['total'] -= 1
+
+            _, metodo, regra = random.choices(MISTURA, weights=pesos)[0]
+            usuario = random.choice(usuarios)
+            caminho, corpo = montar_requisicao(regra, usuario)
+
+            inicio = time.perf_counter()
+            # O login é feito sem token (a rota recusa usuários já logados)
+            token = None if regra == '/user/login' else usuario['token']
+            status, consultas = cliente.requisitar(metodo, caminho, corpo, token)
+            duracao = time.perf_counter() - inicio
+
+            with lock:
+                amostras.setdefault(f'{metodo} {regra}', []).append((duracao, status, consultas))
+
+    threads = [threading.Thread(target=trabalhar, args=(cliente,)) for cliente in clientes]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return amostras, time.perf_counter() - inicio
+
+################################################################
+def main() -> int:
+    """ Popula um banco com usuários sintéticos e mede todas as áreas da API com uma mistura realista de requisições """
+
+    parser = argparse.ArgumentParser(description='Teste de carga da API com banco populado')
+    parser.add_argument('--usuarios', type=int, default=100)
+    parser.add_argument('--transacoes', type=int, default=50000, help='Total de despesas + receitas entre todos os usuários')
+    parser.add_argument('--requisicoes', type=int, default=2000)
+    parser.add_argument('--aquecimento', type=int, default=100, help='Requisições descartadas antes da medição')
+    parser.add_argument('--concorrencia', type=int, default=1)
+    parser.add_argument('--rounds', type=int, default=int(os.environ['BCRYPT_ROUNDS']), help='Fator de custo do bcrypt das senhas sintéticas')
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--url', default=None, help='Servidor em execução apontando para o mesmo banco de BENCH_DATABASE_URL')
+    parser.add_argument('--saida', default=None, help='Arquivo JSON com os resultados')
+    parser.add_argument('--comparar', default=None, help='Resultado JSON anterior para comparação')
+    args = parser.parse_args()
+
+    random.seed(args.semente)
+
+    contador = threading.local()
+    event.listen(Engine, 'after_cursor_execute', lambda *_: setattr(contador, 'consultas', getattr(contador, 'consultas', 0) + 1))
+
+    inicio = time.perf_counter()
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        usuarios = popular(args.usuarios, args.transacoes, args.rounds)
+    print(f'{args.usuarios} usuários e {args.transacoes} transações criados em {time.perf_counter() - inicio:.1f}s')
+
+    if args.url:
+        clientes = [ClienteHttp(args.url) for _ in range(args.concorrencia)]
+    else:
+        clientes = [ClienteLocal(app, contador) for _ in range(args.concorrencia)]
+
+    # Tokens obtidos pelo próprio login da API
+    for usuario in usuarios:
+        usuario['token'] = clientes[0].entrar(montar_requisicao('/user/login', usuario)[1])
+
+    executar(clientes, usuarios, args.aquecimento)
+    amostras, duracao = executar(clientes, usuarios, args.requisicoes)
+
+    resultado = {
+        'commit': commit_atual(),
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'parametros': {**vars(args), 'banco': BANCO.split('://')[0]},
+        'total': resumir([amostra for lista in amostras.values() for amostra in lista], duracao),
+        'endpoints': {nome: resumir(lista, duracao) for nome, lista in sorted(amostras.items())},
+    }
+
+    print(f"{'endpoint':<55} {'n':>6} {'erros':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'consultas':>9}")
+    for nome, dados in resultado['endpoints'].items():
+        print(f"{nome:<55} {dados['requisicoes']:>6} {dados['erros']:>6} {dados['p50_ms']:>8.2f} {dados['p95_ms']:>8.2f} "
+              f"{dados['p99_ms']:>8.2f} {dados['consultas_media'] if dados['consultas_media'] is not None else '-':>9}")
+    total = resultado['total']
+    print(f"total: {total['requisicoes']} requisições, {total['por_segundo']} req/s, "
+          f"p50={total['p50_ms']} ms p95={total['p95_ms']} ms p99={total['p99_ms']} ms, {total['erros']} erros")
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as saida:
+            json.dump(resultado, saida, indent=2, ensure_ascii=False)
+        print(f'resultados gravados em {args.saida}')
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as anterior:
+            comparar(json.load(anterior), resultado)
+
+    return 0
+
+################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
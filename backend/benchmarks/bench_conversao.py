@@ -0,0 +1,141 @@
+################################################################
+# Imports
+
+import argparse                                              # Argumentos de linha de comando
+import sys                                                   # Código de saída
+import time                                                  # Medição de tempo
+import tracemalloc                                           # Pico de memória alocada pelo Python
+from datetime import date, timedelta                         # Datas das transações sintéticas
+
+from benchmarks.comum import criar_app, popular_usuario
+from database.config_database import db
+from models.categoria_model import Categoria
+from models.despesa_model import Despesa
+from models.receita_model import Receita
+from services.categoria_service import CategoriaService, LOTE_CONVERSAO
+from services.resumo_mensal_service import ResumoMensalService
+
+################################################################
+# Helper Functions
+
+def criar_categoria(usuario_id: int, quantidade: int) -> int:
+    """ Cria uma categoria de receita com `quantidade` receitas """
+
+    categoria = Categoria(usuario_id=usuario_id, nome='Conversão', tipo='receita')
+    db.session.add(categoria)
+    db.session.flush()
+
+    hoje = date.today()
+    for inicio in range(0, quantidade, 5000):
+        db.session.execute(db.insert(Receita), [
+            {'usuario_id': usuario_id, 'categoria_id': categoria.id, 'valor': 10, 'data': hoje - timedelta(days=i % 365), 'descricao': 'Receita sintética'}
+            for i in range(inicio, min(inicio + 5000, quantidade))
+        ])
+
+    db.session.commit()
+    return categoria.id
+
+################################################################
+def converter_hidratando(categoria_id: int) -> None:
+    """ Conversão anterior: carrega cada receita e cria uma despesa por objeto """
+
+    for receita in db.session.query(Receita).filter_by(categoria_id=categoria_id).all():
+        db.session.add(Despesa(usuario_id=receita.usuario_id, categoria_id=receita.categoria_id,
+                               valor=receita.valor, descricao=receita.descricao, data=receita.data))
+    db.session.query(Receita).filter_by(categoria_id=categoria_id).delete()
+    db.session.query(Categoria).filter_by(id=categoria_id).update({'tipo': 'despesa'})
+    db.session.commit()
+
+################################################################
+def perfilar(funcao) -> tuple:
+    """ Executa a função e retorna (milissegundos, pico de memória em KiB) """
+
+    db.session.expunge_all()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    funcao()
+    duracao = (time.perf_counter() - inicio) * 1000
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.session.expunge_all()
+    return duracao, pico / 1024
+
+################################################################
+def verificar_exclusao_em_conversao(usuario_id: int, categoria_service: CategoriaService, lote: int) -> None:
+    """ Exclui uma categoria com a conversão interrompida depois do primeiro lote: nada pode sobrar nas duas tabelas """
+
+    resumo_service = ResumoMensalService(db_conn=db)
+    categoria_id = criar_categoria(usuario_id, lote * 2 + 1)
+    categoria = db.session.get(Categoria, categoria_id)
+
+    # criar_categoria insere direto nas tabelas: o resumo mensal é reconstruído antes da conversão
+    resumo_service.reconstruir(usuario_id)
+    db.session.commit()
+
+    # Mesmo estado de uma conversão interrompida: um lote já movido e comitado, com convertendo_para marcado
+    limite_id = db.session.scalar(
+        db.select(Receita.id).where(Receita.categoria_id == categoria_id).order_by(Receita.id).offset(lote - 1).limit(1)
+    )
+    categoria_service.mover_lote(categoria_id, Receita, Despesa, [Receita.categoria_id == categoria_id, Receita.id <= limite_id])
+    categoria.convertendo_para = 'despesa'
+    db.session.commit()
+
+    assert categoria_service.delete_categoria(categoria_id)['status']
+    assert db.session.query(Receita).filter_by(categoria_id=categoria_id).count() == 0
+    assert db.session.query(Despesa).filter_by(categoria_id=categoria_id).count() == 0
+
+    assert not resumo_service.verificar(usuario_id) and not resumo_service.verificar_totais(usuario_id)
+
+################################################################
+# Main
+
+def main() -> int:
+    """ Mede tempo e pico de memória da conversão de tipo de uma categoria conforme o volume cresce """
+
+    parser = argparse.ArgumentParser(description='Benchmark da conversão de tipo de categoria')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--lote', type=int, default=LOTE_CONVERSAO)
+    parser.add_argument('--sem-anterior', action='store_true', help='Não mede a conversão anterior (ORM)')
+    parser.add_argument('--fator-maximo', type=float, default=None,
+                        help='Falha se o pico de memória do maior volume passar deste múltiplo do menor')
+    args = parser.parse_args()
+
+    app = criar_app()
+    categoria_service = CategoriaService(db_conn=db)
+    resultados = []
+
+    with app.app_context():
+        usuario_id = popular_usuario(0, categorias=0)
+
+        for tamanho in args.tamanhos:
+            categoria_id = criar_categoria(usuario_id, tamanho)
+            novo = perfilar(lambda: categoria_service.update_categoria(categoria_id, 'Conversão', 'despesa', lote=args.lote))
+            assert db.session.query(Receita).filter_by(categoria_id=categoria_id).count() == 0
+
+            anterior = (float('nan'), float('nan'))
+            if not args.sem_anterior:
+                categoria_id = criar_categoria(usuario_id, tamanho)
+                anterior = perfilar(lambda: converter_hidratando(categoria_id))
+
+            resultados.append((tamanho, novo, anterior))
+
+        verificar_exclusao_em_conversao(usuario_id, categoria_service, min(args.lote, 1000))
+
+    print(f"{'linhas':>10} {'SQL (ms)':>10} {'SQL (KiB)':>10} {'ORM (ms)':>10} {'ORM (KiB)':>10}")
+    for tamanho, (ms, kib), (ms_orm, kib_orm) in resultados:
+        print(f'{tamanho:>10} {ms:>10.1f} {kib:>10.1f} {ms_orm:>10.1f} {kib_orm:>10.1f}')
+
+    if args.fator_maximo is not None:
+        fator = resultados[-1][1][1] / resultados[0][1][1]
+        if fator > args.fator_maximo:
+            print(f'Regressão: memória cresceu {fator:.1f}x (máximo {args.fator_maximo}x)')
+            return 1
+
+    return 0
+
+################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+################################################################
@@ -0,0 +1,61 @@
+################################################################
+# Imports
+
+import argparse                                              # Argumentos de linha de comando
+import sys                                                   # Código de saída
+import time                                                  # Medição de tempo
+import tracemalloc                                           # Pico de memória alocada pelo Python
+
+from benchmarks.comum import criar_app, popular_usuario
+from database.config_database import db
+from services.exportacao_service import ExportacaoService
+
+################################################################
+# Main
+
+def main() -> int:
+    """ Mede tempo e pico de memória da exportação do extrato conforme o volume cresce """
+
+    parser = argparse.ArgumentParser(description='Benchmark da exportação do extrato em streaming')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--formato', choices=['csv', 'ndjson'], default='csv')
+    parser.add_argument('--fator-maximo', type=float, default=None,
+                        help='Falha se o pico de memória do maior volume passar deste múltiplo do menor')
+    args = parser.parse_args()
+
+    app = criar_app()
+    exportacao_service = ExportacaoService(db_conn=db)
+    resultados = []
+
+    with app.app_context():
+        for tamanho in args.tamanhos:
+            usuario_id = popular_usuario(tamanho)
+            db.session.expunge_all()
+
+            tracemalloc.start()
+            inicio = time.perf_counter()
+            enviados = sum(len(bloco) for bloco in exportacao_service.exportar(usuario_id, args.formato))
+            duracao = time.perf_counter() - inicio
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            resultados.append((tamanho * 2, duracao, enviados / 1024 / 1024, pico / 1024 / 1024))
+
+    print(f"{'linhas':>10} {'tempo (s)':>10} {'enviado (MiB)':>14} {'pico (MiB)':>11}")
+    for linhas, duracao, enviado, pico in resultados:
+        print(f'{linhas:>10} {duracao:>10.2f} {enviado:>14.1f} {pico:>11.2f}')
+
+    if args.fator_maximo is not None:
+        fator = resultados[-1][3] / resultados[0][3]
+        if fator > args.fator_maximo:
+            print(f'Regressão: memória cresceu {fator:.1f}x (máximo {args.fator_maximo}x)')
+            return 1
+
+    return 0
+
+################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+################################################################
@@ -0,0 +1,81 @@
+################################################################
+# Imports
+
+import argparse                                              # Argumentos de linha de comando
+import random                                                # Geração das linhas sintéticas
+import sys                                                   # Código de saída
+import tempfile                                              # Arquivo CSV temporário
+import time                                                  # Medição de tempo
+import tracemalloc                                           # Pico de memória alocada pelo Python
+from datetime import date, timedelta                         # Datas das transações sintéticas
+
+from benchmarks.comum import criar_app, popular_usuario
+from database.config_database import db
+from models.categoria_model import Categoria
+from services.importacao_service import ImportacaoService
+
+################################################################
+# Helper Functions
+
+def gerar_csv(arquivo, quantidade: int, categorias: list) -> None:
+    """ Escreve um extrato CSV com `quantidade` linhas (despesas negativas, receitas positivas) """
+
+    hoje = date.today()
+    arquivo.write('data;descricao;valor;categoria\n'.encode())
+    for _ in range(quantidade):
+        categoria = random.choice(categorias)
+        valor = random.uniform(1, 500) * (-1 if categoria.tipo == 'despesa' else 1)
+        data = hoje - timedelta(days=random.randint(0, 365))
+        arquivo.write(f'{data.strftime("%d/%m/%Y")};Compra;{valor:.2f};{categoria.nome}\n'.replace('.', ',', 1).encode())
+    arquivo.seek(0)
+
+################################################################
+# Main
+
+def main() -> int:
+    """ Mede tempo e pico de memória da importação de extratos conforme o volume cresce """
+
+    parser = argparse.ArgumentParser(description='Benchmark da importação de extratos CSV')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--tempo-maximo', type=float, default=None,
+                        help='Falha se o maior volume levar mais que estes segundos')
+    args = parser.parse_args()
+
+    app = criar_app()
+    importacao_service = ImportacaoService(db_conn=db)
+    resultados = []
+
+    with app.app_context():
+        usuario_id = popular_usuario(0)
+        categorias = db.session.query(Categoria).filter_by(usuario_id=usuario_id).all()
+
+        for tamanho in args.tamanhos:
+            with tempfile.TemporaryFile() as arquivo:
+                gerar_csv(arquivo, tamanho, categorias)
+
+                tracemalloc.start()
+                inicio = time.perf_counter()
+                resposta = importacao_service.importar(usuario_id, arquivo, 'csv')
+                duracao = time.perf_counter() - inicio
+                _, pico = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+            assert resposta.get('importadas') == tamanho, resposta
+            resultados.append((tamanho, duracao, pico / 1024 / 1024))
+
+    print(f"{'linhas':>10} {'tempo (s)':>10} {'linhas/s':>10} {'pico (MiB)':>11}")
+    for tamanho, duracao, pico in resultados:
+        print(f'{tamanho:>10} {duracao:>10.2f} {tamanho / duracao:>10.0f} {pico:>11.1f}')
+
+    if args.tempo_maximo is not None and resultados[-1][1] > args.tempo_maximo:
+        print(f'Regressão: {resultados[-1][1]:.1f}s (máximo {args.tempo_maximo}s)')
+        return 1
+
+    return 0
+
+################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+################################################################
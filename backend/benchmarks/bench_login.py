@@ -0,0 +1,138 @@
+################################################################
+# Imports
+
+import argparse                                              # Argumentos de linha de comando
+import os                                                    # Arquivo temporário do banco
+import sys                                                   # Código de saída
+import tempfile                                              # Banco SQLite compartilhado entre threads
+import threading                                             # Logins concorrentes
+import time                                                  # Medição de tempo
+
+from benchmarks.comum import DATABASE_URI, criar_app, percentil, popular_usuario
+from database.config_database import db
+from models.user_model import User
+from services.user_service import UserService
+from services.despesa_service import DespesaService
+from utils.senhas import FILA, TRABALHADORES, PoolSenhas, SenhaSobrecarga, gerar_hash
+
+################################################################
+# Helper Functions
+
+################################################################
+def rodada(app, user_service: UserService, concorrencia: int, logins: int, usuarios: list, senha: str, usuario_leitura: int) -> dict:
+    """ Dispara `logins` logins em `concorrencia` threads enquanto outra thread mede uma leitura leve """
+
+    despesa_service = DespesaService(db_conn=db)
+    latencias, leituras = [], []
+    contagem = {'ok': 0, 'recusados': 0}
+    proximo = {'indice': 0}
+    lock = threading.Lock()
+    fim = threading.Event()
+
+    def logar():
+        with app.app_context():
+            while True:
+                with lock:
+                    if proximo['indice'] >= logins:
+                        return
+                    email = usuarios[proximo['indice'] % len(usuarios)]
+                    proximo['indice'] += 1
+
+                inicio = time.perf_counter()
+                try:
+                    resposta = user_service.login(email=email, password=senha)
+                    chave = 'ok' if resposta['status'] else 'recusados'
+                except SenhaSobrecarga:
+                    chave = 'recusados'
+                with lock:
+                    latencias.append(time.perf_counter() - inicio)
+                    contagem[chave] += 1
+
+    def ler():
+        """ Requisição leve concorrente: mostra se a rajada de logins trava o restante do worker """
+        with app.app_context():
+            while not fim.is_set():
+                inicio = time.perf_counter()
+                despesa_service.total_despesa(usuario_leitura)
+                leituras.append(time.perf_counter() - inicio)
+                time.sleep(0.005)
+
+    leitor = threading.Thread(target=ler)
+    threads = [threading.Thread(target=logar) for _ in range(concorrencia)]
+
+    inicio = time.perf_counter()
+    leitor.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duracao = time.perf_counter() - inicio
+    fim.set()
+    leitor.join()
+
+    return {
+        'concorrencia': concorrencia,
+        'por_segundo': contagem['ok'] / duracao,
+        'recusados': contagem['recusados'],
+        'p50': percentil(latencias, 0.5) * 1000,
+        'p95': percentil(latencias, 0.95) * 1000,
+        'leitura_p50': percentil(leituras, 0.5) * 1000,
+        'leitura_p95': percentil(leituras, 0.95) * 1000,
+    }
+
+################################################################
+# Main
+
+def main() -> int:
+    """ Mede a vazão de logins (bcrypt no pool de senhas) e o impacto nas demais requisições """
+
+    parser = argparse.ArgumentParser(description='Benchmark de vazão de login')
+    parser.add_argument('--rounds', type=int, default=10, help='Fator de custo do bcrypt dos usuários de teste')
+    parser.add_argument('--usuarios', type=int, default=20)
+    parser.add_argument('--logins', type=int, default=200, help='Logins por nível de concorrência')
+    parser.add_argument('--concorrencia', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--trabalhadores', type=int, default=TRABALHADORES)
+    parser.add_argument('--fila', type=int, default=FILA)
+    args = parser.parse_args()
+
+    # O SQLite em memória não é compartilhado entre threads: usa um arquivo temporário
+    arquivo = None
+    database_uri = DATABASE_URI
+    if database_uri == 'sqlite://':
+        descritor, arquivo = tempfile.mkstemp(suffix='.db')
+        os.close(descritor)
+        database_uri = f'sqlite:///{arquivo}'
+
+    app = criar_app(database_uri)
+    senha = 'senha-de-teste'
+
+    with app.app_context():
+        usuario_leitura = popular_usuario(1000)
+        hash_senha = gerar_hash(senha, args.rounds)
+        usuarios = [f'login{indice}@poupabem.com' for indice in range(args.usuarios)]
+        db.session.add_all([User(nome='Login', email=email, senha=hash_senha) for email in usuarios])
+        db.session.commit()
+
+    user_service = UserService(db_conn=db)
+    user_service.pool_senhas = PoolSenhas(trabalhadores=args.trabalhadores, fila=args.fila, rounds=args.rounds)
+
+    print(f'rounds={args.rounds} trabalhadores={args.trabalhadores} fila={args.fila}')
+    print(f"{'concorrência':>12} {'logins/s':>10} {'recusados':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} "
+          f"{'leitura p50':>12} {'leitura p95':>12}")
+
+    try:
+        for concorrencia in args.concorrencia:
+            resultado = rodada(app, user_service, concorrencia, args.logins, usuarios, senha, usuario_leitura)
+            print(f"{resultado['concorrencia']:>12} {resultado['por_segundo']:>10.1f} {resultado['recusados']:>10} "
+                  f"{resultado['p50']:>10.1f} {resultado['p95']:>10.1f} "
+                  f"{resultado['leitura_p50']:>12.2f} {resultado['leitura_p95']:>12.2f}")
+    finally:
+        if arquivo:
+            os.remove(arquivo)
+
+    return 0
+
+################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
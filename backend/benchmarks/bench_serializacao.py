@@ -0,0 +1,85 @@
+################################################################
+# Imports
+
+import argparse                                              # Argumentos de linha de comando
+import sys                                                   # Código de saída
+
+from flask.json.provider import DefaultJSONProvider          # Codificador padrão do jsonify
+from sqlalchemy import select                                # Consulta das colunas do esquema
+
+from benchmarks.comum import criar_app, popular_usuario, medir
+from database.config_database import db
+from models.despesa_model import Despesa
+from services.despesa_service import ESQUEMA_DESPESA
+from utils.serializacao import JSONRapido
+
+################################################################
+# Helper Functions
+
+def serializar_entidade(despesa: Despesa) -> dict:
+    """ Serialização anterior: dicionário montado à mão a partir da entidade ORM """
+    return {
+        'id': despesa.id,
+        'usuario_id': despesa.usuario_id,
+        'categoria_id': despesa.categoria_id,
+        'valor': float(despesa.valor),
+        'data': despesa.data.isoformat(),
+        'descricao': despesa.descricao,
+        'image': despesa.imagem if despesa.imagem else None,
+        'latitude': despesa.latitude,
+        'longitude': despesa.longitude,
+        'criado_em': despesa.criado_em.isoformat()
+    }
+
+################################################################
+# Main
+
+def main() -> int:
+    """ Mede o custo por linha de consultar, serializar e codificar uma lista de despesas """
+
+    parser = argparse.ArgumentParser(description='Benchmark da serialização de listas')
+    parser.add_argument('--linhas', type=int, default=10000)
+    parser.add_argument('--repeticoes', type=int, default=10)
+    args = parser.parse_args()
+
+    app = criar_app()
+    padrao = DefaultJSONProvider(app)
+    rapido = JSONRapido(app)
+
+    with app.app_context():
+        usuario_id = popular_usuario(args.linhas, categorias=1)
+
+        def entidades():
+            return [serializar_entidade(d) for d in db.session.query(Despesa).filter_by(usuario_id=usuario_id).all()]
+
+        def colunas_orm():
+            return ESQUEMA_DESPESA.serializar_lista(db.session.execute(
+                select(*[campo.coluna.label(campo.nome) for campo in ESQUEMA_DESPESA.campos]).where(Despesa.usuario_id == usuario_id)
+            ).all())
+
+        def tuplas():
+            return ESQUEMA_DESPESA.ler_serializado(db.session, ESQUEMA_DESPESA.consulta().where(Despesa.usuario_id == usuario_id))
+
+        assert entidades() == colunas_orm() == tuplas()
+        lista = tuplas()
+
+        etapas = [
+            ('consulta + dicionários (entidades ORM)', medir(entidades, args.repeticoes)),
+            ('consulta + dicionários (colunas via ORM)', medir(colunas_orm, args.repeticoes)),
+            ('consulta + dicionários (Core + esquema)', medir(tuplas, args.repeticoes)),
+            ('codificação json (stdlib)', medir(lambda: padrao.dumps({'despesas': lista}), args.repeticoes)),
+            ('codificação json (JSONRapido)', medir(lambda: rapido.dumps({'despesas': lista}), args.repeticoes)),
+        ]
+
+    print(f"{'etapa':<45} {'total (ms)':>11} {'por linha (µs)':>15}")
+    for nome, ms in etapas:
+        print(f'{nome:<45} {ms:>11.2f} {ms * 1000 / args.linhas:>15.2f}')
+
+    return 0
+
+################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+################################################################
@@ -0,0 +1,64 @@
+################################################################
+# Imports
+
+import argparse                                              # Argumentos de linha de comando
+import sys                                                   # Código de saída
+
+from benchmarks.comum import criar_app, popular_usuario, medir
+from database.config_database import db
+from models.despesa_model import Despesa
+from models.receita_model import Receita
+from services.despesa_service import DespesaService
+from services.receita_service import ReceitaService
+
+################################################################
+# Main
+
+def total_hidratando(usuario_id: int) -> tuple:
+    """ Implementação anterior: carrega todas as linhas e soma em Python """
+    despesas = db.session.query(Despesa).filter_by(usuario_id=usuario_id).all()
+    receitas = db.session.query(Receita).filter_by(usuario_id=usuario_id).all()
+    return sum(d.valor for d in despesas), sum(r.valor for r in receitas)
+
+################################################################
+def main() -> int:
+    """ Mede a latência dos totais de despesas/receitas conforme o volume de linhas cresce """
+
+    parser = argparse.ArgumentParser(description='Benchmark dos totais de despesas e receitas')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--repeticoes', type=int, default=20)
+    parser.add_argument('--fator-maximo', type=float, default=None,
+                        help='Falha se a latência do maior volume passar deste múltiplo do menor')
+    args = parser.parse_args()
+
+    app = criar_app()
+    despesa_service = DespesaService(db_conn=db)
+    receita_service = ReceitaService(db_conn=db)
+    resultados = []
+
+    with app.app_context():
+        for tamanho in args.tamanhos:
+            usuario_id = popular_usuario(tamanho)
+
+            sql = medir(lambda: (despesa_service.total_despesa(usuario_id), receita_service.total_receitas(usuario_id)), args.repeticoes)
+            orm = medir(lambda: total_hidratando(usuario_id), max(1, args.repeticoes // 4))
+            resultados.append((tamanho, sql, orm))
+
+    print(f"{'linhas':>10} {'SUM (ms)':>12} {'ORM (ms)':>12} {'ganho':>8}")
+    for tamanho, sql, orm in resultados:
+        print(f'{tamanho:>10} {sql:>12.2f} {orm:>12.2f} {orm / sql:>7.1f}x')
+
+    if args.fator_maximo is not None:
+        fator = resultados[-1][1] / resultados[0][1]
+        if fator > args.fator_maximo:
+            print(f'Regressão: latência cresceu {fator:.1f}x (máximo {args.fator_maximo}x)')
+            return 1
+
+    return 0
+
+################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+################################################################
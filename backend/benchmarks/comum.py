@@ -0,0 +1,110 @@
+################################################################
+# Imports
+
+import os                                    # Variáveis de ambiente
+import random                                # Geração de dados sintéticos
+import statistics                            # Cálculo de medianas
+import sys                                   # Ajuste do caminho de importação
+import time                                  # Medição de tempo
+from datetime import date, timedelta         # Datas das transações
+
+# Permite executar os benchmarks a partir da pasta backend (python -m benchmarks.<nome>)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Os benchmarks medem o banco; o cache de leitura só é ligado quando pedido explicitamente
+os.environ.setdefault('CACHE_BACKEND', 'desligado')
+
+from flask import Flask                      # Aplicação isolada para os benchmarks
+from database.config_database import db      # Instância do SQLAlchemy
+from models.user_model import User
+from models.categoria_model import Categoria
+from models.despesa_model import Despesa
+from models.receita_model import Receita
+from services.resumo_mensal_service import ResumoMensalService
+
+################################################################
+# Constants
+
+# Banco padrão dos benchmarks: SQLite em memória, substituível por um PostgreSQL local
+DATABASE_URI = os.environ.get('BENCH_DATABASE_URL', 'sqlite://')
+
+################################################################
+# Helper Functions
+
+def criar_app(database_uri: str = DATABASE_URI) -> Flask:
+    """ Cria uma aplicação Flask isolada apontando para o banco de benchmark """
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+    return app
+
+################################################################
+def popular_usuario(quantidade: int, usuario_id: int = None, categorias: int = 5, dias: int = 365, lote: int = 5000,
+                    email: str = None, senha: str = 'x') -> int:
+    """ Cria um usuário com `quantidade` despesas e `quantidade` receitas distribuídas em categorias """
+
+    usuario = User(nome='Benchmark', email=email or f'bench{random.random()}@poupabem.com', senha=senha)
+    if usuario_id is not None:
+        usuario.id = usuario_id
+    db.session.add(usuario)
+    db.session.flush()
+
+    ids_despesa, ids_receita = [], []
+    for indice in range(categorias):
+        for tipo, ids in (('despesa', ids_despesa), ('receita', ids_receita)):
+            categoria = Categoria(usuario_id=usuario.id, nome=f'{tipo} {indice}', tipo=tipo, limite_gasto=100000)
+            db.session.add(categoria)
+            db.session.flush()
+            ids.append(categoria.id)
+
+    hoje = date.today()
+    for modelo, ids in ((Despesa, ids_despesa), (Receita, ids_receita)):
+        linhas = []
+        for _ in range(quantidade):
+            linhas.append({
+                'usuario_id': usuario.id,
+                'categoria_id': random.choice(ids),
+                'valor': round(random.uniform(1, 500), 2),
+                'data': hoje - timedelta(days=random.randint(0, dias)),
+                'descricao': 'Transação sintética',
+            })
+            if len(linhas) >= lote:
+                db.session.execute(db.insert(modelo), linhas)
+                linhas = []
+        if linhas:
+            db.session.execute(db.insert(modelo), linhas)
+
+    # As inserções em lote não passam pelos serviços: recria o resumo mensal do usuário
+    ResumoMensalService(db_conn=db).reconstruir(usuario_id=usuario.id)
+    db.session.commit()
+    return usuario.id
+
+################################################################
+def percentil(valores: list, fracao: float) -> float:
+    """ Percentil pelo posto mais próximo (0 se não houver valores) """
+
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * fracao))]
+
+################################################################
+def medir(funcao, repeticoes: int = 20) -> float:
+    """ Retorna a mediana, em milissegundos, de `repeticoes` execuções da função """
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+        db.session.expunge_all()
+    return statistics.median(tempos)
+
+################################################################
@@ -0,0 +1,65 @@
+################################################################
+# Imports
+
+import click                                          # Comandos de linha de comando do Flask
+import time                                           # Espera entre as execuções do agendador
+from datetime import datetime, timedelta              # Cálculo da próxima execução
+from flask.cli import AppGroup                        # Grupo de comandos do Flask
+from database.config_database import db               # Instância do banco de dados
+from services.alert_service import AlertService       # Serviço de alertas
+
+################################################################
+# Defined
+
+alerta_cli = AppGroup('alertas', help='Disparo diário dos alertas.')
+
+################################################################
+# Helper Functions
+
+def proxima_execucao(agora: datetime, hora: int, minuto: int) -> datetime:
+    """ Próximo horário diário de execução a partir de agora """
+
+    execucao = agora.replace(hour=hora, minute=minuto, second=0, microsecond=0)
+    if execucao <= agora:
+        execucao += timedelta(days=1)
+    return execucao
+
+################################################################
+def disparar(alert_service: AlertService) -> None:
+    """ Dispara os alertas do dia (e os de dias anteriores ainda pendentes) e registra a quantidade """
+
+    quantidade = alert_service.disparar_alertas()
+    click.echo(f'{datetime.now():%Y-%m-%d %H:%M:%S} {quantidade} alerta(s) disparado(s).')
+
+################################################################
+# Commands
+
+@alerta_cli.command('disparar')
+def disparar_command() -> None:
+    """ Marca como disparados os alertas de hoje e os atrasados (para uso com cron, uma vez por dia) """
+
+    disparar(AlertService(db_conn=db))
+
+################################################################
+@alerta_cli.command('agendador')
+@click.option('--hora', type=click.IntRange(0, 23), default=0, show_default=True, help='Hora diária do disparo.')
+@click.option('--minuto', type=click.IntRange(0, 59), default=0, show_default=True, help='Minuto diário do disparo.')
+def agendador_command(hora: int, minuto: int) -> None:
+    """ Worker que dispara os alertas ao iniciar e depois uma vez por dia no horário informado """
+
+    alert_service = AlertService(db_conn=db)
+
+    # O disparo é idempotente e inclui os alertas de dias anteriores ainda não disparados:
+    # executar ao iniciar cobre os dias em que o worker esteve parado
+    while True:
+        try:
+            disparar(alert_service)
+        except Exception as e:
+            click.echo(f'Erro ao disparar alertas: {e}', err=True)
+        finally:
+            db.session.remove()
+
+        espera = (proxima_execucao(datetime.now(), hora, minuto) - datetime.now()).total_seconds()
+        time.sleep(max(espera, 0))
+
+################################################################
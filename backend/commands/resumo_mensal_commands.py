@@ -0,0 +1,66 @@
+################################################################
+# Imports
+
+import click                                          # Comandos de linha de comando do Flask
+from flask.cli import AppGroup                        # Grupo de comandos do Flask
+from database.config_database import db               # Instância do banco de dados
+from services.resumo_mensal_service import ResumoMensalService  # Serviço do resumo mensal
+
+################################################################
+# Defined
+
+resumo_mensal_cli = AppGroup('resumo-mensal', help='Manutenção do resumo mensal de despesas e receitas.')
+
+################################################################
+# Commands
+
+@resumo_mensal_cli.command('reconstruir')
+@click.option('--usuario', 'usuario_id', type=int, default=None, help='Reconstrói apenas o resumo deste usuário.')
+def reconstruir_command(usuario_id: int) -> None:
+    """ Recria o resumo mensal a partir das despesas e receitas """
+
+    resumo_service = ResumoMensalService(db_conn=db)
+    resumo_service.reconstruir(usuario_id=usuario_id)
+    db.session.commit()
+
+    click.echo('Resumo mensal reconstruído.')
+
+################################################################
+@resumo_mensal_cli.command('verificar')
+@click.option('--usuario', 'usuario_id', type=int, default=None, help='Verifica apenas o resumo deste usuário.')
+@click.option('--reparar', is_flag=True, help='Reconstrói o resumo e os totais dos usuários com divergências.')
+def verificar_command(usuario_id: int, reparar: bool) -> None:
+    """ Compara o resumo mensal e o total das categorias com as transações e lista as divergências """
+
+    resumo_service = ResumoMensalService(db_conn=db)
+    divergencias = resumo_service.verificar(usuario_id=usuario_id)
+    totais = resumo_service.verificar_totais(usuario_id=usuario_id)
+
+    if not divergencias and not totais:
+        click.echo('Resumo mensal e totais das categorias consistentes.')
+        return
+
+    for divergencia in divergencias:
+        click.echo(
+            f"usuario={divergencia['usuario_id']} categoria={divergencia['categoria_id']} tipo={divergencia['tipo']} "
+            f"{divergencia['ano']}-{divergencia['mes']:02d}: esperado={divergencia['esperado']} atual={divergencia['atual']}"
+        )
+
+    for divergencia in totais:
+        click.echo(
+            f"usuario={divergencia['usuario_id']} categoria={divergencia['categoria_id']} total: "
+            f"esperado={divergencia['esperado']} atual={divergencia['atual']}"
+        )
+
+    if not reparar:
+        raise SystemExit(1)
+
+    # Reconstrói apenas os usuários afetados, cada um em sua transação
+    usuarios = sorted({divergencia['usuario_id'] for divergencia in divergencias + totais})
+    for usuario in usuarios:
+        resumo_service.reconstruir(usuario_id=usuario)
+        db.session.commit()
+
+    click.echo(f'{len(usuarios)} usuário(s) reparado(s).')
+
+################################################################
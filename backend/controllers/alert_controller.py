@@ -4,6 +4,7 @@
 from flask import jsonify, request
 from services.alert_service import AlertService
 from database_instance import database_config
+from utils.paginacao import parse_paginacao
 
 #################################################################
 # Defined
@@ -96,12 +97,18 @@ class AlertController:
 
         return jsonify(response), 200
     
-    def all_alerts(self) -> jsonify:
-        """ Método para buscar todos os alertas """
-        
-        # Chama o método para buscar todos os alertas
-        response = alert_service.all_alerts()
-        print(response)
+    def all_alerts(self, args: dict) -> jsonify:
+        """ Método para buscar os próximos alertas, paginados """
+
+        # Lê os parâmetros de período e paginação da query string
+        try:
+            paginacao = parse_paginacao(args)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        # Chama o método para buscar os alertas
+        response = alert_service.all_alerts(**paginacao)
+
         # Retorna a resposta
         if 'error' in response:
             return jsonify({'message': response['error']}), 400
@@ -0,0 +1,17 @@
+################################################################
+# Imports
+
+from flask import jsonify                                # Respostas HTTP
+from utils.cache import cache_tokens, cache_usuario      # Cache de leitura por usuário e de tokens verificados
+
+################################################################
+# Main
+
+class CacheController:
+
+    def get_estatisticas(self) -> jsonify:
+        """ Método para buscar os contadores de acertos e falhas do cache e do cache de tokens """
+
+        return jsonify({'status': True, **cache_usuario.estatisticas(), 'tokens': cache_tokens.estatisticas()}), 200
+
+################################################################
@@ -152,6 +152,17 @@ class CategoriaController:
 
         return jsonify(response), 200
 
+    ################################################################
+    def get_orcamentos_status_by_usuario(self, usuario_id: str) -> jsonify:
+        """ Método para buscar o status do orçamento mensal de todas as categorias de despesa de um usuário """
+
+        response = categoria_service.get_orcamentos_status_by_usuario(usuario_id=usuario_id)
+
+        if 'error' in response:
+            return jsonify({'message': response['error']}), 400
+
+        return jsonify(response), 200
+
     ################################################################
     def total_by_categoria(self, categoria_id: str) -> jsonify:
         """ Método para buscar o total de categorias por usuário """
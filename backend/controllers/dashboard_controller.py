@@ -0,0 +1,31 @@
+################################################################
+# Imports
+
+from flask import jsonify                                # Respostas HTTP
+from services.dashboard_service import DashboardService  # Serviço do painel da tela inicial
+from database_instance import database_config            # Instância do banco de dados
+
+################################################################
+# Defined
+
+db_conn = database_config.get_db()
+dashboard_service = DashboardService(db_conn=db_conn)
+
+################################################################
+# Main
+
+class DashboardController:
+
+    def get_dashboard(self, usuario_id: str) -> jsonify:
+        """ Método para buscar o painel da tela inicial de um usuário """
+
+        # Chama o método para montar o painel
+        response = dashboard_service.get_dashboard(usuario_id=usuario_id)
+
+        # Retorna a resposta
+        if 'error' in response:
+            return jsonify({'message': response['error']}), 400
+
+        return jsonify(response), 200
+
+################################################################
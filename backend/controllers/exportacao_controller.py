@@ -0,0 +1,45 @@
+################################################################
+# Imports
+
+from flask import Response, jsonify, stream_with_context  # Resposta em streaming
+from services.exportacao_service import ExportacaoService, FORMATOS  # Serviço de exportação
+from database_instance import database_config            # Instância do banco de dados
+from utils.paginacao import parse_data                   # Conversão das datas do período
+
+################################################################
+# Defined
+
+db_conn = database_config.get_db()
+exportacao_service = ExportacaoService(db_conn=db_conn)
+
+################################################################
+# Main
+
+class ExportacaoController:
+
+    def exportar(self, usuario_id: str, args: dict) -> Response:
+        """ Método para exportar o extrato completo de um usuário em CSV ou NDJSON """
+
+        # Valida o formato e o período antes de começar a enviar a resposta
+        formato = (args.get('formato') or 'csv').lower()
+        if formato not in FORMATOS:
+            return jsonify({'message': 'Formato não suportado. Use csv ou ndjson.'}), 400
+
+        try:
+            data_inicio = parse_data(args.get('from'))
+            data_fim = parse_data(args.get('to'))
+        except ValueError:
+            return jsonify({'message': 'As datas devem estar no formato AAAA-MM-DD.'}), 400
+
+        # Sem Content-Length a resposta é enviada em partes (chunked) conforme o cursor avança
+        blocos = exportacao_service.exportar(usuario_id, formato, data_inicio, data_fim)
+        return Response(
+            stream_with_context(blocos),
+            mimetype=FORMATOS[formato],
+            headers={
+                'Content-Disposition': f'attachment; filename=extrato_{usuario_id}.{formato}',
+                'X-Accel-Buffering': 'no'
+            }
+        )
+
+################################################################
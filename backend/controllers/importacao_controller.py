@@ -0,0 +1,45 @@
+################################################################
+# Imports
+
+from flask import jsonify                                # Registrar as rotas e métodos HTTP
+from services.importacao_service import ImportacaoService  # Serviço de importação
+from database_instance import database_config            # Instância do banco de dados
+from utils.importacao import detectar_formato            # Formato do arquivo enviado
+
+################################################################
+# Defined
+
+db_conn = database_config.get_db()
+importacao_service = ImportacaoService(db_conn=db_conn)
+
+################################################################
+# Main
+
+class ImportacaoController:
+
+    def importar(self, usuario_id: str, arquivo, nome_arquivo: str, args: dict) -> jsonify:
+        """ Método para importar despesas e receitas de um arquivo CSV ou OFX """
+
+        # Valida o formato informado ou deduzido pela extensão
+        try:
+            formato = detectar_formato(nome_arquivo, args.get('formato'))
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        # Chama o método para importar as transações
+        response = importacao_service.importar(
+            usuario_id=usuario_id,
+            arquivo=arquivo,
+            formato=formato,
+            encoding=args.get('encoding'),
+            categoria_despesa=args.get('categoria_despesa'),
+            categoria_receita=args.get('categoria_receita')
+        )
+
+        # Retorna a resposta
+        if 'error' in response:
+            return jsonify({'message': response['error']}), 400
+
+        return jsonify(response), 201
+
+################################################################
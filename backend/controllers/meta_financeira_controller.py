@@ -98,17 +98,9 @@ class MetaFinanceiraController:
     def get_metas_by_usuario(self, usuario_id: str) -> jsonify:
         """ Método para buscar metas financeiras de um usuário """
 
-        # Chama o método para buscar as metas
+        # Chama o método para buscar as metas, já com o valor atual recalculado em lote
         response = meta_financeira_service.get_metas_by_usuario(usuario_id=usuario_id)
 
-        # Atualiza o valor atual de cada meta
-        if 'metas' in response:
-            for meta in response['metas']:
-                atualizacao = meta_financeira_service.atualizar_valor_atual(meta['id'])
-                if 'valor_atual' in atualizacao:
-                    meta['valor_atual'] = atualizacao['valor_atual']
-                    meta['meta_batida'] = atualizacao['meta_batida']
-
         # Retorna a resposta
         if 'error' in response:
             return jsonify({'message': response['error']}), 400
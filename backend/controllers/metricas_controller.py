@@ -0,0 +1,62 @@
+################################################################
+# Imports
+
+from flask import Response, jsonify                                  # Respostas HTTP
+from utils.cache import cache_tokens, cache_usuario                  # Contadores dos caches
+from utils.metricas import exportar_processos, formatar_valor, metricas  # Métricas de requisições e SQL
+from utils.senhas import pool_senhas                                 # Contadores do pool de senhas
+
+################################################################
+# Helper Functions
+
+def contadores() -> dict:
+    """ Contadores do processo que vão para as métricas (somados entre os workers com METRICAS_DIRETORIO) """
+
+    return {
+        'cache_acertos': cache_usuario.acertos,
+        'cache_falhas': cache_usuario.falhas,
+        'tokens_acertos': cache_tokens.acertos,
+        'tokens_falhas': cache_tokens.falhas,
+        'senhas_recusadas': pool_senhas.recusados,
+    }
+
+################################################################
+def taxa(acertos: int, falhas: int) -> float:
+    """ Fração de acertos, calculada a partir dos contadores já somados """
+    return acertos / (acertos + falhas) if acertos + falhas else 0.0
+
+################################################################
+# Defined
+
+metricas.coletores.append(contadores)
+
+################################################################
+# Main
+
+class MetricasController:
+
+    def get_metricas(self) -> Response:
+        """ Método para exportar as métricas no formato do Prometheus (somadas entre os workers ou por pid) """
+
+        texto, valores, rotulos = exportar_processos()
+        texto += ''.join([
+            formatar_valor('poupabem_cache_acertos_total', valores['cache_acertos'], 'Leituras atendidas pelo cache por usuário.', 'counter', rotulos),
+            formatar_valor('poupabem_cache_falhas_total', valores['cache_falhas'], 'Leituras que foram ao banco.', 'counter', rotulos),
+            formatar_valor('poupabem_cache_taxa_acerto', taxa(valores['cache_acertos'], valores['cache_falhas']),
+                           'Fração das leituras atendidas pelo cache.', rotulos=rotulos),
+            formatar_valor('poupabem_tokens_acertos_total', valores['tokens_acertos'], 'Tokens JWT atendidos pelo cache de verificação.', 'counter', rotulos),
+            formatar_valor('poupabem_tokens_falhas_total', valores['tokens_falhas'], 'Tokens JWT verificados por completo.', 'counter', rotulos),
+            formatar_valor('poupabem_tokens_taxa_acerto', taxa(valores['tokens_acertos'], valores['tokens_falhas']),
+                           'Fração dos tokens atendidos pelo cache.', rotulos=rotulos),
+            formatar_valor('poupabem_senhas_recusadas_total', valores['senhas_recusadas'], 'Pedidos de bcrypt recusados com 503.', 'counter', rotulos),
+        ])
+
+        return Response(texto, mimetype='text/plain; version=0.0.4')
+
+    ################################################################
+    def get_perfis(self) -> jsonify:
+        """ Método para buscar os últimos perfis (cProfile) das requisições amostradas (deste processo) """
+
+        return jsonify({'status': True, 'perfis': list(metricas.perfis)}), 200
+
+################################################################
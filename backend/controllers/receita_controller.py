@@ -4,6 +4,7 @@
 from flask import request, jsonify                       # Registrar as rotas e métodos HTTP
 from services.receita_service import ReceitaService      # Serviço de receita
 from database_instance import database_config            # Instância do banco de dados
+from utils.paginacao import parse_paginacao              # Parâmetros de paginação
 
 ################################################################
 # Defined
@@ -46,11 +47,17 @@ class ReceitaController:
         return jsonify(response), 201
 
     ################################################################
-    def get_receitas_by_usuario(self, usuario_id: str) -> jsonify:
+    def get_receitas_by_usuario(self, usuario_id: str, args: dict) -> jsonify:
         """ Método para buscar receitas de um usuário """
 
+        # Valida os parâmetros de período e paginação
+        try:
+            paginacao = parse_paginacao(args)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
         # Chama o método para buscar as receitas
-        response = receita_service.get_receitas_by_usuario(usuario_id=usuario_id)
+        response = receita_service.get_receitas_by_usuario(usuario_id=usuario_id, **paginacao)
 
         # Retorna a resposta
         if 'error' in response:
@@ -0,0 +1,48 @@
+################################################################
+# Imports
+
+from flask import jsonify                                # Registrar as rotas e métodos HTTP
+from services.relatorio_service import RelatorioService  # Serviço de relatórios
+from database_instance import database_config            # Instância do banco de dados
+from utils.paginacao import parse_data                   # Conversão das datas do período
+from utils.datas import intervalo_mes                    # Intervalo padrão (mês atual)
+from datetime import timedelta
+
+################################################################
+# Defined
+
+db_conn = database_config.get_db()
+relatorio_service = RelatorioService(db_conn=db_conn)
+
+################################################################
+# Main
+
+class RelatorioController:
+
+    def get_graficos(self, usuario_id: str, args: dict) -> jsonify:
+        """ Método para buscar os dados agregados dos gráficos de um usuário """
+
+        # Coleta o período; sem parâmetros usa o mês atual
+        try:
+            data_inicio = parse_data(args.get('from'))
+            data_fim = parse_data(args.get('to'))
+        except ValueError:
+            return jsonify({'message': 'As datas devem estar no formato AAAA-MM-DD.'}), 400
+
+        inicio_mes, fim_mes = intervalo_mes()
+        data_inicio = data_inicio or inicio_mes
+        data_fim = data_fim or (fim_mes - timedelta(days=1))
+
+        if data_inicio > data_fim:
+            return jsonify({'message': 'A data inicial deve ser anterior à data final.'}), 400
+
+        # Chama o método para agregar os dados
+        response = relatorio_service.get_graficos(usuario_id=usuario_id, data_inicio=data_inicio, data_fim=data_fim)
+
+        # Retorna a resposta
+        if 'error' in response:
+            return jsonify({'message': response['error']}), 400
+
+        return jsonify(response), 200
+
+################################################################
@@ -4,7 +4,12 @@
 from flask import request, jsonify                # Registrar as rotas e métodos HTTP
 from services.user_service import UserService     # Serviço de usuário
 from database_instance import database_config     # Instância do banco de dados
-import bcrypt                                     # Biblioteca para criptografia de senhas
+from utils.senhas import SenhaSobrecarga, pool_senhas  # Pool limitado para o bcrypt
+
+################################################################
+# Constants
+
+ESPERA_SOBRECARGA = 1         # Segundos sugeridos ao cliente (Retry-After) quando o pool de senhas está cheio
 
 ################################################################
 # Defined
@@ -12,6 +17,13 @@ import bcrypt                                     # Biblioteca para criptografia
 db_conn = database_config.get_db()
 user_service = UserService(db_conn=db_conn)
 
+################################################################
+# Helper Functions
+
+def resposta_sobrecarga(erro: SenhaSobrecarga) -> tuple:
+    """ Resposta 503 para pedidos recusados pelo pool de senhas """
+    return jsonify({'message': str(erro)}), 503, {'Retry-After': str(ESPERA_SOBRECARGA)}
+
 ################################################################
 # Main
 
@@ -23,14 +35,13 @@ class UserController:
         # Coleta os dados enviados pelo o usuário
         email, password = data['email'], data['password']
 
-        # Verifica se o e-mail existe
-        if user_service.find_by_email(email)["status"] == False:
-            return jsonify({'message': 'O e-mail ou a senha estão incorretos!'}), 400
-
-        # Chama o método onde verifica se a senha está correta e retorna o token
-        response = user_service.login(email=email, password=password)
+        # Chama o método que busca o usuário pelo e-mail, verifica a senha e retorna o token
+        try:
+            response = user_service.login(email=email, password=password)
+        except SenhaSobrecarga as e:
+            return resposta_sobrecarga(e)
 
-        # Caso a senha estiver incorreta
+        # Caso o e-mail não exista ou a senha estiver incorreta
         if response["status"] == False:
             return jsonify({'message': 'O e-mail ou a senha estão incorretos!'}), 400
         
@@ -48,8 +59,11 @@ class UserController:
         if exists_email["status"] == True:
             return jsonify({'message': 'Este e-mail já está em uso!'}), 400
         
-        # Criptografa a senha
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        # Criptografa a senha no pool de senhas
+        try:
+            password_hash = pool_senhas.gerar_hash(password)
+        except SenhaSobrecarga as e:
+            return resposta_sobrecarga(e)
 
         # Chama o método onde registra o usuário
         response = user_service.register(name=name, email=email, password=password_hash)
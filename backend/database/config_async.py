@@ -0,0 +1,238 @@
+################################################################
+# Imports
+
+import asyncio                                     # Laço de eventos das consultas assíncronas
+import atexit                                      # Encerra o engine ao sair do processo
+import importlib.util                              # Verifica se o driver assíncrono está instalado
+import os                                          # Configuração por variáveis de ambiente
+import threading                                   # Thread do laço de eventos
+from concurrent.futures import Future, ThreadPoolExecutor  # Resultado das consultas e pool de threads sem driver assíncrono
+from sqlalchemy import create_engine               # Engine síncrono próprio das leituras em threads
+from database.config_database import DATABASE_REPLICA_URL, DATABASE_URL, STATEMENT_TIMEOUT, db, opcoes_engine, primario_fixado
+
+################################################################
+# Constants
+
+DATABASE_ASYNC_URL = os.environ.get('DATABASE_ASYNC_URL')                 # Opcional; derivada de DATABASE_URL
+ASYNC_ATIVO = os.environ.get('DB_ASYNC', '1') == '1'                      # 0 força o modo síncrono
+ESPERA_ASYNC = float(os.environ.get('DB_ASYNC_ESPERA', 30))               # Segundos aguardando as consultas
+THREADS_LEITURA = int(os.environ.get('DB_THREADS_LEITURA', 4))            # Threads e conexões das leituras em paralelo
+
+# Driver assíncrono de cada banco e o módulo que precisa estar instalado
+DRIVERS_ASYNC = {
+    'postgresql': ('postgresql+asyncpg', 'asyncpg'),
+    'sqlite': ('sqlite+aiosqlite', 'aiosqlite'),
+}
+
+################################################################
+# Helper Functions
+
+def url_async(url: str) -> str:
+    """ Troca o driver da URL síncrona (ex.: postgresql+psycopg2://) pelo driver assíncrono do PostgreSQL
+
+    Somente o PostgreSQL é derivado automaticamente: no SQLite local não há ida e volta pela rede para sobrepor e as
+    leituras em sequência são mais rápidas (o aiosqlite fica disponível por DATABASE_ASYNC_URL).
+    """
+
+    esquema, resto = url.split('://', 1)
+    if esquema.split('+', 1)[0] != 'postgresql':
+        return None
+    return f'{DRIVERS_ASYNC["postgresql"][0]}://{resto}'
+
+################################################################
+def driver_instalado(url: str) -> bool:
+    """ Verifica se o driver assíncrono da URL e o greenlet (exigido pelo SQLAlchemy asyncio) estão instalados """
+
+    banco = url.split('://', 1)[0].split('+', 1)[0]
+    modulos = (DRIVERS_ASYNC[banco][1], 'greenlet') if banco in DRIVERS_ASYNC else ()
+    return bool(modulos) and all(importlib.util.find_spec(modulo) is not None for modulo in modulos)
+
+################################################################
+def juntar(futuros: list) -> Future:
+    """ Futuro com os resultados de `futuros` na mesma ordem, resolvido quando todos terminam (ou com o primeiro erro) """
+
+    junto = Future()
+    pendentes = [len(futuros)]
+    lock = threading.Lock()
+
+    def concluido(_) -> None:
+        with lock:
+            pendentes[0] -= 1
+            if pendentes[0]:
+                return
+
+        erros = [futuro.exception() for futuro in futuros if futuro.exception() is not None]
+        if erros:
+            junto.set_exception(erros[0])
+        else:
+            junto.set_result([futuro.result() for futuro in futuros])
+
+    if not futuros:
+        junto.set_result([])
+    for futuro in futuros:
+        futuro.add_done_callback(concluido)
+    return junto
+
+################################################################
+def opcoes_engine_leitura(url: str) -> dict:
+    """ Opções do engine síncrono com o pool limitado a THREADS_LEITURA conexões, sem overflow
+
+    Os engines das leituras em paralelo somam-se ao pool principal de cada processo: um segundo pool completo
+    (DB_POOL_SIZE + DB_MAX_OVERFLOW) dobraria as conexões por worker.
+    """
+
+    opcoes = opcoes_engine(url)
+    if 'pool_size' in opcoes:
+        opcoes.update(pool_size=THREADS_LEITURA, max_overflow=0)
+    return opcoes
+
+################################################################
+def opcoes_engine_async(url: str) -> dict:
+    """ Mesmo pool limitado das leituras em paralelo; o statement_timeout do asyncpg vai em server_settings """
+
+    opcoes = opcoes_engine_leitura(url)
+    if 'connect_args' in opcoes:
+        opcoes['connect_args'] = {'server_settings': {'statement_timeout': str(STATEMENT_TIMEOUT)}}
+    return opcoes
+
+################################################################
+# Main
+
+class BancoAssincrono:
+    """ Engine assíncrono (asyncpg ou aiosqlite) em um laço de eventos próprio do processo
+
+    Permite que views síncronas (workers gthread do gunicorn) disparem várias consultas de leitura em paralelo, cada uma em
+    uma conexão do pool, esperando apenas pela mais lenta. Sem o driver assíncrono (asyncpg e greenlet), as consultas
+    rodam em paralelo em um pool de THREADS_LEITURA threads sobre um engine síncrono próprio; no SQLite, ou com
+    DB_ASYNC=0, rodam em sequência na sessão síncrona, com o mesmo resultado.
+    """
+
+    def __init__(self, url: str, url_sincrona: str):
+        self.url = url
+        self.url_sincrona = url_sincrona
+        self.engine = None
+        self.laco = None
+        self.engine_sincrono = None
+        self.threads = None
+        self.lock = threading.Lock()
+
+    ################################################################
+    def disponivel(self) -> bool:
+        """ Modo assíncrono ligado, com URL suportada e driver instalado """
+        return ASYNC_ATIVO and self.url is not None and driver_instalado(self.url)
+
+    ################################################################
+    def paralelo(self) -> bool:
+        """ Leituras em paralelo no pool de threads: fora do SQLite, em que a sequência na sessão é mais rápida """
+        return ASYNC_ATIVO and not self.url_sincrona.startswith('sqlite')
+
+    ################################################################
+    def fixado_primario(self) -> bool:
+        """ Requisição fixada no banco principal (ex.: preenchendo o cache) com réplica configurada: os engines próprios
+        leem da réplica, então as consultas vão em sequência pela sessão, que usa o principal
+        """
+        return DATABASE_REPLICA_URL is not None and primario_fixado()
+
+    ################################################################
+    def iniciar(self) -> None:
+        """ Cria o laço de eventos (em uma thread daemon) e o engine na primeira utilização """
+
+        with self.lock:
+            if self.laco is not None:
+                return
+
+            from sqlalchemy.ext.asyncio import create_async_engine  # Exige greenlet
+
+            laco = asyncio.new_event_loop()
+            threading.Thread(target=laco.run_forever, name='banco-assincrono', daemon=True).start()
+            self.engine = create_async_engine(self.url, **opcoes_engine_async(self.url))
+            self.laco = laco
+
+    ################################################################
+    def iniciar_threads(self) -> None:
+        """ Cria o pool de threads e o engine síncrono (com o seu próprio pool de conexões) na primeira utilização
+
+        Um engine separado evita que as threads disputem as conexões das requisições e esperem por elas; o pool dele
+        tem uma conexão por thread.
+        """
+
+        with self.lock:
+            if self.threads is not None:
+                return
+
+            self.engine_sincrono = create_engine(self.url_sincrona, **opcoes_engine_leitura(self.url_sincrona))
+            self.threads = ThreadPoolExecutor(THREADS_LEITURA, thread_name_prefix='banco-leitura')
+
+    ################################################################
+    def ler_sincrono(self, consulta) -> list:
+        """ Executa uma consulta de leitura em uma conexão própria do engine síncrono """
+
+        with self.engine_sincrono.connect() as conexao:
+            return conexao.execute(consulta).all()
+
+    ################################################################
+    async def ler(self, consulta) -> list:
+        """ Executa uma consulta de leitura em uma conexão própria do pool """
+
+        async with self.engine.connect() as conexao:
+            resultado = await conexao.execute(consulta)
+            return resultado.all()
+
+    ################################################################
+    async def ler_varias(self, consultas) -> list:
+        """ Executa as consultas ao mesmo tempo e retorna as linhas de cada uma, na mesma ordem """
+        return list(await asyncio.gather(*(self.ler(consulta) for consulta in consultas)))
+
+    ################################################################
+    def enviar(self, *consultas) -> Future:
+        """ Dispara as consultas de leitura em paralelo sem esperar; o resultado (uma lista de linhas por consulta) vem do futuro
+
+        Permite executar outro trabalho na thread da requisição (ex.: uma escrita na sessão) enquanto as leituras rodam.
+        """
+
+        if self.disponivel() and not self.fixado_primario():
+            self.iniciar()
+            return asyncio.run_coroutine_threadsafe(self.ler_varias(consultas), self.laco)
+
+        if self.paralelo() and len(consultas) > 1 and not self.fixado_primario():
+            self.iniciar_threads()
+            return juntar([self.threads.submit(self.ler_sincrono, consulta) for consulta in consultas])
+
+        # Modo síncrono: a sessão escolhe o banco (réplica nas rotas GET) e o futuro já nasce resolvido
+        futuro = Future()
+        futuro.set_result([db.session.execute(consulta).all() for consulta in consultas])
+        return futuro
+
+    ################################################################
+    def consultar(self, *consultas) -> list:
+        """ Executa as consultas de leitura em paralelo a partir de código síncrono; retorna uma lista de linhas por consulta """
+        return self.enviar(*consultas).result(timeout=ESPERA_ASYNC)
+
+
+    ################################################################
+    def fechar(self) -> None:
+        """ Fecha as conexões dos pools, o pool de threads e para o laço de eventos """
+
+        with self.lock:
+            if self.threads is not None:
+                self.threads.shutdown(wait=True)
+                self.engine_sincrono.dispose()
+                self.threads, self.engine_sincrono = None, None
+
+            if self.laco is None:
+                return
+            asyncio.run_coroutine_threadsafe(self.engine.dispose(), self.laco).result(timeout=ESPERA_ASYNC)
+            self.laco.call_soon_threadsafe(self.laco.stop)
+            self.laco, self.engine = None, None
+
+################################################################
+# Defined
+
+# Somente leituras passam por aqui: com réplica configurada, as consultas vão para ela
+banco_assincrono = BancoAssincrono(
+    DATABASE_ASYNC_URL or url_async(DATABASE_REPLICA_URL or DATABASE_URL),
+    DATABASE_REPLICA_URL or DATABASE_URL
+)
+atexit.register(banco_assincrono.fechar)
+
+################################################################
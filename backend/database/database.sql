@@ -15,7 +15,9 @@ CREATE TABLE "alert"(
     "titulo" VARCHAR(255) NOT NULL,
     "descricao" TEXT NOT NULL,
     "data_alerta" TIMESTAMP(0) WITHOUT TIME ZONE NOT NULL,
-    "criado_em" TIMESTAMP(0) WITHOUT TIME ZONE NOT NULL
+    "criado_em" TIMESTAMP(0) WITHOUT TIME ZONE NOT NULL,
+    "disparado_em" TIMESTAMP(0) WITHOUT TIME ZONE NULL,
+    "entregue_em" TIMESTAMP(0) WITHOUT TIME ZONE NULL
 );
 ALTER TABLE
     "alert" ADD PRIMARY KEY("id");
@@ -28,6 +30,8 @@ CREATE TABLE "categoria"(
             "tipo" IN ('receita', 'despesa')
         ),
     "limite_gasto" DECIMAL(10, 2),
+    "total" DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    "convertendo_para" VARCHAR(255),
     "criado_em" TIMESTAMP(0) WITHOUT TIME ZONE NOT NULL
 );
 ALTER TABLE
@@ -94,4 +98,30 @@ ALTER TABLE
 ALTER TABLE
     "categoria" ADD CONSTRAINT "categoria_usuario_id_foreign" FOREIGN KEY("usuario_id") REFERENCES "users"("id");
 ALTER TABLE
-    "alert" ADD CONSTRAINT "alert_usuario_id_foreign" FOREIGN KEY("usuario_id") REFERENCES "users"("id");
\ No newline at end of file
+    "alert" ADD CONSTRAINT "alert_usuario_id_foreign" FOREIGN KEY("usuario_id") REFERENCES "users"("id");
+
+CREATE INDEX "ix_despesa_usuario_data" ON "despesa" ("usuario_id", "data") INCLUDE ("valor");
+CREATE INDEX "ix_despesa_categoria_data" ON "despesa" ("categoria_id", "data") INCLUDE ("valor");
+CREATE INDEX "ix_receita_usuario_data" ON "receita" ("usuario_id", "data") INCLUDE ("valor");
+CREATE INDEX "ix_receita_categoria_data" ON "receita" ("categoria_id", "data") INCLUDE ("valor");
+CREATE INDEX "ix_alert_usuario_data" ON "alert" ("usuario_id", "data_alerta");
+CREATE INDEX "ix_alert_data" ON "alert" ("data_alerta", "id");
+CREATE INDEX "ix_alert_pendente" ON "alert" ("usuario_id") WHERE "disparado_em" IS NOT NULL AND "entregue_em" IS NULL;
+CREATE INDEX "ix_alert_nao_disparado" ON "alert" ("data_alerta") WHERE "disparado_em" IS NULL;
+
+CREATE TABLE "resumo_mensal"(
+    "usuario_id" INTEGER NOT NULL,
+    "categoria_id" INTEGER NOT NULL,
+    "tipo" VARCHAR(255) NOT NULL,
+    "ano" INTEGER NOT NULL,
+    "mes" INTEGER NOT NULL,
+    "total" DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    "quantidade" INTEGER NOT NULL DEFAULT 0
+);
+ALTER TABLE
+    "resumo_mensal" ADD PRIMARY KEY("usuario_id", "categoria_id", "tipo", "ano", "mes");
+ALTER TABLE
+    "resumo_mensal" ADD CONSTRAINT "resumo_mensal_usuario_id_foreign" FOREIGN KEY("usuario_id") REFERENCES "users"("id");
+ALTER TABLE
+    "resumo_mensal" ADD CONSTRAINT "resumo_mensal_categoria_id_foreign" FOREIGN KEY("categoria_id") REFERENCES "categoria"("id");
+CREATE INDEX "ix_resumo_mensal_categoria" ON "resumo_mensal" ("categoria_id", "ano", "mes");
\ No newline at end of file
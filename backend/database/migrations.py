@@ -0,0 +1,195 @@
+################################################################
+# Imports
+
+import click                                          # Comandos de linha de comando do Flask
+from datetime import datetime                         # Data de aplicação das migrações
+from flask.cli import with_appcontext                 # Executa o comando com o contexto da aplicação
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect
+from sqlalchemy.schema import CreateColumn          # Definição completa da coluna (tipo, DEFAULT e NOT NULL)
+from database.config_database import db               # Instância do banco de dados
+from models.user_model import User
+from models.categoria_model import Categoria
+from models.despesa_model import Despesa
+from models.receita_model import Receita
+from models.meta_financeira_model import MetaFinanceira
+from models.alert_model import Alert
+from models.resumo_mensal_model import ResumoMensal
+from services.resumo_mensal_service import sql_reconstrucao, sql_total_categoria
+
+################################################################
+# Defined
+
+# Tabela de controle fica fora do metadata dos modelos para não ser afetada por create_all/drop_all
+metadata_migracoes = MetaData()
+
+schema_migracoes = Table(
+    'schema_migracoes',
+    metadata_migracoes,
+    Column('versao', Integer, primary_key=True),
+    Column('descricao', String(255), nullable=False),
+    Column('aplicada_em', DateTime, nullable=False),
+)
+
+# Lista ordenada de (versão, descrição, função) registrada pelo decorator `migracao`
+MIGRACOES = []
+
+################################################################
+# Helper Functions
+
+def migracao(versao: int, descricao: str):
+    """ Registra uma função de migração; cada função deve ser idempotente """
+
+    def decorator(funcao):
+        MIGRACOES.append((versao, descricao, funcao))
+        MIGRACOES.sort(key=lambda item: item[0])
+        return funcao
+    return decorator
+
+################################################################
+def criar_indices(conexao, *indices) -> None:
+    """ Cria os índices informados caso ainda não existam """
+
+    for indice in indices:
+        indice.create(bind=conexao, checkfirst=True)
+
+################################################################
+def indices(tabela, *nomes) -> list:
+    """ Índices da tabela com os nomes informados (migrações antigas não devem criar índices adicionados depois) """
+    return [indice for indice in tabela.indexes if indice.name in nomes]
+
+################################################################
+def adicionar_colunas(conexao, tabela, *nomes) -> None:
+    """ Adiciona à tabela as colunas do modelo informadas que ainda não existirem
+
+    A coluna é criada como no modelo, com o server_default e o NOT NULL: uma coluna obrigatória precisa de server_default
+    para preencher as linhas existentes.
+    """
+
+    existentes = {coluna['name'] for coluna in inspect(conexao).get_columns(tabela.name)}
+    for nome in nomes:
+        if nome in existentes:
+            continue
+
+        definicao = CreateColumn(tabela.c[nome]).compile(dialect=conexao.dialect)
+        conexao.exec_driver_sql(f'ALTER TABLE {tabela.name} ADD COLUMN {definicao}')
+
+################################################################
+def aplicar_migracoes(db_conn=db) -> list:
+    """ Aplica, em ordem, as migrações ainda não registradas e retorna as versões aplicadas """
+
+    aplicadas = []
+
+    with db_conn.engine.begin() as conexao:
+        metadata_migracoes.create_all(bind=conexao, checkfirst=True)
+        versoes = {linha.versao for linha in conexao.execute(schema_migracoes.select())}
+
+    for versao, descricao, funcao in MIGRACOES:
+        if versao in versoes:
+            continue
+
+        # Cada migração roda em sua própria transação junto com o seu registro
+        with db_conn.engine.begin() as conexao:
+            funcao(conexao)
+            conexao.execute(schema_migracoes.insert().values(
+                versao=versao,
+                descricao=descricao,
+                aplicada_em=datetime.utcnow()
+            ))
+        aplicadas.append(versao)
+
+    return aplicadas
+
+################################################################
+# Migrations
+
+@migracao(1, 'Esquema inicial')
+def esquema_inicial(conexao) -> None:
+    """ Cria as tabelas principais que ainda não existirem """
+
+    tabelas = [User.__table__, Categoria.__table__, Despesa.__table__, Receita.__table__, MetaFinanceira.__table__, Alert.__table__]
+    db.metadata.create_all(bind=conexao, tables=tabelas, checkfirst=True)
+
+################################################################
+@migracao(2, 'Índices compostos de despesa e receita por usuário/categoria e data')
+def indices_despesa_receita(conexao) -> None:
+    """ Cria os índices (usuario_id, data) e (categoria_id, data) de despesa e receita """
+
+    criar_indices(conexao, *Despesa.__table__.indexes, *Receita.__table__.indexes)
+
+################################################################
+@migracao(3, 'Resumo mensal por usuário, categoria e mês')
+def resumo_mensal(conexao) -> None:
+    """ Cria a tabela resumo_mensal e a popula a partir das transações existentes """
+
+    db.metadata.create_all(bind=conexao, tables=[ResumoMensal.__table__], checkfirst=True)
+
+    for comando in sql_reconstrucao():
+        conexao.execute(comando)
+
+################################################################
+@migracao(4, 'Índices de alerta por usuário e data do alerta')
+def indices_alerta(conexao) -> None:
+    """ Cria os índices (usuario_id, data_alerta) e (data_alerta, id) de alerta """
+
+    criar_indices(conexao, *indices(Alert.__table__, 'ix_alert_usuario_data', 'ix_alert_data'))
+
+################################################################
+@migracao(5, 'Alertas disparados pelo agendador e marcação de entrega')
+def alertas_disparados(conexao) -> None:
+    """ Adiciona disparado_em e entregue_em ao alerta e o índice parcial dos alertas pendentes de entrega """
+
+    adicionar_colunas(conexao, Alert.__table__, 'disparado_em', 'entregue_em')
+    criar_indices(conexao, *indices(Alert.__table__, 'ix_alert_pendente'))
+
+################################################################
+@migracao(6, 'Total acumulado por categoria')
+def total_categoria(conexao) -> None:
+    """ Adiciona o total à categoria e o calcula a partir do resumo mensal """
+
+    adicionar_colunas(conexao, Categoria.__table__, 'total')
+    conexao.execute(sql_total_categoria())
+
+################################################################
+@migracao(7, 'Estado da conversão de tipo de categoria em lotes')
+def conversao_categoria(conexao) -> None:
+    """ Adiciona convertendo_para à categoria """
+
+    adicionar_colunas(conexao, Categoria.__table__, 'convertendo_para')
+
+################################################################
+@migracao(8, 'Índice parcial dos alertas ainda não disparados')
+def indice_alertas_nao_disparados(conexao) -> None:
+    """ Cria o índice (data_alerta) WHERE disparado_em IS NULL usado pelo disparo com recuperação de dias perdidos """
+
+    criar_indices(conexao, *indices(Alert.__table__, 'ix_alert_nao_disparado'))
+
+################################################################
+@migracao(9, 'Total da categoria com padrão 0 e NOT NULL')
+def total_categoria_obrigatorio(conexao) -> None:
+    """ Bancos que aplicaram a versão 6 com a coluna anulável: recalcula os totais e adiciona DEFAULT 0 e NOT NULL
+
+    O SQLite não altera colunas existentes; nele a coluna continua anulável, mas sem nulos depois do recálculo.
+    """
+
+    conexao.execute(sql_total_categoria())
+    if conexao.dialect.name == 'postgresql':
+        conexao.exec_driver_sql('ALTER TABLE categoria ALTER COLUMN total SET DEFAULT 0, ALTER COLUMN total SET NOT NULL')
+
+################################################################
+# Commands
+
+@click.command('migrar')
+@with_appcontext
+def migrar_command() -> None:
+    """ Aplica as migrações pendentes do banco de dados """
+
+    aplicadas = aplicar_migracoes()
+
+    if not aplicadas:
+        click.echo('Nenhuma migração pendente.')
+        return
+
+    for versao in aplicadas:
+        click.echo(f'Migração {versao} aplicada.')
+
+################################################################
@@ -3,9 +3,13 @@
 
 from database.config_database import DatabaseConnect
 from flask import Flask
+from utils.serializacao import JSONRapido
+from utils.metricas import instalar as instalar_metricas
 
 ################################################################
 # Defined
 
 app = Flask(__name__)
-database_config = DatabaseConnect(app)
\ No newline at end of file
+app.json = JSONRapido(app)  # Codificação JSON rápida (orjson) nas respostas
+database_config = DatabaseConnect(app)
+instalar_metricas(app)  # Latência por rota, SQL por requisição e sinais de N+1 (GET /metrics)
\ No newline at end of file
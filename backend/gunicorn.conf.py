@@ -0,0 +1,32 @@
+################################################################
+# Imports
+
+import multiprocessing  # Número de CPUs da máquina
+import os               # Configuração por variáveis de ambiente
+
+################################################################
+# Main
+
+# Endereço e processos; cada processo mantém o seu próprio pool de conexões (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# Threads por processo; mantenha DB_POOL_SIZE >= threads para que nenhuma requisição espere por conexão
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Recicla os processos periodicamente para limitar o crescimento de memória
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Cada processo cria a aplicação (e os pools) depois do fork
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
+
+################################################################
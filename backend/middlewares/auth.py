@@ -5,6 +5,7 @@ from flask import request, jsonify
 from functools import wraps
 import jwt  # Ensure you have the PyJWT library installed
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
+from utils.cache import cache_tokens  # Claims dos tokens já verificados
 
 ################################################################
 # Constants
@@ -14,10 +15,15 @@ SECRET_KEY = 'secret'  # Use uma variável de ambiente para armazenar a chave se
 ################################################################
 # Helper Functions
 
-def decode_token(token: str):
-    """ Decodifica e valida o token JWT """
+def verify_token(token: str):
+    """ Decodifica e valida a assinatura e a expiração do token JWT """
     return jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
 
+################################################################
+def decode_token(token: str):
+    """ Decodifica e valida o token JWT, reaproveitando a verificação de tokens já vistos """
+    return cache_tokens.decodificar(token, verify_token)
+
 ################################################################
 # Middlewares
 
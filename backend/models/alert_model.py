@@ -16,4 +16,23 @@ class Alert(db.Model):
     titulo = db.Column(db.String(255), nullable=False)
     descricao = db.Column(db.String(255), nullable=False)
     data_alerta = db.Column(db.DateTime, nullable=False)
-    criado_em = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
\ No newline at end of file
+    criado_em = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    disparado_em = db.Column(db.DateTime, nullable=True)   # Marcado pelo agendador no dia do alerta
+    entregue_em = db.Column(db.DateTime, nullable=True)    # Marcado quando o alerta disparado é retornado ao usuário
+
+    # Índices para as buscas por período: alertas do dia de um usuário e próximos alertas de todos os usuários
+    # O índice parcial contém apenas os alertas disparados e ainda não entregues
+    __table_args__ = (
+        db.Index('ix_alert_usuario_data', 'usuario_id', 'data_alerta'),
+        db.Index('ix_alert_data', 'data_alerta', 'id'),
+        db.Index(
+            'ix_alert_pendente', 'usuario_id',
+            postgresql_where=db.text('disparado_em IS NOT NULL AND entregue_em IS NULL'),
+            sqlite_where=db.text('disparado_em IS NOT NULL AND entregue_em IS NULL')
+        ),
+        db.Index(
+            'ix_alert_nao_disparado', 'data_alerta',
+            postgresql_where=db.text('disparado_em IS NULL'),
+            sqlite_where=db.text('disparado_em IS NULL')
+        ),
+    )
\ No newline at end of file
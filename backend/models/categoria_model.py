@@ -18,6 +18,8 @@ class Categoria(db.Model):
     tipo = db.Column(db.String(255), nullable=False)
     limite_gasto = db.Column(db.Numeric(10, 2), nullable=True)
     orcamento_mensal = db.Column(db.Numeric(10, 2), nullable=True)  # Novo campo
+    total = db.Column(db.Numeric(14, 2), nullable=False, default=0, server_default='0')  # Soma das transações, mantida junto com o resumo mensal
+    convertendo_para = db.Column(db.String(255), nullable=True)  # Tipo de destino de uma conversão em lotes em andamento
     criado_em = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
     __table_args__ = (
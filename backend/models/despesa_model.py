@@ -22,4 +22,10 @@ class Despesa(db.Model):
     imagem = db.Column(db.String(255), nullable=True)
     latitude = db.Column(db.Numeric(10, 8), nullable=True)
     longitude = db.Column(db.Numeric(11, 8), nullable=True)
-    criado_em = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
\ No newline at end of file
+    criado_em = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    # Índices compostos para os filtros por usuário/categoria e período (valor incluso para leitura apenas do índice)
+    __table_args__ = (
+        db.Index('ix_despesa_usuario_data', 'usuario_id', 'data', postgresql_include=['valor']),
+        db.Index('ix_despesa_categoria_data', 'categoria_id', 'data', postgresql_include=['valor']),
+    )
\ No newline at end of file
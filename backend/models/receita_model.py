@@ -19,4 +19,10 @@ class Receita(db.Model):
     valor = db.Column(db.Numeric(8, 2), nullable=False)
     data = db.Column(db.Date, nullable=False)
     descricao = db.Column(db.Text, nullable=False)
-    criado_em = db.Column(db.Date, nullable=False, default=date.today)
\ No newline at end of file
+    criado_em = db.Column(db.Date, nullable=False, default=date.today)
+
+    # Índices compostos para os filtros por usuário/categoria e período (valor incluso para leitura apenas do índice)
+    __table_args__ = (
+        db.Index('ix_receita_usuario_data', 'usuario_id', 'data', postgresql_include=['valor']),
+        db.Index('ix_receita_categoria_data', 'categoria_id', 'data', postgresql_include=['valor']),
+    )
\ No newline at end of file
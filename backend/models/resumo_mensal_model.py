@@ -0,0 +1,25 @@
+################################################################
+# Imports
+
+from database.config_database import db
+from models.user_model import User
+from models.categoria_model import Categoria
+
+################################################################
+# Main
+
+class ResumoMensal(db.Model):
+    __tablename__ = 'resumo_mensal'
+
+    usuario_id = db.Column(db.Integer, db.ForeignKey(User.id), primary_key=True)
+    categoria_id = db.Column(db.Integer, db.ForeignKey(Categoria.id), primary_key=True)
+    tipo = db.Column(db.String(255), primary_key=True)  # 'receita' ou 'despesa'
+    ano = db.Column(db.Integer, primary_key=True)
+    mes = db.Column(db.Integer, primary_key=True)
+    total = db.Column(db.Numeric(14, 2), nullable=False, default=0)
+    quantidade = db.Column(db.Integer, nullable=False, default=0)
+
+    # Índice para as consultas por categoria (a chave primária já cobre as consultas por usuário)
+    __table_args__ = (
+        db.Index('ix_resumo_mensal_categoria', 'categoria_id', 'ano', 'mes'),
+    )
\ No newline at end of file
@@ -57,8 +57,8 @@ def delete_alert(alert_id: str) -> jsonify:
 @alert_routes.route('/all', methods=['GET'])
 @token_authorization
 def get_all_alerts() -> jsonify:
-    """ Método para obter todos os alertas """
+    """ Método para obter os próximos alertas (parâmetros opcionais: from, to, cursor, limit) """
 
-    response = alert_controller.all_alerts()
+    response = alert_controller.all_alerts(request.args)
 
     return response
\ No newline at end of file
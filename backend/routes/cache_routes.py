@@ -0,0 +1,26 @@
+################################################################
+# Imports
+
+from flask import Blueprint, jsonify                     # Registrar as rotas e métodos HTTP
+from middlewares.auth import *                           # Middleware de autenticação
+from controllers.cache_controller import CacheController  # Controller do cache
+
+################################################################
+# Main
+
+cache_routes = Blueprint('cache_routes', __name__, url_prefix='/cache')
+cache_controller = CacheController()
+
+################################################################
+# Routes
+
+@cache_routes.route('/estatisticas', methods=['GET'])
+@token_authorization
+def get_estatisticas() -> jsonify:
+    """ Método para buscar os contadores do cache deste processo """
+
+    response = cache_controller.get_estatisticas()
+
+    return response
+
+################################################################
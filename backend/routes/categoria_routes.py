@@ -85,6 +85,13 @@ def get_orcamento_status(categoria_id: str) -> jsonify:
     response = categoria_controller.get_orcamento_status(categoria_id)
     return response
 
+@categoria_routes.route('/orcamento_status/usuario/<usuario_id>', methods=['GET'])
+@token_authorization
+def get_orcamentos_status_by_usuario(usuario_id: str) -> jsonify:
+    """ Rota para buscar o status do orçamento mensal de todas as categorias de despesa de um usuário """
+    response = categoria_controller.get_orcamentos_status_by_usuario(usuario_id)
+    return response
+
 @categoria_routes.route('/orcamento/<categoria_id>', methods=['PUT'])
 @token_authorization
 def create_orcamento(categoria_id: str) -> jsonify:
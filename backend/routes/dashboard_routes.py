@@ -0,0 +1,26 @@
+################################################################
+# Imports
+
+from flask import Blueprint, jsonify                     # Registrar as rotas e métodos HTTP
+from middlewares.auth import *                           # Middleware de autenticação
+from controllers.dashboard_controller import DashboardController  # Controller do painel
+
+################################################################
+# Main
+
+dashboard_routes = Blueprint('dashboard_routes', __name__, url_prefix='/dashboard')
+dashboard_controller = DashboardController()
+
+################################################################
+# Routes
+
+@dashboard_routes.route('/<usuario_id>', methods=['GET'])
+@token_authorization
+def get_dashboard(usuario_id: str) -> jsonify:
+    """ Método para buscar, em uma única requisição, os totais, dicas, avisos de orçamento e alertas disparados """
+
+    response = dashboard_controller.get_dashboard(usuario_id)
+
+    return response
+
+################################################################
@@ -29,9 +29,9 @@ def create_despesa() -> jsonify:
 @despesa_routes.route('/<usuario_id>', methods=['GET'])
 @token_authorization
 def get_despesas_by_usuario(usuario_id: str) -> jsonify:
-    """ Método para buscar despesas de um usuário """
+    """ Método para buscar despesas de um usuário (parâmetros opcionais: from, to, cursor, limit) """
 
-    response = despesa_controller.get_despesas_by_usuario(usuario_id)
+    response = despesa_controller.get_despesas_by_usuario(usuario_id, request.args)
 
     return response
 
@@ -0,0 +1,26 @@
+################################################################
+# Imports
+
+from flask import Blueprint, request, jsonify            # Registrar as rotas e métodos HTTP
+from middlewares.auth import *                           # Middleware de autenticação
+from controllers.exportacao_controller import ExportacaoController  # Controller de exportação
+
+################################################################
+# Main
+
+exportacao_routes = Blueprint('exportacao_routes', __name__, url_prefix='/exportacao')
+exportacao_controller = ExportacaoController()
+
+################################################################
+# Routes
+
+@exportacao_routes.route('/<usuario_id>', methods=['GET'])
+@token_authorization
+def exportar(usuario_id: str) -> jsonify:
+    """ Método para exportar despesas e receitas por data (parâmetros opcionais: formato (csv, ndjson), from, to) """
+
+    response = exportacao_controller.exportar(usuario_id, request.args)
+
+    return response
+
+################################################################
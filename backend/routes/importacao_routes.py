@@ -0,0 +1,35 @@
+################################################################
+# Imports
+
+from flask import Blueprint, request, jsonify            # Registrar as rotas e métodos HTTP
+from middlewares.auth import *                           # Middleware de autenticação
+from controllers.importacao_controller import ImportacaoController  # Controller de importação
+
+################################################################
+# Main
+
+importacao_routes = Blueprint('importacao_routes', __name__, url_prefix='/importacao')
+importacao_controller = ImportacaoController()
+
+################################################################
+# Routes
+
+@importacao_routes.route('/<usuario_id>', methods=['POST'])
+@token_authorization
+def importar(usuario_id: str) -> jsonify:
+    """ Método para importar um extrato CSV ou OFX (multipart no campo "arquivo" ou no corpo da requisição)
+
+    Parâmetros opcionais: formato (csv, ofx), encoding, categoria_despesa e categoria_receita (nome ou id
+    usados nas linhas sem categoria)
+    """
+
+    arquivo = request.files.get('arquivo')
+
+    if arquivo:
+        response = importacao_controller.importar(usuario_id, arquivo.stream, arquivo.filename, request.args)
+    else:
+        response = importacao_controller.importar(usuario_id, request.stream, None, request.args)
+
+    return response
+
+################################################################
@@ -0,0 +1,34 @@
+################################################################
+# Imports
+
+from flask import Blueprint, jsonify                     # Registrar as rotas e métodos HTTP
+from middlewares.auth import *                           # Middleware de autenticação
+from controllers.metricas_controller import MetricasController  # Controller das métricas
+
+################################################################
+# Main
+
+metricas_routes = Blueprint('metricas_routes', __name__, url_prefix='/metrics')
+metricas_controller = MetricasController()
+
+################################################################
+# Routes
+
+@metricas_routes.route('', methods=['GET'])
+def get_metricas():
+    """ Método para exportar as métricas deste processo (formato do Prometheus, sem autenticação para o coletor) """
+
+    response = metricas_controller.get_metricas()
+
+    return response
+
+@metricas_routes.route('/perfis', methods=['GET'])
+@token_authorization
+def get_perfis() -> jsonify:
+    """ Método para buscar os últimos perfis das requisições amostradas (METRICAS_AMOSTRA_PERFIL) """
+
+    response = metricas_controller.get_perfis()
+
+    return response
+
+################################################################
@@ -29,9 +29,9 @@ def create_receita() -> jsonify:
 @receita_routes.route('/<usuario_id>', methods=['GET'])
 @token_authorization
 def get_receitas_by_usuario(usuario_id: str) -> jsonify:
-    """ Método para buscar receitas de um usuário """
+    """ Método para buscar receitas de um usuário (parâmetros opcionais: from, to, cursor, limit) """
 
-    response = receita_controller.get_receitas_by_usuario(usuario_id)
+    response = receita_controller.get_receitas_by_usuario(usuario_id, request.args)
 
     return response
 
@@ -0,0 +1,26 @@
+################################################################
+# Imports
+
+from flask import Blueprint, request, jsonify            # Registrar as rotas e métodos HTTP
+from middlewares.auth import *                           # Middleware de autenticação
+from controllers.relatorio_controller import RelatorioController  # Controller de relatórios
+
+################################################################
+# Main
+
+relatorio_routes = Blueprint('relatorio_routes', __name__, url_prefix='/relatorio')
+relatorio_controller = RelatorioController()
+
+################################################################
+# Routes
+
+@relatorio_routes.route('/graficos/<usuario_id>', methods=['GET'])
+@token_authorization
+def get_graficos(usuario_id: str) -> jsonify:
+    """ Método para buscar totais por categoria e a série mensal (parâmetros opcionais: from, to) """
+
+    response = relatorio_controller.get_graficos(usuario_id, request.args)
+
+    return response
+
+################################################################
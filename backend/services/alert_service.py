@@ -3,7 +3,38 @@
 
 from models.alert_model import Alert  # Importa o modelo de alerta
 from flask_sqlalchemy import SQLAlchemy   # Importa o SQLAlchemy para conexão com o banco de dados
-from datetime import datetime             # Importa datetime para manipulação de datas
+from datetime import datetime, time, timedelta  # Importa datetime para manipulação de datas
+from sqlalchemy import select, update     # Consulta de existência e marcação dos alertas
+from utils.paginacao import LIMITE_PADRAO, paginar  # Paginação por chave (data, id)
+from utils.serializacao import Campo, Esquema, data_dia  # Serialização por esquema
+
+################################################################
+# Constants
+
+# Campos retornados nas listagens de alertas
+ESQUEMA_ALERTA = Esquema(
+    Campo('id', Alert.id),
+    Campo('usuario_id', Alert.usuario_id),
+    Campo('titulo', Alert.titulo),
+    Campo('descricao', Alert.descricao),
+    Campo('data_alerta', Alert.data_alerta, data_dia)
+)
+
+################################################################
+# Helper Functions
+
+def intervalo_dia(dia) -> tuple:
+    """ Início do dia informado e do dia seguinte, para buscas por intervalo em data_alerta """
+
+    inicio = datetime.combine(dia, time.min)
+    return inicio, inicio + timedelta(days=1)
+
+################################################################
+def disparo_imediato(data_alerta, agora: datetime = None):
+    """ Data de disparo de um alerta criado ou alterado para o dia de hoje, já que o agendador não o verá mais hoje """
+
+    agora = agora or datetime.now()
+    return agora if data_alerta and data_alerta.date() == agora.date() else None
 
 ################################################################
 # Main
@@ -20,14 +51,15 @@ class AlertService:
         try:
             # Converte a data para o formato correto, se fornecida
             if data_alerta:
-                data_alerta = datetime.strptime(data_alerta, '%Y-%m-%d').date()
+                data_alerta = datetime.strptime(data_alerta, '%Y-%m-%d')
 
             # Cria uma nova instância de Alerta
             alert = Alert(
                 usuario_id=usuario_id,
                 titulo=titulo,
                 descricao=descricao,
-                data_alerta=data_alerta
+                data_alerta=data_alerta,
+                disparado_em=disparo_imediato(data_alerta)
             )
             self.db_conn.session.add(alert)
             self.db_conn.session.commit()
@@ -42,28 +74,30 @@ class AlertService:
         """ Método para verificar se o usuário possui alertas """
         
         try:
-            # Busca todos os alertas associados ao usuário
-            alertas = self.db_conn.session.query(Alert).filter_by(usuario_id=usuario_id).all()
-            
-            if not alertas:
+            # Marca como entregues e retorna, em um único UPDATE ... RETURNING pelo índice parcial,
+            # os alertas já disparados pelo agendador que ainda não foram entregues
+            tabela = Alert.__table__
+            linhas = self.db_conn.session.execute(
+                update(tabela)
+                .where(tabela.c.usuario_id == usuario_id, tabela.c.disparado_em.is_not(None), tabela.c.entregue_em.is_(None))
+                .values(entregue_em=datetime.now())
+                .returning(*ESQUEMA_ALERTA.colunas())
+            ).all()
+            self.db_conn.session.commit()
+
+            if linhas:
+                alertas_disparados = sorted(linhas, key=lambda linha: (linha.data_alerta, linha.id))
+                return {'alertas_disparados': ESQUEMA_ALERTA.serializar_lista(alertas_disparados)}
+
+            # Sem alertas hoje: verifica se o usuário possui algum alerta
+            existe = self.db_conn.session.execute(select(Alert.id).where(Alert.usuario_id == usuario_id).limit(1)).first()
+            if not existe:
                 return {'message': 'Nenhum alerta encontrado para o usuário.'}
-            
-            alertas_disparados = []
-
-            # Serializa os alertas
-            alertas = [self.serialize_alert(alerta) for alerta in alertas]
-            
-            for alerta in alertas:
-                # Acessa data_alerta como chave do dicionário
-                if alerta['data_alerta'] and datetime.strptime(alerta['data_alerta'], '%Y-%m-%d').date() == datetime.now().date():
-                    alertas_disparados.append(alerta)
-
-            if len(alertas_disparados) == 0:
-                return {'message': 'Nenhum alerta disparado.'}
-            
-            return {'alertas_disparados': alertas_disparados}
+
+            return {'message': 'Nenhum alerta disparado.'}
         
         except Exception as e:
+            self.db_conn.session.rollback()
             print(f"Error fetching alerts: {e}")
             return {'error': str(e)}
         
@@ -78,10 +112,16 @@ class AlertService:
                 return {'error': 'Alerta não encontrado.'}
 
             # Atualiza os campos do alerta
+            data_alerta = datetime.strptime(data_alerta, '%Y-%m-%d') if data_alerta else None
             alert.usuario_id = usuario_id
             alert.titulo = titulo
             alert.descricao = descricao
-            alert.data_alerta = datetime.strptime(data_alerta, '%Y-%m-%d').date() if data_alerta else None
+
+            # Nova data: o alerta volta a aguardar o agendador (ou dispara já, se for para hoje)
+            if data_alerta != alert.data_alerta:
+                alert.data_alerta = data_alerta
+                alert.disparado_em = disparo_imediato(data_alerta)
+                alert.entregue_em = None
 
             self.db_conn.session.commit()
 
@@ -111,27 +151,46 @@ class AlertService:
 
         return {'message': 'Alerta deletado com sucesso!'}
     
-    def all_alerts(self) -> dict:
-        """ Método para buscar todos os alertas que ainda não chegaram no dia do alerta """
+    def disparar_alertas(self, agora: datetime = None) -> int:
+        """ Marca em lote, pelo índice parcial dos não disparados, os alertas de hoje e de dias anteriores que ainda
+        não foram disparados (dias em que o agendador esteve parado); retorna a quantidade """
+
+        agora = agora or datetime.now()
+        fim = intervalo_dia(agora.date())[1]
 
         try:
-            # Busca todos os alertas
-            alertas = self.db_conn.session.query(Alert).all()
+            resultado = self.db_conn.session.execute(
+                update(Alert.__table__)
+                .where(Alert.data_alerta < fim, Alert.disparado_em.is_(None))
+                .values(disparado_em=agora)
+            )
+            self.db_conn.session.commit()
+        except Exception:
+            self.db_conn.session.rollback()
+            raise
 
-            alertas_validos = []
+        return resultado.rowcount
 
-            for alerta in alertas:
-                # Verifica se data_alerta é uma instância de datetime e compara com a data atual
-                if alerta.data_alerta and alerta.data_alerta.date() > datetime.now().date():
-                    alertas_validos.append(alerta)
-            
-            if len(alertas_validos) == 0:
-                return {'message': 'Nenhum alerta encontrado.'}
+    ################################################################
+    def all_alerts(self, data_inicio=None, data_fim=None, cursor: tuple = None, limite: int = LIMITE_PADRAO) -> dict:
+        """ Método para buscar os alertas que ainda não chegaram no dia do alerta, paginados do mais próximo para o mais distante """
+
+        try:
+            # Alertas a partir de amanhã, pelo índice (data_alerta, id); o período informado só restringe o intervalo
+            amanha = intervalo_dia(datetime.now().date())[1]
+            inicio = max(amanha, datetime.combine(data_inicio, time.min)) if data_inicio else amanha
+            fim = datetime.combine(data_fim, time.max) if data_fim else None
+
+            alertas, proximo_cursor = paginar(
+                ESQUEMA_ALERTA.consulta(), Alert.data_alerta, Alert.id, inicio, fim, cursor, limite,
+                ler=lambda consulta: ESQUEMA_ALERTA.ler(self.db_conn.session, consulta),
+                crescente=True
+            )
 
-            # Serializa os alertas válidos
-            alertas = [self.serialize_alert(alerta) for alerta in alertas_validos]
+            if not alertas:
+                return {'message': 'Nenhum alerta encontrado.'}
 
-            return {'alertas': alertas}
+            return {'alertas': ESQUEMA_ALERTA.serializar_lista(alertas), 'proximo_cursor': proximo_cursor}
 
         except Exception as e:
             print(f"Error fetching all alerts: {e}")
@@ -140,10 +199,4 @@ class AlertService:
     def serialize_alert(self, alert: Alert) -> dict:
         """ Método para serializar um alerta """
         
-        return {
-            'id': alert.id,
-            'usuario_id': alert.usuario_id,
-            'titulo': alert.titulo,
-            'descricao': alert.descricao,
-            'data_alerta': alert.data_alerta.strftime('%Y-%m-%d') if alert.data_alerta else None
-        }
\ No newline at end of file
+        return ESQUEMA_ALERTA.serializar_objeto(alert)
\ No newline at end of file
@@ -6,8 +6,45 @@ from models.despesa_model import Despesa          # Importa o modelo de despesa
 from models.receita_model import Receita          # Importa o modelo de receita
 from models.meta_financeira_model import MetaFinanceira
 from flask_sqlalchemy import SQLAlchemy       # Importa o SQLAlchemy para conexão com o banco de dados
-from sqlalchemy import func # Import for SQL functions like EXTRACT
-from datetime import datetime # Import for current date
+from sqlalchemy import Integer, cast, delete, func, insert, select # Comandos SQL executados no servidor
+from utils.datas import intervalo_mes # Intervalo de datas do mês atual
+from models.resumo_mensal_model import ResumoMensal # Resumo mensal por categoria
+from services.resumo_mensal_service import ResumoMensalService, dinheiro # Manutenção do resumo mensal
+from utils.cache import cache_usuario # Cache de leitura por usuário
+from utils.serializacao import Campo, Esquema, data_iso, decimal_preenchido # Serialização por esquema
+
+################################################################
+# Constants
+
+# Transações movidas por lote na conversão de tipo de uma categoria
+LOTE_CONVERSAO = 10000
+
+# Colunas copiadas de receita para despesa (e vice-versa) na conversão
+COLUNAS_CONVERSAO = ['usuario_id', 'categoria_id', 'valor', 'descricao', 'data']
+
+# Tabela de transações de cada tipo de categoria
+MODELOS_TIPO = {'receita': Receita, 'despesa': Despesa}
+
+# Campos retornados nas listagens de categorias
+ESQUEMA_CATEGORIA = Esquema(
+    Campo('id', Categoria.id),
+    Campo('usuario_id', Categoria.usuario_id),
+    Campo('nome', Categoria.nome),
+    Campo('tipo', Categoria.tipo),
+    Campo('limite_gasto', Categoria.limite_gasto, decimal_preenchido),
+    Campo('orcamento_mensal', Categoria.orcamento_mensal, decimal_preenchido),
+    Campo('convertendo_para', Categoria.convertendo_para),
+    Campo('criado_em', Categoria.criado_em, data_iso)
+)
+
+# Versão resumida usada nas listas de categorias por tipo (despesas e receitas)
+ESQUEMA_CATEGORIA_RESUMIDA = Esquema(
+    Campo('id', Categoria.id),
+    Campo('usuario_id', Categoria.usuario_id),
+    Campo('nome', Categoria.nome),
+    Campo('tipo', Categoria.tipo),
+    Campo('criado_em', Categoria.criado_em, data_iso)
+)
 
 ################################################################
 # Main
@@ -16,6 +53,7 @@ class CategoriaService:
 
     def __init__(self, db_conn: SQLAlchemy):
         self.db_conn = db_conn
+        self.resumo_service = ResumoMensalService(db_conn=db_conn)
 
     ################################################################
     def create_categoria(self, usuario_id: str, nome: str, tipo: str, limite_gasto: float = None, orcamento_mensal: float = None) -> dict:
@@ -36,6 +74,9 @@ class CategoriaService:
             )
             self.db_conn.session.add(categoria)
             self.db_conn.session.commit()
+
+            # Descarta as leituras em cache do usuário
+            cache_usuario.invalidar(usuario_id)
         except Exception as e:
             return {'error': str(e)}
 
@@ -45,20 +86,25 @@ class CategoriaService:
     def get_categorias_by_usuario(self, usuario_id: str) -> dict:
         """ Método para buscar categorias de um usuário """
 
-        try:
-            # Busca todas as categorias associadas ao usuário
-            categorias = self.db_conn.session.query(Categoria).filter_by(usuario_id=usuario_id).all()
-            return {'status': True, 'categorias': [self.serialize_categoria(c) for c in categorias]}
-        except Exception as e:
-            return {'error': str(e)}
+        def carregar() -> dict:
+            try:
+                # Busca apenas as colunas retornadas das categorias do usuário
+                categorias = ESQUEMA_CATEGORIA.ler_serializado(
+                    self.db_conn.session, ESQUEMA_CATEGORIA.consulta().where(Categoria.usuario_id == usuario_id)
+                )
+                return {'status': True, 'categorias': categorias}
+            except Exception as e:
+                return {'error': str(e)}
+
+        return cache_usuario.buscar(usuario_id, 'categorias', carregar)
 
     ################################################################
     def get_all_categorias(self) -> dict:
         """ Método para buscar todas as categorias """
         try:
             # Busca todas as categorias
-            categorias = self.db_conn.session.query(Categoria).all()
-            return {'status': True, 'categorias': [self.serialize_categoria(c) for c in categorias]}
+            categorias = ESQUEMA_CATEGORIA.ler_serializado(self.db_conn.session, ESQUEMA_CATEGORIA.consulta())
+            return {'status': True, 'categorias': categorias}
         except Exception as e:
             return {'error': str(e)}
 
@@ -76,16 +122,22 @@ class CategoriaService:
             # Primeiro, deleta as metas financeiras vinculadas à categoria
             self.db_conn.session.query(MetaFinanceira).filter_by(categoria_id=categoria_id).delete()
 
-            # Depois apaga receitas ou despesas vinculadas à categoria
-            if categoria.tipo == 'receita':
-                self.db_conn.session.query(Receita).filter_by(categoria_id=categoria_id).delete()
-            else:
-                self.db_conn.session.query(Despesa).filter_by(categoria_id=categoria_id).delete()
+            # Depois apaga receitas e despesas vinculadas à categoria: com uma conversão de tipo interrompida
+            # (convertendo_para marcado) há transações nas duas tabelas
+            for modelo in MODELOS_TIPO.values():
+                self.db_conn.session.query(modelo).filter_by(categoria_id=categoria_id).delete()
+
+            # Remove o resumo mensal da categoria
+            self.resumo_service.remover_categoria(categoria_id)
 
             # Por fim, apaga a categoria
+            usuario_id = categoria.usuario_id
             self.db_conn.session.delete(categoria)
             self.db_conn.session.commit()
 
+            # Descarta as leituras em cache do usuário
+            cache_usuario.invalidar(usuario_id)
+
             return {'status': True, 'message': 'Categoria e registros vinculados deletados com sucesso!'}
 
         except Exception as e:
@@ -93,7 +145,7 @@ class CategoriaService:
             return {'status': False, 'error': str(e)}
     
     ################################################################
-    def update_categoria(self, categoria_id: str, nome: str, tipo: str, limite_gasto: float = None, orcamento_mensal: float = None) -> dict:
+    def update_categoria(self, categoria_id: str, nome: str, tipo: str, limite_gasto: float = None, orcamento_mensal: float = None, lote: int = LOTE_CONVERSAO) -> dict:
         """ Método para atualizar uma categoria, convertendo suas transações se o tipo mudar """
         try:
             # Busca a categoria pelo ID
@@ -105,52 +157,25 @@ class CategoriaService:
             # Valida se o orçamento mensal é aplicável apenas para despesas
             if tipo == 'receita' and orcamento_mensal is not None:
                 return {'error': 'Orçamento mensal só pode ser definido para categorias do tipo "despesa".'}
-            
-            # Verifica se o tipo está sendo alterado
+
+            # Conversão interrompida: termina de mover as transações para o tipo pendente antes de continuar
+            if categoria.convertendo_para:
+                self.converter_transacoes(categoria, categoria.convertendo_para, lote)
+
+            # Se o tipo mudou, movemos todas as transações no próprio banco
             if categoria.tipo != tipo:
-                # Se o tipo mudou, convertemos todas as transações
-                if categoria.tipo == 'receita' and tipo == 'despesa':
-                    # Converte de receita para despesa
-                    receitas = self.db_conn.session.query(Receita).filter_by(categoria_id=categoria_id).all()
-                    for receita in receitas:
-                        # Cria uma nova despesa com os mesmos dados da receita
-                        nova_despesa = Despesa(
-                            usuario_id=receita.usuario_id,
-                            categoria_id=receita.categoria_id,
-                            valor=receita.valor,
-                            descricao=receita.descricao,
-                            data=receita.data
-                        )
-                        self.db_conn.session.add(nova_despesa)
-                    
-                    # Exclui as receitas originais
-                    self.db_conn.session.query(Receita).filter_by(categoria_id=categoria_id).delete()
-                
-                elif categoria.tipo == 'despesa' and tipo == 'receita':
-                    # Converte de despesa para receita
-                    despesas = self.db_conn.session.query(Despesa).filter_by(categoria_id=categoria_id).all()
-                    for despesa in despesas:
-                        # Cria uma nova receita com os mesmos dados da despesa
-                        nova_receita = Receita(
-                            usuario_id=despesa.usuario_id,
-                            categoria_id=despesa.categoria_id,
-                            valor=despesa.valor,
-                            descricao=despesa.descricao,
-                            data=despesa.data
-                        )
-                        self.db_conn.session.add(nova_receita)
-                    
-                    # Exclui as despesas originais
-                    self.db_conn.session.query(Despesa).filter_by(categoria_id=categoria_id).delete()
-            
+                self.converter_transacoes(categoria, tipo, lote)
+
             # Atualiza os dados da categoria
             categoria.nome = nome
-            categoria.tipo = tipo
             categoria.limite_gasto = limite_gasto
             categoria.orcamento_mensal = orcamento_mensal
             
             # Comita as alterações
             self.db_conn.session.commit()
+
+            # Descarta as leituras em cache do usuário
+            cache_usuario.invalidar(categoria.usuario_id)
             
             return {'status': True, 'message': 'Categoria atualizada com sucesso!'}
         except Exception as e:
@@ -158,23 +183,81 @@ class CategoriaService:
             self.db_conn.session.rollback()
             return {'error': str(e)}
     
+    ################################################################
+    def converter_transacoes(self, categoria: Categoria, tipo: str, lote: int = LOTE_CONVERSAO) -> None:
+        """ Move as transações da categoria para a tabela do novo `tipo` com INSERT ... SELECT + DELETE
+
+        Até `lote` transações a conversão inteira fica na transação da atualização. Acima disso, cada lote completo
+        (em ordem de id) é comitado junto com o seu ajuste no resumo mensal e com `convertendo_para` marcado na
+        categoria: as leituras sabem que a categoria está em conversão e a próxima atualização continua de onde
+        parou, sem perder nem duplicar transações. O último lote fica pendente, junto com o novo tipo.
+        """
+
+        origem, destino = MODELOS_TIPO[categoria.tipo], MODELOS_TIPO[tipo]
+
+        while True:
+            filtro = [origem.categoria_id == categoria.id]
+
+            if lote:
+                # Maior id do próximo lote; sem ele, o que resta cabe em um único lote
+                limite_id = self.db_conn.session.scalar(
+                    select(origem.id).where(*filtro).order_by(origem.id).offset(lote - 1).limit(1)
+                )
+                if limite_id is not None:
+                    filtro.append(origem.id <= limite_id)
+            else:
+                limite_id = None
+
+            self.mover_lote(categoria.id, origem, destino, filtro)
+
+            if limite_id is None:
+                break
+
+            # Lote completo: grava o progresso e marca a conversão em andamento
+            categoria.convertendo_para = tipo
+            self.db_conn.session.commit()
+            cache_usuario.invalidar(categoria.usuario_id)
+
+        categoria.tipo = tipo
+        categoria.convertendo_para = None
+
+    ################################################################
+    def mover_lote(self, categoria_id: int, origem, destino, filtro: list) -> None:
+        """ Move um lote de transações e transfere os seus valores no resumo mensal de um tipo para o outro """
+
+        # Totais do lote por usuário e mês, antes de apagar as transações de origem
+        ano = cast(func.extract('year', origem.data), Integer)
+        mes = cast(func.extract('month', origem.data), Integer)
+        linhas = self.db_conn.session.execute(
+            select(origem.usuario_id, ano, mes, func.sum(origem.valor), func.count())
+            .where(*filtro)
+            .group_by(origem.usuario_id, ano, mes)
+        ).all()
+
+        colunas = [getattr(origem, coluna) for coluna in COLUNAS_CONVERSAO]
+        self.db_conn.session.execute(
+            insert(destino).from_select(COLUNAS_CONVERSAO, select(*colunas).where(*filtro))
+        )
+        self.db_conn.session.execute(delete(origem).where(*filtro))
+
+        # O mesmo valor sai do tipo de origem e entra no de destino (o total da categoria não muda)
+        variacoes = {}
+        for usuario_id, ano_lote, mes_lote, total, quantidade in linhas:
+            variacoes[(usuario_id, categoria_id, origem.__tablename__, ano_lote, mes_lote)] = (-dinheiro(total), -quantidade)
+            variacoes[(usuario_id, categoria_id, destino.__tablename__, ano_lote, mes_lote)] = (dinheiro(total), quantidade)
+        self.resumo_service.registrar_lote(variacoes)
+
     ################################################################
     def total_by_categoria(self, categoria_id: str) -> dict:
         """ Método para buscar o total de categorias por usuário """
         try:
-            # Busca o total de categorias associadas ao usuário
-            categoria = self.db_conn.session.query(Categoria).filter_by(id=categoria_id).first()
-            if not categoria:
+            # Total acumulado da categoria, mantido junto com o resumo mensal: leitura pela chave primária
+            # (.first() distingue a categoria inexistente de um total nulo)
+            linha = self.db_conn.session.execute(select(Categoria.total).where(Categoria.id == categoria_id)).first()
+            if linha is None:
                 return {'status': False, 'message': 'Categoria não encontrada'}
-            
-            if categoria.tipo == 'receita':
-                receitas = self.db_conn.session.query(Receita).filter_by(categoria_id=categoria_id).all()
-                total = sum(receita.valor for receita in receitas)
-            else:
-                despesas = self.db_conn.session.query(Despesa).filter_by(categoria_id=categoria_id).all()
-                total = sum(despesa.valor for despesa in despesas)
 
-            return {'status': True, 'total': total}
+            return {'status': True, 'total': linha.total if linha.total is not None else 0}
         except Exception as e:
             return {'error': str(e)}
     
@@ -207,47 +290,85 @@ class CategoriaService:
             if categoria.orcamento_mensal is None:
                 return {'status': False, 'message': 'Orçamento mensal não definido para esta categoria.'}
 
-            # Obter o mês e ano atuais
-            now = datetime.utcnow()
-            current_month = now.month
-            current_year = now.year
+            # Obter o primeiro dia do mês atual
+            inicio_mes, _ = intervalo_mes()
 
-            # Calcular o total de despesas para a categoria no mês atual
-            total_despesas_mes_atual = self.db_conn.session.query(func.sum(Despesa.valor)).filter(
-                Despesa.categoria_id == categoria_id,
-                func.extract('month', Despesa.data) == current_month,
-                func.extract('year', Despesa.data) == current_year
-            ).scalar() or 0.00 # scalar() pode retornar None se não houver despesas
+            # Total de despesas da categoria no mês atual, lido do resumo mensal
+            total_despesas_mes_atual = self.resumo_service.total_categoria(categoria_id, referencia=inicio_mes)
 
-            orcamento_mensal = float(categoria.orcamento_mensal)
-            gasto_atual = float(total_despesas_mes_atual)
-            orcamento_restante = orcamento_mensal - gasto_atual
+            return {'status': True, **self.montar_status_orcamento(categoria.nome, categoria.orcamento_mensal, total_despesas_mes_atual)}
 
-            return {
-                'status': True,
-                'categoria_nome': categoria.nome,
-                'orcamento_mensal': orcamento_mensal,
-                'gasto_atual_mes': gasto_atual,
-                'orcamento_restante': orcamento_restante,
-                'percentual_gasto': (gasto_atual / orcamento_mensal * 100) if orcamento_mensal > 0 else 0
-            }
+        except Exception as e:
+            self.db_conn.session.rollback()
+            return {'error': str(e)}
+
+    ################################################################
+    def get_orcamentos_status_by_usuario(self, usuario_id: str) -> dict:
+        """ Método para buscar o status do orçamento mensal de todas as categorias de despesa de um usuário """
+        try:
+            inicio_mes, _ = intervalo_mes()
+
+            # Gasto do mês atual por categoria, lido do resumo mensal
+            gastos = select(
+                ResumoMensal.categoria_id,
+                ResumoMensal.total.label('gasto')
+            ).where(
+                ResumoMensal.usuario_id == usuario_id,
+                ResumoMensal.tipo == 'despesa',
+                ResumoMensal.ano == inicio_mes.year,
+                ResumoMensal.mes == inicio_mes.month
+            ).subquery()
+
+            # Categorias de despesa do usuário com o gasto do mês em uma única consulta
+            linhas = self.db_conn.session.execute(
+                select(Categoria.id, Categoria.nome, Categoria.orcamento_mensal, gastos.c.gasto)
+                .outerjoin(gastos, gastos.c.categoria_id == Categoria.id)
+                .where(Categoria.usuario_id == usuario_id, Categoria.tipo == 'despesa')
+                .order_by(Categoria.id)
+            ).all()
+
+            orcamentos = [
+                {'categoria_id': linha.id, **self.montar_status_orcamento(linha.nome, linha.orcamento_mensal, linha.gasto)}
+                for linha in linhas
+            ]
+
+            return {'status': True, 'orcamentos': orcamentos}
 
         except Exception as e:
             self.db_conn.session.rollback()
             return {'error': str(e)}
 
     ################################################################
-    def serialize_categoria(self, categoria: Categoria) -> dict:
-        """ Método para serializar uma categoria """
+    def montar_status_orcamento(self, nome: str, orcamento_mensal, gasto_mes) -> dict:
+        """ Método para calcular o status do orçamento a partir do orçamento e do gasto do mês """
+
+        gasto_atual = float(gasto_mes or 0)
+
+        # Categorias sem orçamento definido retornam apenas o gasto do mês
+        if orcamento_mensal is None:
+            return {
+                'categoria_nome': nome,
+                'orcamento_mensal': None,
+                'gasto_atual_mes': gasto_atual,
+                'orcamento_restante': None,
+                'percentual_gasto': None
+            }
+
+        orcamento_mensal = float(orcamento_mensal)
+        orcamento_restante = orcamento_mensal - gasto_atual
+
         return {
-            'id': categoria.id,
-            'usuario_id': categoria.usuario_id,
-            'nome': categoria.nome,
-            'tipo': categoria.tipo,
-            'limite_gasto': float(categoria.limite_gasto) if categoria.limite_gasto else None,
-            'orcamento_mensal': float(categoria.orcamento_mensal) if categoria.orcamento_mensal else None, # Novo campo
-            'criado_em': categoria.criado_em.isoformat()
+            'categoria_nome': nome,
+            'orcamento_mensal': orcamento_mensal,
+            'gasto_atual_mes': gasto_atual,
+            'orcamento_restante': orcamento_restante,
+            'percentual_gasto': (gasto_atual / orcamento_mensal * 100) if orcamento_mensal > 0 else 0
         }
+
+    ################################################################
+    def serialize_categoria(self, categoria: Categoria) -> dict:
+        """ Método para serializar uma categoria """
+        return ESQUEMA_CATEGORIA.serializar_objeto(categoria)
     
     def create_orcamento(self, categoria_id: str, orcamento_mensal: float) -> dict:
         """ Método para criar um orçamento mensal para uma categoria de despesa """
@@ -266,6 +387,9 @@ class CategoriaService:
             
             self.db_conn.session.commit()
 
+            # Descarta as leituras em cache do usuário
+            cache_usuario.invalidar(categoria.usuario_id)
+
             return {'status': True, 'message': 'Orçamento mensal criado com sucesso!'}
         except Exception as e:
             self.db_conn.session.rollback()
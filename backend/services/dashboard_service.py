@@ -0,0 +1,153 @@
+################################################################
+# Imports
+
+from models.categoria_model import Categoria         # Importa o modelo de categoria
+from models.resumo_mensal_model import ResumoMensal  # Importa o modelo do resumo mensal
+from flask_sqlalchemy import SQLAlchemy              # Importa o SQLAlchemy para conexão com o banco de dados
+from sqlalchemy import and_, case, func, or_, select # Agregações do painel
+from datetime import date                            # Mês de referência dos orçamentos
+from database.config_async import ESPERA_ASYNC, banco_assincrono  # Leituras do painel em paralelo
+from services.alert_service import AlertService      # Alertas disparados
+from services.categoria_service import CategoriaService  # Status do orçamento mensal
+from services.despesa_service import DespesaService  # Aviso de limite de gastos
+from services.dicas_service import DicasService      # Regras de dicas de despesas
+from utils.cache import cache_usuario                # Cache de leitura por usuário
+
+################################################################
+# Constants
+
+PERCENTUAL_AVISO_ORCAMENTO = 90   # Orçamento mensal gasto a partir do qual a categoria entra nos avisos
+
+################################################################
+# Helper Functions
+
+def consulta_totais(usuario_id):
+    """ Total de receitas e de despesas do usuário (uma linha por tipo), lido do resumo mensal """
+
+    return (
+        select(ResumoMensal.tipo, func.coalesce(func.sum(ResumoMensal.total), 0).label('total'))
+        .where(ResumoMensal.usuario_id == usuario_id)
+        .group_by(ResumoMensal.tipo)
+    )
+
+################################################################
+def consulta_limites(usuario_id, hoje: date):
+    """ Categorias de despesa com limite de gastos ou orçamento mensal, com o total acumulado e o gasto do mês """
+
+    mes_atual = and_(ResumoMensal.ano == hoje.year, ResumoMensal.mes == hoje.month)
+
+    return (
+        select(
+            Categoria.id,
+            Categoria.nome,
+            Categoria.limite_gasto,
+            Categoria.orcamento_mensal,
+            Categoria.total,
+            func.coalesce(func.sum(case((mes_atual, ResumoMensal.total), else_=0)), 0).label('gasto_mes')
+        )
+        .outerjoin(ResumoMensal, ResumoMensal.categoria_id == Categoria.id)
+        .where(
+            Categoria.usuario_id == usuario_id,
+            Categoria.tipo == 'despesa',
+            or_(Categoria.limite_gasto.is_not(None), Categoria.orcamento_mensal.is_not(None))
+        )
+        .group_by(Categoria.id, Categoria.nome, Categoria.limite_gasto, Categoria.orcamento_mensal, Categoria.total)
+        .order_by(Categoria.id)
+    )
+
+################################################################
+# Main
+
+class DashboardService:
+
+    def __init__(self, db_conn: SQLAlchemy):
+        self.db_conn = db_conn
+        self.alert_service = AlertService(db_conn=db_conn)
+        self.categoria_service = CategoriaService(db_conn=db_conn)
+        self.despesa_service = DespesaService(db_conn=db_conn)
+        self.dicas_service = DicasService(db_conn=db_conn)
+
+    ################################################################
+    def get_dashboard(self, usuario_id: str) -> dict:
+        """ Método que monta a tela inicial em uma resposta: totais, dicas, avisos de orçamento e alertas disparados """
+
+        try:
+            # Marcar os alertas como entregues é uma escrita: fica fora do cache e vai para o banco principal.
+            # Sem cache, ela roda enquanto as leituras disparadas por `enviar` executam nas outras conexões.
+            alertas = None
+
+            def carregar() -> dict:
+                nonlocal alertas
+                pendente = self.enviar(usuario_id)
+                alertas = self.alert_service.is_alert(usuario_id)
+                return self.ler(*pendente)
+
+            leituras = cache_usuario.buscar(usuario_id, 'dashboard', carregar)
+            if 'error' in leituras:
+                return leituras
+
+            if alertas is None:
+                alertas = self.alert_service.is_alert(usuario_id)
+            if 'error' in alertas:
+                return alertas
+
+            return {**leituras, 'alertas_disparados': alertas.get('alertas_disparados', [])}
+        except Exception as e:
+            return {'error': str(e)}
+
+    ################################################################
+    def enviar(self, usuario_id: str, hoje: date = None) -> tuple:
+        """ Dispara todas as leituras do painel em paralelo, cada uma em uma conexão do pool, sem esperar
+
+        Retorna (consultas das dicas, futuro) para `ler`.
+        """
+
+        hoje = hoje or date.today()
+        dicas = self.dicas_service.consultas(usuario_id, hoje)
+
+        futuro = banco_assincrono.enviar(
+            consulta_totais(usuario_id),
+            consulta_limites(usuario_id, hoje),
+            *(consulta for _, consulta in dicas)
+        )
+        return dicas, futuro
+
+    ################################################################
+    def ler(self, dicas: list, futuro) -> dict:
+        """ Aguarda as leituras disparadas por `enviar` e monta os totais, as dicas e os avisos """
+
+        try:
+            totais, limites, *resultados_dicas = futuro.result(timeout=ESPERA_ASYNC)
+
+            totais = {linha.tipo: float(linha.total) for linha in totais}
+            sugestoes = self.dicas_service.montar(dicas, resultados_dicas)
+
+            return {
+                'status': True,
+                'receitas': totais.get('receita', 0.0),
+                'despesas': totais.get('despesa', 0.0),
+                'dicas': {dica['data']: dica['quantidade'] for dica in sugestoes if dica['regra'] == 'muitas_despesas_dia'},
+                'sugestoes': sugestoes,
+                'avisos': self.montar_avisos(limites)
+            }
+        except Exception as e:
+            return {'error': str(e)}
+
+    ################################################################
+    def montar_avisos(self, linhas: list) -> list:
+        """ Avisos de limite de gastos (mesma regra da criação de despesa) e de orçamento mensal quase esgotado """
+
+        avisos = []
+        for linha in linhas:
+            limite = self.despesa_service.verificar_limite(linha.nome, linha.limite_gasto, linha.total)
+            if limite:
+                avisos.append({'categoria_id': linha.id, 'tipo': 'limite', 'title': limite['title'], 'message': limite['message']})
+
+            if linha.orcamento_mensal is not None:
+                orcamento = self.categoria_service.montar_status_orcamento(linha.nome, linha.orcamento_mensal, linha.gasto_mes)
+                if orcamento['percentual_gasto'] >= PERCENTUAL_AVISO_ORCAMENTO:
+                    avisos.append({'categoria_id': linha.id, 'tipo': 'orcamento', **orcamento})
+
+        return avisos
+
+################################################################
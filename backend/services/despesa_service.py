@@ -6,6 +6,30 @@ from flask_sqlalchemy import SQLAlchemy   # Importa o SQLAlchemy para conexão c
 from datetime import datetime             # Importa datetime para manipulação de datas
 from models.user_model import User             # Importa o modelo de usuário
 from models.categoria_model import Categoria         # Importa o modelo de categoria
+from utils.paginacao import paginar, LIMITE_PADRAO   # Paginação por chave (data, id)
+from sqlalchemy import select                        # Limite e total da categoria
+from services.resumo_mensal_service import ResumoMensalService  # Resumo mensal por categoria
+from services.dicas_service import DicasService      # Regras de dicas de despesas
+from utils.cache import cache_usuario                # Cache de leitura por usuário
+from utils.serializacao import Campo, Esquema, data_iso, decimal, texto_preenchido  # Serialização por esquema
+from services.categoria_service import ESQUEMA_CATEGORIA_RESUMIDA  # Campos das listas de categorias
+
+################################################################
+# Constants
+
+# Campos retornados nas listagens de despesas
+ESQUEMA_DESPESA = Esquema(
+    Campo('id', Despesa.id),
+    Campo('usuario_id', Despesa.usuario_id),
+    Campo('categoria_id', Despesa.categoria_id),
+    Campo('valor', Despesa.valor, decimal),
+    Campo('data', Despesa.data, data_iso),
+    Campo('descricao', Despesa.descricao),
+    Campo('image', Despesa.imagem, texto_preenchido),
+    Campo('latitude', Despesa.latitude),
+    Campo('longitude', Despesa.longitude),
+    Campo('criado_em', Despesa.criado_em, data_iso)
+)
 
 ################################################################
 # Main
@@ -14,6 +38,8 @@ class DespesaService:
 
     def __init__(self, db_conn: SQLAlchemy):
         self.db_conn = db_conn
+        self.dicas_service = DicasService(db_conn=db_conn)
+        self.resumo_service = ResumoMensalService(db_conn=db_conn)
 
     ################################################################
     def create_despesa(self, usuario_id: str, categoria_id: str, valor: float, data: str, descricao: str, image: str, latitude: float, longitude: float) -> dict:
@@ -36,33 +62,60 @@ class DespesaService:
                 longitude=longitude,
             )
             self.db_conn.session.add(despesa)
+
+            # Atualiza o resumo mensal na mesma transação da inserção
+            self.resumo_service.registrar(usuario_id, categoria_id, 'despesa', data, valor)
+
+            # Lê o limite e o total acumulado da categoria (já com a nova despesa) pela chave primária
+            categoria = self.db_conn.session.execute(
+                select(Categoria.nome, Categoria.limite_gasto, Categoria.total).where(Categoria.id == categoria_id)
+            ).first()
+
             self.db_conn.session.commit()
 
-            categoria = self.db_conn.session.query(Categoria).filter_by(id=categoria_id).first()
-            todas_despesas = self.get_despesas_by_categoria(categoria_id=categoria_id)
-            total_despesa = sum(d['valor'] for d in todas_despesas['despesas'])
-            limite_categoria = self.db_conn.session.query(Categoria).filter_by(id=categoria_id).first().limite_gasto
-            quase_limite = float(limite_categoria) * 0.9
-
-            if total_despesa >= limite_categoria:
-                return {'limite': True, 'title': 'Limite Excedido', 'message': f'O limite de {limite_categoria} foi atingido para a categoria {categoria.nome}.'}
-            elif total_despesa >= quase_limite:
-                return {'limite': True, 'title': 'Você está proximo do seu Limite', 'message': f'Você está quase atingindo o limite de {limite_categoria} para a categoria {categoria.nome}.'}
-            
+            # Descarta as leituras em cache do usuário
+            cache_usuario.invalidar(usuario_id)
         except Exception as e:
+            self.db_conn.session.rollback()
             print(f"Error creating despesa: {e}")
             return {'error': str(e)}
 
+        # Avisa se a categoria atingiu ou está próxima do limite de gastos
+        if categoria:
+            alerta = self.verificar_limite(categoria.nome, categoria.limite_gasto, categoria.total)
+            if alerta:
+                return alerta
+
         return {'message': 'Despesa criada com sucesso!'}
 
     ################################################################
-    def get_despesas_by_usuario(self, usuario_id: str) -> dict:
-        """ Método para buscar despesas de um usuário """
+    def verificar_limite(self, nome: str, limite_gasto, total) -> dict:
+        """ Método para montar o aviso de limite atingido ou próximo (None se não houver limite ou aviso) """
+
+        if limite_gasto is None:
+            return None
+
+        total = float(total or 0)
+
+        if total >= float(limite_gasto):
+            return {'limite': True, 'title': 'Limite Excedido', 'message': f'O limite de {limite_gasto} foi atingido para a categoria {nome}.'}
+        elif total >= float(limite_gasto) * 0.9:
+            return {'limite': True, 'title': 'Você está proximo do seu Limite', 'message': f'Você está quase atingindo o limite de {limite_gasto} para a categoria {nome}.'}
+
+        return None
+
+    ################################################################
+    def get_despesas_by_usuario(self, usuario_id: str, data_inicio=None, data_fim=None, cursor: tuple = None, limite: int = LIMITE_PADRAO) -> dict:
+        """ Método para buscar despesas de um usuário, paginadas da mais recente para a mais antiga """
 
         try:
-            # Busca todas as despesas associadas ao usuário
-            despesas = self.db_conn.session.query(Despesa).filter_by(usuario_id=usuario_id).all()
-            return {'status': True, 'despesas': [self.serialize_despesa(d) for d in despesas]}
+            # Busca uma página das despesas do usuário no período informado, apenas com as colunas retornadas
+            consulta = ESQUEMA_DESPESA.consulta().where(Despesa.usuario_id == usuario_id)
+            despesas, proximo_cursor = paginar(
+                consulta, Despesa.data, Despesa.id, data_inicio, data_fim, cursor, limite,
+                ler=lambda consulta: ESQUEMA_DESPESA.ler(self.db_conn.session, consulta)
+            )
+            return {'status': True, 'despesas': ESQUEMA_DESPESA.serializar_lista(despesas), 'proximo_cursor': proximo_cursor}
         except Exception as e:
             return {'error': str(e)}
 
@@ -77,8 +130,15 @@ class DespesaService:
             if not despesa:
                 return {'status': False, 'message': 'Despesa não encontrada'}
 
+            usuario_id = despesa.usuario_id
             self.db_conn.session.delete(despesa)
+
+            # Retira a despesa do resumo mensal na mesma transação da remoção
+            self.resumo_service.registrar(usuario_id, despesa.categoria_id, 'despesa', despesa.data, -despesa.valor, -1)
             self.db_conn.session.commit()
+
+            # Descarta as leituras em cache do usuário
+            cache_usuario.invalidar(usuario_id)
         except Exception as e:
             return {'error': str(e)}
 
@@ -86,82 +146,69 @@ class DespesaService:
     
     def total_despesa(self, usuario_id: str) -> dict:
         """ Método para buscar o total de despesas de um usuário """
-        
-        try:
-            # Busca todas as despesas associadas ao usuário
-            despesas = self.db_conn.session.query(Despesa).filter_by(usuario_id=usuario_id).all()
-            total = sum(despesa.valor for despesa in despesas)
-            return {'status': True, 'total': total}
-        except Exception as e:
-            return {'error': str(e)}
+
+        def carregar() -> dict:
+            try:
+                # Soma o resumo mensal do usuário (uma linha por categoria e mês)
+                total = self.resumo_service.total_usuario(usuario_id, 'despesa')
+                return {'status': True, 'total': total}
+            except Exception as e:
+                return {'error': str(e)}
+
+        return cache_usuario.buscar(usuario_id, 'despesa:total', carregar)
         
     def get_dicas_despesas(self, usuario_id: str) -> dict:
-        """ Método que verifica se o usuário está adicionando muitas despesas em um mesmo dia """
+        """ Método que gera as dicas de despesas do usuário (dias com muitas despesas, picos de gasto e categorias acima da média) """
 
-        try:
-            # Busca todas as despesas associadas ao usuário
-            despesas = self.db_conn.session.query(Despesa).filter_by(usuario_id=usuario_id).all()
-            dicas = {}
+        def carregar() -> dict:
+            try:
+                # Cada regra é uma consulta agregada sobre uma janela recente ou sobre o resumo mensal
+                sugestoes = self.dicas_service.gerar(usuario_id)
 
-            for despesa in despesas:
-                if despesa.data not in dicas:
-                    dicas[despesa.data] = 1
-                else:
-                    dicas[despesa.data] += 1
+                # Dias com muitas despesas no formato {data: quantidade} usado pela tela inicial
+                dicas = {dica['data']: dica['quantidade'] for dica in sugestoes if dica['regra'] == 'muitas_despesas_dia'}
 
-            # Verifica se o usuário adicionou mais de 3 despesas em um mesmo dia
-            dicas = {data.isoformat(): count for data, count in dicas.items() if count > 3}
+                return {'status': True, 'dicas': dicas, 'sugestoes': sugestoes}
+            except Exception as e:
+                return {'error': str(e)}
 
-            return {'status': True, 'dicas': dicas}
-        except Exception as e:
-            return {'error': str(e)}
+        return cache_usuario.buscar(usuario_id, 'despesa:dicas', carregar)
     
     ################################################################
     def get_categorias_despesas(self, usuario_id: str) -> dict:
         """ Método para buscar categorias de despesas de um usuário """
-        
-        try:
-            # Busca todas as categorias de despesas associadas ao usuário
-            categorias = self.db_conn.session.query(Categoria).filter_by(usuario_id=usuario_id, tipo='despesa').all()
-            return {'status': True, 'categorias': [self.serialize_categoria(c) for c in categorias]}
-        except Exception as e:
-            return {'error': str(e)}
+
+        def carregar() -> dict:
+            try:
+                # Busca todas as categorias de despesas associadas ao usuário
+                categorias = ESQUEMA_CATEGORIA_RESUMIDA.ler_serializado(
+                    self.db_conn.session,
+                    ESQUEMA_CATEGORIA_RESUMIDA.consulta().where(Categoria.usuario_id == usuario_id, Categoria.tipo == 'despesa')
+                )
+                return {'status': True, 'categorias': categorias}
+            except Exception as e:
+                return {'error': str(e)}
+
+        return cache_usuario.buscar(usuario_id, 'despesa:categorias', carregar)
         
     def get_despesas_by_categoria(self, categoria_id: str) -> dict:
         """ Método para buscar despesas de um usuário por categoria """
         
         try:
             # Busca todas as despesas associadas ao usuário e à categoria
-            despesas = self.db_conn.session.query(Despesa).filter_by(categoria_id=categoria_id).all()
-            return {'status': True, 'despesas': [self.serialize_despesa(d) for d in despesas]}
+            despesas = ESQUEMA_DESPESA.ler_serializado(self.db_conn.session, ESQUEMA_DESPESA.consulta().where(Despesa.categoria_id == categoria_id))
+            return {'status': True, 'despesas': despesas}
         except Exception as e:
             return {'error': str(e)}
 
     ################################################################
     def serialize_despesa(self, despesa: Despesa) -> dict:
         """ Método para serializar uma despesa """
-        return {
-            'id': despesa.id,
-            'usuario_id': despesa.usuario_id,
-            'categoria_id': despesa.categoria_id,
-            'valor': float(despesa.valor),
-            'data': despesa.data.isoformat(),
-            'descricao': despesa.descricao,
-            'image': despesa.imagem if despesa.imagem else None,
-            'latitude': despesa.latitude,
-            'longitude': despesa.longitude,
-            'criado_em': despesa.criado_em.isoformat()
-        }
+        return ESQUEMA_DESPESA.serializar_objeto(despesa)
     
     ################################################################
     def serialize_categoria(self, categoria: Categoria) -> dict:
         """ Método para serializar uma categoria """
-        return {
-            'id': categoria.id,
-            'usuario_id': categoria.usuario_id,
-            'nome': categoria.nome,
-            'tipo': categoria.tipo,
-            'criado_em': categoria.criado_em.isoformat()
-        }
+        return ESQUEMA_CATEGORIA_RESUMIDA.serializar_objeto(categoria)
 
 ################################################################
\ No newline at end of file
@@ -0,0 +1,207 @@
+################################################################
+# Imports
+
+from models.despesa_model import Despesa             # Importa o modelo de despesa
+from models.categoria_model import Categoria         # Importa o modelo de categoria
+from models.resumo_mensal_model import ResumoMensal  # Importa o modelo do resumo mensal
+from flask_sqlalchemy import SQLAlchemy              # Importa o SQLAlchemy para conexão com o banco de dados
+from sqlalchemy import case, func, literal, select   # Agregações das regras
+from datetime import date, timedelta                 # Janela de datas das regras
+import os                                            # Configuração por variáveis de ambiente
+from database.config_async import banco_assincrono   # Consultas das regras em paralelo
+
+################################################################
+# Constants
+
+JANELA_DIAS = int(os.environ.get('DICAS_JANELA_DIAS', 90))            # Despesas consideradas pelas regras diárias
+LIMITE_DESPESAS_DIA = int(os.environ.get('DICAS_LIMITE_DIA', 3))      # Acima disso o dia vira dica
+DIAS_PICO = 7                 # Dias recentes comparados com a média diária dos dias anteriores da janela
+FATOR_PICO = 2.0              # Gasto do dia acima de FATOR_PICO x média diária
+MINIMO_DIAS_PICO = 28         # Histórico mínimo (dias antes dos DIAS_PICO recentes) para calcular a média diária
+MESES_CATEGORIA = 3           # Meses anteriores que formam a média de cada categoria
+MINIMO_MESES_CATEGORIA = 2    # Histórico mínimo (meses anteriores) para calcular a média da categoria
+FATOR_CATEGORIA = 1.5         # Gasto do mês na categoria acima de FATOR_CATEGORIA x média
+
+# Lista ordenada de (nome, consulta, dica) registrada pelo decorator `regra`
+REGRAS = []
+
+################################################################
+# Helper Functions
+
+def regra(nome: str, dica):
+    """ Registra uma regra de dicas: a função monta a consulta (usuario_id, hoje) e `dica` converte cada linha em uma dica
+    (ou em None, quando a linha não vira dica)
+
+    Separar a consulta da montagem permite executar as consultas de todas as regras em paralelo.
+    """
+
+    def decorator(consulta):
+        REGRAS.append((nome, consulta, dica))
+        return consulta
+    return decorator
+
+################################################################
+def periodo(ano, mes):
+    """ Índice contínuo do mês (ano * 12 + mês), para comparar meses de anos diferentes """
+    return ano * 12 + mes
+
+################################################################
+def dica_muitas_despesas_dia(linha) -> dict:
+    """ Dica de um dia com muitas despesas """
+
+    return {
+        'regra': 'muitas_despesas_dia',
+        'data': linha.data.isoformat(),
+        'quantidade': linha.quantidade,
+        'mensagem': f'Você registrou {linha.quantidade} despesas em {linha.data.strftime("%d/%m/%Y")}.'
+    }
+
+################################################################
+def dica_pico_gastos(linha) -> dict:
+    """ Dica de um dia com gasto acima da média diária dos dias anteriores (desde a primeira despesa da janela) """
+
+    if linha.primeiro is None:
+        return None
+
+    # Dias corridos da base: da primeira despesa até o último dia antes dos DIAS_PICO recentes
+    dias = (linha.corte - linha.primeiro).days + 1
+    if dias < MINIMO_DIAS_PICO:
+        return None
+
+    media = float(linha.base) / dias
+    if float(linha.total) <= media * FATOR_PICO:
+        return None
+
+    return {
+        'regra': 'pico_gastos',
+        'data': linha.data.isoformat(),
+        'total': float(linha.total),
+        'media_diaria': round(media, 2),
+        'mensagem': f'Em {linha.data.strftime("%d/%m/%Y")} você gastou R$ {float(linha.total):.2f}, '
+                    f'acima de {FATOR_PICO:g}x a sua média diária (R$ {media:.2f}).'
+    }
+
+################################################################
+def dica_categoria_acima_media(linha) -> dict:
+    """ Dica de uma categoria com gasto do mês acima da média """
+
+    return {
+        'regra': 'categoria_acima_media',
+        'categoria_id': linha.id,
+        'categoria': linha.nome,
+        'total_mes': float(linha.atual),
+        'media_mensal': round(float(linha.media), 2),
+        'mensagem': f'Seus gastos em {linha.nome} neste mês (R$ {float(linha.atual):.2f}) estão acima de '
+                    f'{FATOR_CATEGORIA:g}x a média dos últimos {linha.meses} meses (R$ {float(linha.media):.2f}).'
+    }
+
+################################################################
+# Rules
+
+@regra('muitas_despesas_dia', dica_muitas_despesas_dia)
+def muitas_despesas_dia(usuario_id, hoje: date):
+    """ Dias da janela com mais de LIMITE_DESPESAS_DIA despesas (GROUP BY data HAVING count(*) > N) """
+
+    return (
+        select(Despesa.data, func.count().label('quantidade'))
+        .where(Despesa.usuario_id == usuario_id, Despesa.data >= hoje - timedelta(days=JANELA_DIAS), Despesa.data <= hoje)
+        .group_by(Despesa.data)
+        .having(func.count() > LIMITE_DESPESAS_DIA)
+        .order_by(Despesa.data)
+    )
+
+################################################################
+@regra('pico_gastos', dica_pico_gastos)
+def pico_gastos(usuario_id, hoje: date):
+    """ Dias recentes com o gasto do dia e a base (total e primeira despesa) dos dias anteriores da janela
+
+    Os DIAS_PICO recentes ficam fora da base; a média diária e a comparação com FATOR_PICO ficam em `dica_pico_gastos`,
+    que divide pelos dias desde a primeira despesa (não pela janela inteira) e exige MINIMO_DIAS_PICO de histórico.
+    """
+
+    inicio = hoje - timedelta(days=JANELA_DIAS)
+    corte = hoje - timedelta(days=DIAS_PICO)
+    diario = (
+        select(Despesa.data.label('data'), func.sum(Despesa.valor).label('total'))
+        .where(Despesa.usuario_id == usuario_id, Despesa.data >= inicio, Despesa.data <= hoje)
+        .group_by(Despesa.data)
+        .subquery()
+    )
+    base = select(func.sum(diario.c.total)).where(diario.c.data <= corte).scalar_subquery()
+    primeiro = select(func.min(diario.c.data)).where(diario.c.data <= corte).scalar_subquery()
+
+    return (
+        select(diario.c.data, diario.c.total, base.label('base'), primeiro.label('primeiro'), literal(corte).label('corte'))
+        .where(diario.c.data > corte)
+        .order_by(diario.c.data)
+    )
+
+################################################################
+@regra('categoria_acima_media', dica_categoria_acima_media)
+def categoria_acima_media(usuario_id, hoje: date):
+    """ Categorias cujo gasto do mês atual supera FATOR_CATEGORIA vezes a média dos meses anteriores (resumo mensal)
+
+    A média divide pelos meses desde o primeiro mês com despesa do usuário na janela (até MESES_CATEGORIA),
+    e só é calculada com pelo menos MINIMO_MESES_CATEGORIA meses de histórico.
+    """
+
+    atual = periodo(hoje.year, hoje.month)
+    mes = periodo(ResumoMensal.ano, ResumoMensal.mes)
+    primeiro = (
+        select(func.min(mes))
+        .where(
+            ResumoMensal.usuario_id == usuario_id,
+            ResumoMensal.tipo == 'despesa',
+            mes >= atual - MESES_CATEGORIA,
+            mes < atual
+        )
+        .scalar_subquery()
+    )
+    meses = atual - primeiro
+    total_atual = func.coalesce(func.sum(case((mes == atual, ResumoMensal.total), else_=0)), 0)
+    media = func.coalesce(func.sum(case((mes < atual, ResumoMensal.total), else_=0)), 0) / meses
+
+    return (
+        select(Categoria.id, Categoria.nome, total_atual.label('atual'), media.label('media'), meses.label('meses'))
+        .join(Categoria, Categoria.id == ResumoMensal.categoria_id)
+        .where(
+            ResumoMensal.usuario_id == usuario_id,
+            ResumoMensal.tipo == 'despesa',
+            mes >= atual - MESES_CATEGORIA,
+            mes <= atual
+        )
+        .group_by(Categoria.id, Categoria.nome)
+        .having(meses >= MINIMO_MESES_CATEGORIA, media > 0, total_atual > media * FATOR_CATEGORIA)
+        .order_by(Categoria.nome)
+    )
+
+################################################################
+# Main
+
+class DicasService:
+
+    def __init__(self, db_conn: SQLAlchemy):
+        self.db_conn = db_conn
+
+    ################################################################
+    def consultas(self, usuario_id, hoje: date = None, regras: list = None) -> list:
+        """ Lista de (dica, consulta) das regras registradas (ou apenas das informadas), na ordem de registro """
+
+        hoje = hoje or date.today()
+        return [(dica, consulta(usuario_id, hoje)) for nome, consulta, dica in REGRAS if regras is None or nome in regras]
+
+    ################################################################
+    def montar(self, consultas: list, resultados: list) -> list:
+        """ Converte as linhas de cada consulta (na mesma ordem de `consultas`) nas dicas, descartando as linhas sem dica """
+
+        dicas = (dica(linha) for (dica, _), linhas in zip(consultas, resultados) for linha in linhas)
+        return [dica for dica in dicas if dica is not None]
+
+    ################################################################
+    def gerar(self, usuario_id, hoje: date = None, regras: list = None) -> list:
+        """ Executa as regras registradas (ou apenas as informadas), em paralelo, e retorna todas as dicas """
+
+        consultas = self.consultas(usuario_id, hoje, regras)
+        return self.montar(consultas, banco_assincrono.consultar(*(consulta for _, consulta in consultas)))
+
+################################################################
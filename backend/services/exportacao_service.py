@@ -0,0 +1,98 @@
+################################################################
+# Imports
+
+from models.despesa_model import Despesa             # Importa o modelo de despesa
+from models.receita_model import Receita             # Importa o modelo de receita
+from models.categoria_model import Categoria         # Importa o modelo de categoria
+from flask_sqlalchemy import SQLAlchemy              # Importa o SQLAlchemy para conexão com o banco de dados
+from sqlalchemy import literal, select, union_all    # União das transações em uma única consulta
+import csv                                           # Escrita das linhas em CSV
+import io                                            # Buffer de cada bloco enviado
+import json                                          # Escrita das linhas em NDJSON
+
+################################################################
+# Constants
+
+LINHAS_POR_BLOCO = 500        # Linhas lidas do cursor e enviadas ao cliente por vez
+COLUNAS = ['tipo', 'id', 'data', 'valor', 'categoria_id', 'categoria', 'descricao']
+FORMATOS = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+
+################################################################
+# Main
+
+class ExportacaoService:
+
+    def __init__(self, db_conn: SQLAlchemy):
+        self.db_conn = db_conn
+
+    ################################################################
+    def consulta_extrato(self, usuario_id: str, data_inicio=None, data_fim=None):
+        """ Despesas e receitas do usuário em uma única consulta, ordenadas por data """
+
+        consultas = []
+        for modelo, tipo in ((Despesa, 'despesa'), (Receita, 'receita')):
+            consulta = (
+                select(
+                    literal(tipo).label('tipo'),
+                    modelo.id.label('id'),
+                    modelo.data.label('data'),
+                    modelo.valor.label('valor'),
+                    modelo.categoria_id.label('categoria_id'),
+                    Categoria.nome.label('categoria'),
+                    modelo.descricao.label('descricao')
+                )
+                .outerjoin(Categoria, Categoria.id == modelo.categoria_id)
+                .where(modelo.usuario_id == usuario_id)
+            )
+            if data_inicio:
+                consulta = consulta.where(modelo.data >= data_inicio)
+            if data_fim:
+                consulta = consulta.where(modelo.data <= data_fim)
+            consultas.append(consulta)
+
+        extrato = union_all(*consultas).subquery()
+        return select(extrato).order_by(extrato.c.data, extrato.c.tipo, extrato.c.id)
+
+    ################################################################
+    def exportar(self, usuario_id: str, formato: str, data_inicio=None, data_fim=None):
+        """ Gera o extrato em blocos de texto (CSV ou NDJSON) lendo o banco por um cursor no servidor """
+
+        resultado = self.db_conn.session.execute(
+            self.consulta_extrato(usuario_id, data_inicio, data_fim),
+            execution_options={'yield_per': LINHAS_POR_BLOCO}
+        )
+
+        if formato == 'csv':
+            yield ','.join(COLUNAS) + '\r\n'
+
+        for bloco in resultado.partitions():
+            buffer = io.StringIO()
+
+            if formato == 'csv':
+                escritor = csv.writer(buffer)
+                for linha in bloco:
+                    escritor.writerow([
+                        linha.tipo, linha.id, linha.data.isoformat(), linha.valor,
+                        linha.categoria_id, linha.categoria or '', linha.descricao
+                    ])
+            else:
+                for linha in bloco:
+                    buffer.write(json.dumps(self.serialize_linha(linha), ensure_ascii=False))
+                    buffer.write('\n')
+
+            yield buffer.getvalue()
+
+    ################################################################
+    def serialize_linha(self, linha) -> dict:
+        """ Método para serializar uma linha do extrato """
+        return {
+            'tipo': linha.tipo,
+            'id': linha.id,
+            'data': linha.data.isoformat(),
+            'valor': float(linha.valor),
+            'categoria_id': linha.categoria_id,
+            'categoria': linha.categoria,
+            'descricao': linha.descricao
+        }
+
+################################################################
@@ -0,0 +1,190 @@
+################################################################
+# Imports
+
+from models.despesa_model import Despesa             # Importa o modelo de despesa
+from models.receita_model import Receita             # Importa o modelo de receita
+from models.categoria_model import Categoria         # Importa o modelo de categoria
+from flask_sqlalchemy import SQLAlchemy              # Importa o SQLAlchemy para conexão com o banco de dados
+from sqlalchemy import insert, select                # Inserções em lote e leitura dos limites
+from services.resumo_mensal_service import ResumoMensalService  # Resumo mensal por categoria
+from services.despesa_service import DespesaService  # Avisos de limite de gastos
+from utils.importacao import ler_transacoes, parse_data_importacao, parse_valor  # Leitura dos arquivos
+from utils.cache import cache_usuario                # Cache de leitura por usuário
+
+################################################################
+# Constants
+
+LOTE_IMPORTACAO = 5000        # Linhas enviadas ao banco por INSERT em lote
+MAXIMO_ERROS = 1000           # Erros detalhados no relatório (os demais são apenas contados)
+
+TIPOS = {
+    'despesa': 'despesa', 'debito': 'despesa', 'débito': 'despesa', 'saida': 'despesa', 'saída': 'despesa',
+    'receita': 'receita', 'credito': 'receita', 'crédito': 'receita', 'entrada': 'receita',
+}
+
+################################################################
+# Main
+
+class ImportacaoService:
+
+    def __init__(self, db_conn: SQLAlchemy):
+        self.db_conn = db_conn
+        self.resumo_service = ResumoMensalService(db_conn=db_conn)
+        self.despesa_service = DespesaService(db_conn=db_conn)
+
+    ################################################################
+    def importar(self, usuario_id: str, arquivo, formato: str, encoding: str = None, categoria_despesa: str = None, categoria_receita: str = None) -> dict:
+        """ Método para importar despesas e receitas de um arquivo CSV ou OFX em lotes, em uma única transação """
+
+        try:
+            categorias = self.mapa_categorias(usuario_id)
+            padroes = {
+                'despesa': self.resolver_categoria(categorias['despesa'], categoria_despesa),
+                'receita': self.resolver_categoria(categorias['receita'], categoria_receita),
+            }
+
+            lotes = {'despesa': [], 'receita': []}
+            variacoes = {}
+            afetadas = set()
+            contagem = {'despesa': 0, 'receita': 0}
+            erros = []
+            total_erros = 0
+
+            for numero, campos in ler_transacoes(arquivo, formato, encoding):
+                try:
+                    tipo, linha = self.montar_linha(usuario_id, campos, categorias, padroes)
+                except ValueError as e:
+                    total_erros += 1
+                    if len(erros) < MAXIMO_ERROS:
+                        erros.append({'linha': numero, 'erro': str(e)})
+                    continue
+
+                lotes[tipo].append(linha)
+                contagem[tipo] += 1
+                if tipo == 'despesa':
+                    afetadas.add(linha['categoria_id'])
+
+                # Acumula a variação do resumo mensal do lote
+                chave = (linha['usuario_id'], linha['categoria_id'], tipo, linha['data'].year, linha['data'].month)
+                total, quantidade = variacoes.get(chave, (0, 0))
+                variacoes[chave] = (total + linha['valor'], quantidade + 1)
+
+                if len(lotes[tipo]) >= LOTE_IMPORTACAO:
+                    self.gravar_lote(lotes, variacoes)
+
+            self.gravar_lote(lotes, variacoes)
+            self.db_conn.session.commit()
+        except Exception as e:
+            self.db_conn.session.rollback()
+            return {'error': str(e)}
+
+        # Descarta as leituras em cache do usuário
+        if contagem['despesa'] or contagem['receita']:
+            cache_usuario.invalidar(usuario_id)
+
+        return {
+            'status': True,
+            'importadas': contagem['despesa'] + contagem['receita'],
+            'despesas': contagem['despesa'],
+            'receitas': contagem['receita'],
+            'total_erros': total_erros,
+            'erros': erros,
+            'alertas': self.verificar_limites(afetadas)
+        }
+
+    ################################################################
+    def gravar_lote(self, lotes: dict, variacoes: dict) -> None:
+        """ Insere as linhas acumuladas com executemany e aplica o resumo mensal, sem comitar """
+
+        for tipo, modelo in (('despesa', Despesa), ('receita', Receita)):
+            if lotes[tipo]:
+                self.db_conn.session.execute(insert(modelo.__table__), lotes[tipo])
+                lotes[tipo].clear()
+
+        self.resumo_service.registrar_lote(variacoes)
+        variacoes.clear()
+
+    ################################################################
+    def mapa_categorias(self, usuario_id: str) -> dict:
+        """ Categorias do usuário por tipo, indexadas pelo nome (minúsculo) e pelo id """
+
+        categorias = {'despesa': {}, 'receita': {}}
+        linhas = self.db_conn.session.execute(
+            select(Categoria.id, Categoria.nome, Categoria.tipo).where(Categoria.usuario_id == usuario_id)
+        )
+        for linha in linhas:
+            if linha.tipo in categorias:
+                categorias[linha.tipo][linha.nome.strip().lower()] = linha.id
+                categorias[linha.tipo][str(linha.id)] = linha.id
+
+        return categorias
+
+    ################################################################
+    def resolver_categoria(self, categorias: dict, valor: str) -> int:
+        """ Retorna o id da categoria pelo nome ou id, None se não informada """
+
+        if valor in (None, ''):
+            return None
+
+        categoria_id = categorias.get(str(valor).strip().lower())
+        if categoria_id is None:
+            raise ValueError(f'Categoria {valor} não encontrada para este usuário.')
+        return categoria_id
+
+    ################################################################
+    def montar_linha(self, usuario_id: str, campos: dict, categorias: dict, padroes: dict) -> tuple:
+        """ Converte os campos lidos do arquivo em (tipo, linha para inserção) """
+
+        valor = parse_valor(campos.get('valor'))
+        data = parse_data_importacao(campos.get('data'))
+
+        # Sem coluna de tipo, valores negativos são despesas e positivos receitas
+        tipo_informado = (campos.get('tipo') or '').strip().lower()
+        if tipo_informado:
+            tipo = TIPOS.get(tipo_informado)
+            if tipo is None:
+                raise ValueError(f'Tipo inválido: {campos.get("tipo")}.')
+        else:
+            tipo = 'despesa' if valor < 0 else 'receita'
+
+        valor = abs(valor)
+        if not valor:
+            raise ValueError('Valor deve ser diferente de zero.')
+
+        categoria = (campos.get('categoria') or '').strip()
+        categoria_id = categorias[tipo].get(categoria.lower()) if categoria else padroes[tipo]
+        if categoria_id is None:
+            if categoria:
+                raise ValueError(f'Categoria de {tipo} não encontrada: {categoria}.')
+            raise ValueError(f'Categoria não informada e nenhuma categoria padrão de {tipo} definida.')
+
+        return tipo, {
+            'usuario_id': int(usuario_id),
+            'categoria_id': categoria_id,
+            'valor': valor,
+            'data': data,
+            'descricao': campos.get('descricao') or 'Transação importada',
+        }
+
+    ################################################################
+    def verificar_limites(self, categoria_ids: set) -> list:
+        """ Verifica o limite de gastos uma única vez por categoria de despesa afetada """
+
+        if not categoria_ids:
+            return []
+
+        linhas = self.db_conn.session.execute(
+            select(Categoria.id, Categoria.nome, Categoria.limite_gasto, Categoria.total)
+            .where(Categoria.id.in_(categoria_ids), Categoria.limite_gasto.is_not(None))
+            .order_by(Categoria.id)
+        ).all()
+
+        alertas = []
+        for linha in linhas:
+            alerta = self.despesa_service.verificar_limite(linha.nome, linha.limite_gasto, linha.total)
+            if alerta:
+                alertas.append({'categoria_id': linha.id, 'title': alerta['title'], 'message': alerta['message']})
+
+        return alertas
+
+################################################################
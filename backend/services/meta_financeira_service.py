@@ -6,6 +6,27 @@ from flask_sqlalchemy import SQLAlchemy
 from models.receita_model import Receita
 from models.despesa_model import Despesa
 from models.categoria_model import Categoria
+from sqlalchemy import and_, case, func, select
+from database.config_database import fixar_primario  # Leitura gravada de volta: banco principal
+from utils.serializacao import Campo, Esquema, data_http, decimal
+
+################################################################################
+# Constants
+
+# Campos retornados nas listagens de metas (datas no formato HTTP esperado pelo app)
+ESQUEMA_META = Esquema(
+    Campo('id', MetaFinanceira.id),
+    Campo('usuario_id', MetaFinanceira.usuario_id),
+    Campo('titulo', MetaFinanceira.titulo),
+    Campo('valor_atual', MetaFinanceira.valor_atual, decimal),
+    Campo('valor_meta', MetaFinanceira.valor_meta, decimal),
+    Campo('data_inicio', MetaFinanceira.data_inicio, data_http),
+    Campo('data_fim', MetaFinanceira.data_fim, data_http),
+    Campo('tipo', MetaFinanceira.tipo),
+    Campo('categoria_id', MetaFinanceira.categoria_id),
+    Campo('criado_em', MetaFinanceira.criado_em, data_http),
+    Campo('atualizado_em', MetaFinanceira.atualizado_em, data_http)
+)
 
 ################################################################################
 # Main
@@ -40,14 +61,67 @@ class MetaFinanceiraService:
     
     ################################################################
     def get_metas_by_usuario(self, usuario_id: str) -> dict:
-        """ Método para buscar metas financeiras de um usuário """
+        """ Método para buscar metas financeiras de um usuário com o valor atual recalculado """
 
         try:
-            # Busca todas as metas associadas ao usuário
-            metas = self.db_conn.session.query(MetaFinanceira).filter_by(usuario_id=usuario_id).all()
-            return {'status': True, 'metas': [self.serialize_meta(meta) for meta in metas]}
+            # A leitura é gravada como valor_atual: vem do banco principal, não da réplica
+            fixar_primario()
+
+            # Busca as metas e calcula o valor atual de todas em uma única consulta
+            linhas = self.db_conn.session.execute(
+                select(MetaFinanceira, self.expressao_valor_atual().label('valor_calculado'))
+                .outerjoin(Categoria, Categoria.id == MetaFinanceira.categoria_id)
+                .where(MetaFinanceira.usuario_id == usuario_id)
+                .order_by(MetaFinanceira.id)
+            ).all()
+
+            metas = []
+            alteradas = False
+            for meta, valor_calculado in linhas:
+                # Só grava as metas cujo valor mudou, evitando escrita a cada leitura
+                if valor_calculado is not None and meta.valor_atual != valor_calculado:
+                    meta.valor_atual = valor_calculado
+                    alteradas = True
+
+                serializada = self.serialize_meta(meta)
+                serializada['meta_batida'] = self.verificar_meta_batida(meta)
+                metas.append(serializada)
+
+            # Todas as alterações são gravadas em uma única transação
+            if alteradas:
+                self.db_conn.session.commit()
+
+            return {'status': True, 'metas': metas}
         except Exception as e:
+            self.db_conn.session.rollback()
             return {'error': str(e)}
+
+    ################################################################
+    def expressao_valor_atual(self):
+        """ Expressão SQL do valor atual de uma meta de acordo com o seu tipo """
+
+        def soma(modelo, por_categoria: bool = False):
+            # Soma correlacionada às colunas da meta, resolvida pelos índices (usuario_id, data) e (categoria_id, data)
+            filtros = [
+                modelo.usuario_id == MetaFinanceira.usuario_id,
+                modelo.data >= MetaFinanceira.data_inicio,
+                modelo.data <= MetaFinanceira.data_fim
+            ]
+            if por_categoria:
+                filtros.append(modelo.categoria_id == MetaFinanceira.categoria_id)
+
+            return select(func.coalesce(func.sum(modelo.valor), 0)).where(*filtros).correlate(MetaFinanceira).scalar_subquery()
+
+        return case(
+            (MetaFinanceira.tipo == 'geral', soma(Receita) - soma(Despesa)),
+            (MetaFinanceira.tipo == 'receita', soma(Receita)),
+            (MetaFinanceira.tipo == 'despesa', soma(Despesa)),
+            (and_(MetaFinanceira.tipo == 'categoria', Categoria.tipo == 'receita'), soma(Receita, por_categoria=True)),
+            (and_(MetaFinanceira.tipo == 'categoria', Categoria.tipo == 'despesa'), soma(Despesa, por_categoria=True)),
+            # Meta de categoria cuja categoria não existe mais mantém o valor gravado
+            (and_(MetaFinanceira.tipo == 'categoria', MetaFinanceira.categoria_id.isnot(None)), MetaFinanceira.valor_atual),
+            else_=0
+        )
         
     ################################################################
     def delete_meta(self, meta_id: str) -> dict:
@@ -97,19 +171,7 @@ class MetaFinanceiraService:
     ################################################################
     def serialize_meta(self, meta: MetaFinanceira) -> dict:
         """ Método para serializar uma meta financeira """
-        return {
-            'id': meta.id,
-            'usuario_id': meta.usuario_id,
-            'titulo': meta.titulo,
-            'valor_atual': meta.valor_atual,
-            'valor_meta': meta.valor_meta,
-            'data_inicio': meta.data_inicio,
-            'data_fim': meta.data_fim,
-            'tipo': meta.tipo,
-            'categoria_id': meta.categoria_id,
-            'criado_em': meta.criado_em,
-            'atualizado_em': meta.atualizado_em
-        }
+        return ESQUEMA_META.serializar_objeto(meta)
 
     def atualizar_valor_atual(self, meta_id: str) -> dict:
         """Atualiza o valor atual da meta baseado nas transações do período"""
@@ -143,72 +205,28 @@ class MetaFinanceiraService:
                 usuario_id = int(meta.usuario_id)
 
             valor_atual = 0.0
-            
+
             if meta.tipo == 'geral':
                 # Para meta geral: receitas - despesas
-                receitas = self.db_conn.session.query(Receita).filter(
-                    Receita.usuario_id == usuario_id,
-                    Receita.data >= meta.data_inicio,
-                    Receita.data <= meta.data_fim
-                ).all()
-                
-                despesas = self.db_conn.session.query(Despesa).filter(
-                    Despesa.usuario_id == usuario_id,
-                    Despesa.data >= meta.data_inicio,
-                    Despesa.data <= meta.data_fim
-                ).all()
-                
-                total_receitas = sum(r.valor for r in receitas)
-                total_despesas = sum(d.valor for d in despesas)
-                valor_atual = total_receitas - total_despesas
-                
-                
+                valor_atual = self.somar(Receita, usuario_id, meta) - self.somar(Despesa, usuario_id, meta)
+
             elif meta.tipo == 'receita':
                 # Para meta de receita: apenas receitas
-                receitas = self.db_conn.session.query(Receita).filter(
-                    Receita.usuario_id == usuario_id,
-                    Receita.data >= meta.data_inicio,
-                    Receita.data <= meta.data_fim
-                ).all()
-                
-                valor_atual = sum(r.valor for r in receitas)
-                
+                valor_atual = self.somar(Receita, usuario_id, meta)
+
             elif meta.tipo == 'despesa':
                 # Para meta de despesa: apenas despesas
-                despesas = self.db_conn.session.query(Despesa).filter(
-                    Despesa.usuario_id == usuario_id,
-                    Despesa.data >= meta.data_inicio,
-                    Despesa.data <= meta.data_fim
-                ).all()
-                
-                valor_atual = sum(d.valor for d in despesas)
-                
+                valor_atual = self.somar(Despesa, usuario_id, meta)
+
             elif meta.tipo == 'categoria' and meta.categoria_id:
                 # Verifica se a categoria é de receita ou despesa
                 categoria = self.db_conn.session.query(Categoria).filter_by(id=meta.categoria_id).first()
                 if not categoria:
                     return {'error': 'Categoria não encontrada'}
 
-                if categoria.tipo == 'receita':
-                    # Para categoria de receita: apenas receitas da categoria
-                    receitas = self.db_conn.session.query(Receita).filter(
-                        Receita.usuario_id == usuario_id,
-                        Receita.categoria_id == meta.categoria_id,
-                        Receita.data >= meta.data_inicio,
-                        Receita.data <= meta.data_fim
-                    ).all()
-                    
-                    valor_atual = sum(r.valor for r in receitas)
-                else:
-                    # Para categoria de despesa: apenas despesas da categoria
-                    despesas = self.db_conn.session.query(Despesa).filter(
-                        Despesa.usuario_id == usuario_id,
-                        Despesa.categoria_id == meta.categoria_id,
-                        Despesa.data >= meta.data_inicio,
-                        Despesa.data <= meta.data_fim
-                    ).all()
-                    
-                    valor_atual = sum(d.valor for d in despesas)
+                # Soma apenas as transações da categoria, na tabela correspondente ao seu tipo
+                modelo = Receita if categoria.tipo == 'receita' else Despesa
+                valor_atual = self.somar(modelo, usuario_id, meta, meta.categoria_id)
 
             # Se não for uma meta temporária, atualiza no banco
             if meta_id != 'temp':
@@ -228,6 +246,20 @@ class MetaFinanceiraService:
             print(f"Erro ao atualizar valor atual: {str(e)}")
             return {'error': str(e)}
 
+    def somar(self, modelo, usuario_id: int, meta, categoria_id: str = None):
+        """ Soma no banco o valor das transações do usuário no período da meta """
+
+        query = self.db_conn.session.query(func.coalesce(func.sum(modelo.valor), 0)).filter(
+            modelo.usuario_id == usuario_id,
+            modelo.data >= meta.data_inicio,
+            modelo.data <= meta.data_fim
+        )
+        if categoria_id:
+            query = query.filter(modelo.categoria_id == categoria_id)
+
+        return query.scalar()
+
+    ################################################################
     def verificar_meta_batida(self, meta: MetaFinanceira) -> bool:
         """Verifica se a meta foi batida baseado no tipo"""
         try:
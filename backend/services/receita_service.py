@@ -6,6 +6,25 @@ from flask_sqlalchemy import SQLAlchemy   # Importa o SQLAlchemy para conexão c
 from datetime import datetime             # Importa datetime para manipulação de datas
 from models.user_model import User             # Importa o modelo de usuário
 from models.categoria_model import Categoria         # Importa o modelo de categoria
+from utils.paginacao import paginar, LIMITE_PADRAO   # Paginação por chave (data, id)
+from services.resumo_mensal_service import ResumoMensalService  # Resumo mensal por categoria
+from utils.cache import cache_usuario                # Cache de leitura por usuário
+from utils.serializacao import Campo, Esquema, data_iso, decimal  # Serialização por esquema
+from services.categoria_service import ESQUEMA_CATEGORIA_RESUMIDA  # Campos das listas de categorias
+
+################################################################
+# Constants
+
+# Campos retornados nas listagens de receitas
+ESQUEMA_RECEITA = Esquema(
+    Campo('id', Receita.id),
+    Campo('usuario_id', Receita.usuario_id),
+    Campo('categoria_id', Receita.categoria_id),
+    Campo('valor', Receita.valor, decimal),
+    Campo('data', Receita.data, data_iso),
+    Campo('descricao', Receita.descricao),
+    Campo('criado_em', Receita.criado_em, data_iso)
+)
 
 ################################################################
 # Main
@@ -14,6 +33,7 @@ class ReceitaService:
 
     def __init__(self, db_conn: SQLAlchemy):
         self.db_conn = db_conn
+        self.resumo_service = ResumoMensalService(db_conn=db_conn)
 
     ################################################################
     def create_receita(self, usuario_id: str, categoria_id: str, valor: float, data: str, descricao: str) -> dict:
@@ -33,7 +53,13 @@ class ReceitaService:
                 descricao=descricao
             )
             self.db_conn.session.add(receita)
+
+            # Atualiza o resumo mensal na mesma transação da inserção
+            self.resumo_service.registrar(usuario_id, categoria_id, 'receita', data, valor)
             self.db_conn.session.commit()
+
+            # Descarta as leituras em cache do usuário
+            cache_usuario.invalidar(usuario_id)
         except Exception as e:
             print(f"Error creating receita: {e}")
             return {'error': str(e)}
@@ -41,13 +67,17 @@ class ReceitaService:
         return {'message': 'Receita criada com sucesso!'}
 
     ################################################################
-    def get_receitas_by_usuario(self, usuario_id: str) -> dict:
-        """ Método para buscar receitas de um usuário """
+    def get_receitas_by_usuario(self, usuario_id: str, data_inicio=None, data_fim=None, cursor: tuple = None, limite: int = LIMITE_PADRAO) -> dict:
+        """ Método para buscar receitas de um usuário, paginadas da mais recente para a mais antiga """
 
         try:
-            # Busca todas as receitas associadas ao usuário
-            receitas = self.db_conn.session.query(Receita).filter_by(usuario_id=usuario_id).all()
-            return {'status': True, 'receitas': [self.serialize_receita(r) for r in receitas]}
+            # Busca uma página das receitas do usuário no período informado
+            consulta = ESQUEMA_RECEITA.consulta().where(Receita.usuario_id == usuario_id)
+            receitas, proximo_cursor = paginar(
+                consulta, Receita.data, Receita.id, data_inicio, data_fim, cursor, limite,
+                ler=lambda consulta: ESQUEMA_RECEITA.ler(self.db_conn.session, consulta)
+            )
+            return {'status': True, 'receitas': ESQUEMA_RECEITA.serializar_lista(receitas), 'proximo_cursor': proximo_cursor}
         except Exception as e:
             return {'error': str(e)}
 
@@ -62,8 +92,15 @@ class ReceitaService:
             if not receita:
                 return {'status': False, 'message': 'Receita não encontrada'}
 
+            usuario_id = receita.usuario_id
             self.db_conn.session.delete(receita)
+
+            # Retira a receita do resumo mensal na mesma transação da remoção
+            self.resumo_service.registrar(usuario_id, receita.categoria_id, 'receita', receita.data, -receita.valor, -1)
             self.db_conn.session.commit()
+
+            # Descarta as leituras em cache do usuário
+            cache_usuario.invalidar(usuario_id)
         except Exception as e:
             return {'error': str(e)}
 
@@ -72,24 +109,33 @@ class ReceitaService:
     ################################################################
     def total_receitas(self, usuario_id: str) -> dict:
         """ Método para calcular o total de receitas de um usuário """
-        try:
-            # Busca todas as receitas associadas ao usuário
-            receitas = self.db_conn.session.query(Receita).filter_by(usuario_id=usuario_id).all()
-            total = sum(receita.valor for receita in receitas)
-            return {'status': True, 'total': total}
-        except Exception as e:
-            return {'error': str(e)}
+
+        def carregar() -> dict:
+            try:
+                # Soma o resumo mensal do usuário (uma linha por categoria e mês)
+                total = self.resumo_service.total_usuario(usuario_id, 'receita')
+                return {'status': True, 'total': total}
+            except Exception as e:
+                return {'error': str(e)}
+
+        return cache_usuario.buscar(usuario_id, 'receita:total', carregar)
     
     ################################################################
     def get_categorias_receitas(self, usuario_id: str) -> dict:
         """ Método para buscar categorias de receitas de um usuário """
-        
-        try:
-            # Busca todas as receitas associadas ao usuário
-            categorias = self.db_conn.session.query(Categoria).filter_by(usuario_id=usuario_id, tipo='receita').all()
-            return {'status': True, 'categorias': [self.serialize_categoria(c) for c in categorias]}
-        except Exception as e:
-            return {'error': str(e)}
+
+        def carregar() -> dict:
+            try:
+                # Busca todas as receitas associadas ao usuário
+                categorias = ESQUEMA_CATEGORIA_RESUMIDA.ler_serializado(
+                    self.db_conn.session,
+                    ESQUEMA_CATEGORIA_RESUMIDA.consulta().where(Categoria.usuario_id == usuario_id, Categoria.tipo == 'receita')
+                )
+                return {'status': True, 'categorias': categorias}
+            except Exception as e:
+                return {'error': str(e)}
+
+        return cache_usuario.buscar(usuario_id, 'receita:categorias', carregar)
     
     ################################################################
     def get_receitas_by_categoria(self, categoria_id: str) -> dict:
@@ -97,33 +143,19 @@ class ReceitaService:
         
         try:
             # Busca todas as receitas associadas ao usuário e à categoria
-            receitas = self.db_conn.session.query(Receita).filter_by(categoria_id=categoria_id).all()
-            return {'status': True, 'receitas': [self.serialize_receita(d) for d in receitas]}
+            receitas = ESQUEMA_RECEITA.ler_serializado(self.db_conn.session, ESQUEMA_RECEITA.consulta().where(Receita.categoria_id == categoria_id))
+            return {'status': True, 'receitas': receitas}
         except Exception as e:
             return {'error': str(e)}
 
     ################################################################
     def serialize_categoria(self, categoria: Categoria) -> dict:
         """ Método para serializar uma categoria """
-        return {
-            'id': categoria.id,
-            'usuario_id': categoria.usuario_id,
-            'nome': categoria.nome,
-            'tipo': categoria.tipo,
-            'criado_em': categoria.criado_em.isoformat()
-        }
+        return ESQUEMA_CATEGORIA_RESUMIDA.serializar_objeto(categoria)
 
     ################################################################
     def serialize_receita(self, receita: Receita) -> dict:
         """ Método para serializar uma receita """
-        return {
-            'id': receita.id,
-            'usuario_id': receita.usuario_id,
-            'categoria_id': receita.categoria_id,
-            'valor': float(receita.valor),
-            'data': receita.data.isoformat(),
-            'descricao': receita.descricao,
-            'criado_em': receita.criado_em.isoformat()
-        }
+        return ESQUEMA_RECEITA.serializar_objeto(receita)
 
 ################################################################
\ No newline at end of file
@@ -0,0 +1,121 @@
+################################################################
+# Imports
+
+from models.despesa_model import Despesa             # Importa o modelo de despesa
+from models.receita_model import Receita             # Importa o modelo de receita
+from models.categoria_model import Categoria         # Importa o modelo de categoria
+from models.resumo_mensal_model import ResumoMensal  # Importa o modelo do resumo mensal
+from flask_sqlalchemy import SQLAlchemy              # Importa o SQLAlchemy para conexão com o banco de dados
+from sqlalchemy import func, literal, select, tuple_, union_all  # Importa as construções SQL usadas na agregação
+from datetime import date, timedelta                 # Importa date para o período do relatório
+
+################################################################
+# Main
+
+class RelatorioService:
+
+    def __init__(self, db_conn: SQLAlchemy):
+        self.db_conn = db_conn
+
+    ################################################################
+    def get_graficos(self, usuario_id: str, data_inicio: date, data_fim: date) -> dict:
+        """ Método para agregar despesas e receitas por categoria e por mês em um período """
+
+        try:
+            # Períodos de meses completos são respondidos pelo resumo mensal
+            if self.meses_completos(data_inicio, data_fim):
+                linhas = self.db_conn.session.execute(
+                    select(
+                        ResumoMensal.tipo,
+                        ResumoMensal.categoria_id,
+                        Categoria.nome,
+                        ResumoMensal.ano,
+                        ResumoMensal.mes,
+                        ResumoMensal.total,
+                        ResumoMensal.quantidade
+                    )
+                    .outerjoin(Categoria, Categoria.id == ResumoMensal.categoria_id)
+                    .where(
+                        ResumoMensal.usuario_id == usuario_id,
+                        ResumoMensal.quantidade > 0,
+                        tuple_(ResumoMensal.ano, ResumoMensal.mes) >= tuple_(data_inicio.year, data_inicio.month),
+                        tuple_(ResumoMensal.ano, ResumoMensal.mes) <= tuple_(data_fim.year, data_fim.month)
+                    )
+                ).all()
+
+                return self.montar_graficos(linhas, data_inicio, data_fim)
+
+            # Une despesas e receitas do período em uma única fonte de transações
+            despesas = select(
+                literal('despesa').label('tipo'), Despesa.categoria_id, Despesa.data, Despesa.valor
+            ).where(Despesa.usuario_id == usuario_id, Despesa.data >= data_inicio, Despesa.data <= data_fim)
+
+            receitas = select(
+                literal('receita').label('tipo'), Receita.categoria_id, Receita.data, Receita.valor
+            ).where(Receita.usuario_id == usuario_id, Receita.data >= data_inicio, Receita.data <= data_fim)
+
+            transacoes = union_all(despesas, receitas).subquery()
+            ano = func.extract('year', transacoes.c.data)
+            mes = func.extract('month', transacoes.c.data)
+
+            # Agrupa por tipo, categoria e mês em uma única consulta
+            linhas = self.db_conn.session.execute(
+                select(
+                    transacoes.c.tipo,
+                    transacoes.c.categoria_id,
+                    Categoria.nome,
+                    ano.label('ano'),
+                    mes.label('mes'),
+                    func.sum(transacoes.c.valor).label('total'),
+                    func.count().label('quantidade')
+                )
+                .outerjoin(Categoria, Categoria.id == transacoes.c.categoria_id)
+                .group_by(transacoes.c.tipo, transacoes.c.categoria_id, Categoria.nome, ano, mes)
+            ).all()
+
+            return self.montar_graficos(linhas, data_inicio, data_fim)
+        except Exception as e:
+            return {'error': str(e)}
+
+    ################################################################
+    def meses_completos(self, data_inicio: date, data_fim: date) -> bool:
+        """ Verifica se o período começa no primeiro e termina no último dia de um mês """
+        return data_inicio.day == 1 and (data_fim + timedelta(days=1)).day == 1
+
+    ################################################################
+    def montar_graficos(self, linhas: list, data_inicio: date, data_fim: date) -> dict:
+        """ Método para montar os totais por categoria e a série mensal a partir das linhas agrupadas """
+
+        totais = {'despesa': 0.0, 'receita': 0.0}
+        por_categoria = {'despesa': {}, 'receita': {}}
+        mensal = {}
+        quantidade = 0
+
+        for linha in linhas:
+            valor = float(linha.total)
+            totais[linha.tipo] += valor
+            quantidade += linha.quantidade
+
+            categoria = por_categoria[linha.tipo].setdefault(linha.categoria_id, {
+                'categoria_id': linha.categoria_id,
+                'nome': linha.nome or f'Categoria {linha.categoria_id} (não encontrada)',
+                'total': 0.0
+            })
+            categoria['total'] += valor
+
+            chave = f'{int(linha.ano):04d}-{int(linha.mes):02d}'
+            mes = mensal.setdefault(chave, {'mes': chave, 'despesas': 0.0, 'receitas': 0.0})
+            mes['despesas' if linha.tipo == 'despesa' else 'receitas'] += valor
+
+        return {
+            'status': True,
+            'periodo': {'inicio': data_inicio.isoformat(), 'fim': data_fim.isoformat()},
+            'quantidade': quantidade,
+            'total_despesas': totais['despesa'],
+            'total_receitas': totais['receita'],
+            'despesas_por_categoria': sorted(por_categoria['despesa'].values(), key=lambda c: c['total'], reverse=True),
+            'receitas_por_categoria': sorted(por_categoria['receita'].values(), key=lambda c: c['total'], reverse=True),
+            'mensal': [mensal[chave] for chave in sorted(mensal)]
+        }
+
+################################################################
@@ -0,0 +1,259 @@
+################################################################
+# Imports
+
+from models.resumo_mensal_model import ResumoMensal  # Importa o modelo do resumo mensal
+from models.despesa_model import Despesa             # Importa o modelo de despesa
+from models.receita_model import Receita             # Importa o modelo de receita
+from models.categoria_model import Categoria         # Importa o modelo de categoria (total acumulado)
+from flask_sqlalchemy import SQLAlchemy              # Importa o SQLAlchemy para conexão com o banco de dados
+from sqlalchemy import Integer, bindparam, cast, delete, func, insert, literal, select, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite   # Upsert específico de cada banco
+from decimal import Decimal                          # Valores monetários
+from datetime import date                            # Datas das transações
+
+################################################################
+# Constants
+
+CHAVE = ['usuario_id', 'categoria_id', 'tipo', 'ano', 'mes']
+
+################################################################
+# Helper Functions
+
+def dinheiro(valor) -> Decimal:
+    """ Normaliza um valor monetário para Decimal com duas casas """
+    return Decimal(str(valor or 0)).quantize(Decimal('0.01'))
+
+################################################################
+def sql_agregado(usuario_id: int = None, categoria_id: int = None):
+    """ SELECT que agrega despesas e receitas por (usuário, categoria, tipo, ano, mês) """
+
+    consultas = []
+    for modelo, tipo in ((Despesa, 'despesa'), (Receita, 'receita')):
+        ano = cast(func.extract('year', modelo.data), Integer)
+        mes = cast(func.extract('month', modelo.data), Integer)
+
+        consulta = select(
+            modelo.usuario_id.label('usuario_id'),
+            modelo.categoria_id.label('categoria_id'),
+            literal(tipo).label('tipo'),
+            ano.label('ano'),
+            mes.label('mes'),
+            func.sum(modelo.valor).label('total'),
+            func.count().label('quantidade')
+        ).group_by(modelo.usuario_id, modelo.categoria_id, ano, mes)
+
+        if usuario_id is not None:
+            consulta = consulta.where(modelo.usuario_id == usuario_id)
+        if categoria_id is not None:
+            consulta = consulta.where(modelo.categoria_id == categoria_id)
+
+        consultas.append(consulta)
+
+    return union_all(*consultas)
+
+################################################################
+def sql_total_categoria(usuario_id: int = None, categoria_id: int = None):
+    """ UPDATE que recalcula o total acumulado das categorias a partir do resumo mensal """
+
+    tabela = Categoria.__table__
+    total = select(func.coalesce(func.sum(ResumoMensal.total), 0)).where(ResumoMensal.categoria_id == tabela.c.id)
+
+    comando = update(tabela).values(total=total.scalar_subquery())
+    if usuario_id is not None:
+        comando = comando.where(tabela.c.usuario_id == usuario_id)
+    if categoria_id is not None:
+        comando = comando.where(tabela.c.id == categoria_id)
+
+    return comando
+
+################################################################
+def sql_reconstrucao(usuario_id: int = None, categoria_id: int = None) -> list:
+    """ Comandos que apagam e recriam o resumo mensal a partir das transações """
+
+    remocao = delete(ResumoMensal)
+    if usuario_id is not None:
+        remocao = remocao.where(ResumoMensal.usuario_id == usuario_id)
+    if categoria_id is not None:
+        remocao = remocao.where(ResumoMensal.categoria_id == categoria_id)
+
+    insercao = insert(ResumoMensal).from_select(
+        CHAVE + ['total', 'quantidade'],
+        sql_agregado(usuario_id, categoria_id)
+    )
+
+    return [remocao, insercao]
+
+################################################################
+# Main
+
+class ResumoMensalService:
+
+    def __init__(self, db_conn: SQLAlchemy):
+        self.db_conn = db_conn
+
+    ################################################################
+    def registrar(self, usuario_id: int, categoria_id: int, tipo: str, data: date, valor, quantidade: int = 1) -> None:
+        """ Soma (ou subtrai, com valores negativos) uma transação no resumo do mês, sem comitar """
+
+        self.registrar_lote({
+            (int(usuario_id), int(categoria_id), tipo, data.year, data.month): (dinheiro(valor), quantidade)
+        })
+
+    ################################################################
+    def registrar_lote(self, variacoes: dict) -> None:
+        """ Aplica variações {(usuario_id, categoria_id, tipo, ano, mes): (total, quantidade)} na sessão atual """
+
+        if not variacoes:
+            return
+
+        self.registrar_totais(variacoes)
+
+        linhas = [
+            dict(zip(CHAVE, chave), total=total, quantidade=quantidade)
+            for chave, (total, quantidade) in variacoes.items()
+        ]
+
+        dialeto = self.db_conn.session.get_bind().dialect.name
+        if dialeto in ('postgresql', 'sqlite'):
+            # Upsert atômico: incrementa a linha do mês ou cria caso não exista
+            modulo = postgresql if dialeto == 'postgresql' else sqlite
+            comando = modulo.insert(ResumoMensal)
+            comando = comando.on_conflict_do_update(
+                index_elements=CHAVE,
+                set_={
+                    'total': ResumoMensal.__table__.c.total + comando.excluded.total,
+                    'quantidade': ResumoMensal.__table__.c.quantidade + comando.excluded.quantidade
+                }
+            )
+            self.db_conn.session.execute(comando, linhas)
+            return
+
+        # Demais bancos: atualiza e, se a linha não existir, insere
+        for linha in linhas:
+            atualizadas = self.db_conn.session.query(ResumoMensal).filter_by(
+                **{coluna: linha[coluna] for coluna in CHAVE}
+            ).update({
+                ResumoMensal.total: ResumoMensal.total + linha['total'],
+                ResumoMensal.quantidade: ResumoMensal.quantidade + linha['quantidade']
+            }, synchronize_session=False)
+
+            if not atualizadas:
+                self.db_conn.session.add(ResumoMensal(**linha))
+
+    ################################################################
+    def registrar_totais(self, variacoes: dict) -> None:
+        """ Soma as variações no total acumulado de cada categoria, na mesma transação do resumo """
+
+        totais = {}
+        for (_, categoria_id, *_), (total, _) in variacoes.items():
+            totais[categoria_id] = totais.get(categoria_id, 0) + total
+
+        # Variações que se anulam (ex.: conversão de tipo) não mudam o total
+        totais = {categoria_id: total for categoria_id, total in totais.items() if total}
+        if not totais:
+            return
+
+        # Um UPDATE por categoria pela chave primária, enviado em lote (executemany)
+        tabela = Categoria.__table__
+        self.db_conn.session.execute(
+            update(tabela).where(tabela.c.id == bindparam('b_id')).values(total=tabela.c.total + bindparam('b_total')),
+            [{'b_id': categoria_id, 'b_total': total} for categoria_id, total in totais.items()]
+        )
+
+    ################################################################
+    def reconstruir(self, usuario_id: int = None, categoria_id: int = None) -> None:
+        """ Recria o resumo (todo, de um usuário ou de uma categoria) e o total das categorias na sessão atual, sem comitar """
+
+        for comando in sql_reconstrucao(usuario_id, categoria_id):
+            self.db_conn.session.execute(comando)
+
+        self.db_conn.session.execute(sql_total_categoria(usuario_id, categoria_id))
+
+    ################################################################
+    def remover_categoria(self, categoria_id: int) -> None:
+        """ Remove o resumo de uma categoria, sem comitar """
+
+        self.db_conn.session.execute(delete(ResumoMensal).where(ResumoMensal.categoria_id == categoria_id))
+
+    ################################################################
+    def verificar(self, usuario_id: int = None) -> list:
+        """ Compara o resumo com as transações e retorna as divergências encontradas """
+
+        esperado = {
+            tuple(linha[:5]): (dinheiro(linha.total), linha.quantidade)
+            for linha in self.db_conn.session.execute(sql_agregado(usuario_id))
+        }
+
+        consulta = select(ResumoMensal)
+        if usuario_id is not None:
+            consulta = consulta.where(ResumoMensal.usuario_id == usuario_id)
+
+        atual = {
+            (r.usuario_id, r.categoria_id, r.tipo, r.ano, r.mes): (dinheiro(r.total), r.quantidade)
+            for r in self.db_conn.session.scalars(consulta)
+            if r.quantidade or r.total
+        }
+
+        divergencias = []
+        for chave in sorted(set(esperado) | set(atual), key=str):
+            if esperado.get(chave) != atual.get(chave):
+                divergencias.append({
+                    **dict(zip(CHAVE, chave)),
+                    'esperado': esperado.get(chave),
+                    'atual': atual.get(chave)
+                })
+
+        return divergencias
+
+    ################################################################
+    def verificar_totais(self, usuario_id: int = None) -> list:
+        """ Compara o total acumulado de cada categoria com a soma das transações e retorna as divergências """
+
+        agregado = sql_agregado(usuario_id).subquery()
+        esperado = (
+            select(agregado.c.categoria_id, func.sum(agregado.c.total).label('total'))
+            .group_by(agregado.c.categoria_id)
+            .subquery()
+        )
+
+        consulta = (
+            select(Categoria.id, Categoria.usuario_id, Categoria.total, esperado.c.total.label('esperado'))
+            .outerjoin(esperado, esperado.c.categoria_id == Categoria.id)
+            .order_by(Categoria.id)
+        )
+        if usuario_id is not None:
+            consulta = consulta.where(Categoria.usuario_id == usuario_id)
+
+        return [
+            {
+                'usuario_id': linha.usuario_id,
+                'categoria_id': linha.id,
+                'esperado': dinheiro(linha.esperado),
+                'atual': dinheiro(linha.total)
+            }
+            for linha in self.db_conn.session.execute(consulta)
+            if dinheiro(linha.esperado) != dinheiro(linha.total)
+        ]
+
+    ################################################################
+    def total_usuario(self, usuario_id: int, tipo: str):
+        """ Total de despesas ou receitas de um usuário a partir do resumo """
+
+        return self.db_conn.session.query(func.coalesce(func.sum(ResumoMensal.total), 0)).filter(
+            ResumoMensal.usuario_id == usuario_id,
+            ResumoMensal.tipo == tipo
+        ).scalar()
+
+    ################################################################
+    def total_categoria(self, categoria_id: int, referencia: date = None):
+        """ Total de uma categoria, de todo o período ou apenas do mês de referência """
+
+        query = self.db_conn.session.query(func.coalesce(func.sum(ResumoMensal.total), 0)).filter(
+            ResumoMensal.categoria_id == categoria_id
+        )
+        if referencia is not None:
+            query = query.filter(ResumoMensal.ano == referencia.year, ResumoMensal.mes == referencia.month)
+
+        return query.scalar()
+
+################################################################
@@ -4,7 +4,7 @@
 from models.user_model import User          # Importa o modelo de usuário
 from flask_sqlalchemy import SQLAlchemy     # Importa o SQLAlchemy para conexão com o banco de dados
 from datetime import datetime, timedelta    # Importa datetime e timedelta 
-import bcrypt                               # Importa bcrypt para criptografia
+from utils.senhas import pool_senhas        # Pool limitado para o bcrypt
 import jwt as pyjwt                         # Importa jwt para token de sessão
 
 ################################################################
@@ -14,6 +14,7 @@ class UserService:
 
     def __init__(self, db_conn: SQLAlchemy):
         self.db_conn = db_conn
+        self.pool_senhas = pool_senhas
 
     ################################################################
     def login(self, email: str, password: str) -> bool:
@@ -28,8 +29,8 @@ class UserService:
 
         user = user["user"]
 
-        # Verifica se a senha fornecida corresponde à senha armazenada
-        if bcrypt.checkpw(password.encode('utf-8'), user.senha.encode('utf-8')):
+        # Verifica se a senha fornecida corresponde à senha armazenada (no pool de senhas; pode levantar SenhaSobrecarga)
+        if self.pool_senhas.verificar(password, user.senha):
             
             # Cria o token de sessão vinculado com o email e id
             # Duração de 1 dia.
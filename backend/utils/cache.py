@@ -0,0 +1,275 @@
+################################################################
+# Imports
+
+import copy                                  # Cópia dos valores devolvidos pelo cache em memória
+import os                                    # Configuração por variáveis de ambiente
+import hashlib                               # Chave dos tokens verificados
+import pickle                                # Serialização dos valores no Redis
+import threading                             # Acesso concorrente ao cache em memória
+import time                                  # Expiração das entradas
+from collections import OrderedDict          # Ordem de uso para o LRU
+from database.config_database import fixar_primario  # Leituras guardadas no cache vêm do banco principal
+
+################################################################
+# Constants
+
+TTL_PADRAO = int(os.environ.get('CACHE_TTL', 300))           # Segundos
+TAMANHO_PADRAO = int(os.environ.get('CACHE_TAMANHO', 10000))  # Entradas no cache em memória
+PREFIXO = 'poupabem'
+TOKENS_TAMANHO = int(os.environ.get('TOKEN_CACHE_TAMANHO', 10000))  # Tokens verificados em memória (0 desliga)
+TOKENS_TTL = int(os.environ.get('TOKEN_CACHE_TTL', 300))            # Segundos máximos de um token no cache
+
+################################################################
+# Backends
+
+class CacheMemoria:
+    """ Cache LRU em memória do processo, com expiração por TTL
+
+    Cada processo tem o seu: a invalidação de um worker não chega aos demais. Use apenas com um único processo.
+    """
+
+    def __init__(self, tamanho: int = TAMANHO_PADRAO, ttl: int = TTL_PADRAO):
+        self.tamanho = tamanho
+        self.ttl = ttl
+        self.entradas = OrderedDict()
+        self.contadores = {}   # Fora do LRU: descartar uma geração faria entradas antigas voltarem a valer
+        self.lock = threading.Lock()
+
+    ################################################################
+    def get(self, chave: str):
+        """ Retorna o valor da chave ou None se ausente ou expirado """
+
+        with self.lock:
+            entrada = self.entradas.get(chave)
+            if entrada is None:
+                return None
+
+            valor, expira_em = entrada
+            if expira_em is not None and expira_em <= time.monotonic():
+                del self.entradas[chave]
+                return None
+
+            self.entradas.move_to_end(chave)
+
+        # Cópia: quem recebe o valor pode alterá-lo sem afetar as próximas leituras
+        return copy.deepcopy(valor)
+
+    ################################################################
+    def set(self, chave: str, valor, ttl: int = None) -> None:
+        """ Grava o valor, descartando a entrada menos usada se o cache estiver cheio """
+
+        ttl = self.ttl if ttl is None else ttl
+        expira_em = time.monotonic() + ttl if ttl else None
+
+        valor = copy.deepcopy(valor)
+        with self.lock:
+            self.entradas[chave] = (valor, expira_em)
+            self.entradas.move_to_end(chave)
+            while len(self.entradas) > self.tamanho:
+                self.entradas.popitem(last=False)
+
+    ################################################################
+    def incr(self, chave: str) -> int:
+        """ Incrementa um contador sem expiração (nunca descartado pelo LRU) e retorna o novo valor """
+
+        with self.lock:
+            self.contadores[chave] = self.contadores.get(chave, 0) + 1
+            return self.contadores[chave]
+
+    ################################################################
+    def contador(self, chave: str) -> int:
+        """ Valor atual de um contador criado por incr (0 se ausente) """
+        return self.contadores.get(chave, 0)
+
+    ################################################################
+    def __len__(self) -> int:
+        return len(self.entradas)
+
+################################################################
+class CacheRedis:
+    """ Cache em um servidor compatível com Redis (qualquer cliente com get, set, incr e dbsize) """
+
+    def __init__(self, cliente, ttl: int = TTL_PADRAO):
+        self.cliente = cliente
+        self.ttl = ttl
+
+    ################################################################
+    def get(self, chave: str):
+        """ Retorna o valor da chave ou None se ausente """
+
+        valor = self.cliente.get(chave)
+        return None if valor is None else pickle.loads(valor)
+
+    ################################################################
+    def set(self, chave: str, valor, ttl: int = None) -> None:
+        """ Grava o valor com expiração definida pelo servidor """
+
+        ttl = self.ttl if ttl is None else ttl
+        self.cliente.set(chave, pickle.dumps(valor), ex=ttl or None)
+
+    ################################################################
+    def incr(self, chave: str) -> int:
+        """ Incrementa um contador atômico no servidor """
+        return int(self.cliente.incr(chave))
+
+    ################################################################
+    def contador(self, chave: str) -> int:
+        """ Valor atual de um contador criado por incr (guardado como inteiro, sem pickle) """
+
+        valor = self.cliente.get(chave)
+        return int(valor) if valor is not None else 0
+
+    ################################################################
+    def __len__(self) -> int:
+        return int(self.cliente.dbsize())
+
+################################################################
+# Main
+
+class CacheUsuario:
+    """ Cache de leitura por usuário, invalidado por geração a cada escrita do usuário """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.acertos = 0
+        self.falhas = 0
+        self.invalidacoes = 0
+        self.lock = threading.Lock()  # Contadores incrementados pelas threads das requisições
+
+    ################################################################
+    def chave(self, usuario_id, nome: str) -> str:
+        """ Monta a chave de uma leitura incluindo a geração atual do usuário """
+
+        geracao = self.backend.contador(f'{PREFIXO}:geracao:{usuario_id}')
+        return f'{PREFIXO}:u{usuario_id}:g{geracao}:{nome}'
+
+    ################################################################
+    def buscar(self, usuario_id, nome: str, carregar):
+        """ Retorna a leitura em cache ou executa `carregar` e guarda o resultado (respostas com erro não são guardadas) """
+
+        if self.backend is None or usuario_id is None:
+            return carregar()
+
+        chave = self.chave(str(usuario_id), nome)
+        valor = self.backend.get(chave)
+        if valor is not None:
+            with self.lock:
+                self.acertos += 1
+            return valor
+
+        with self.lock:
+            self.falhas += 1
+
+        # Uma réplica atrasada deixaria no cache, por até CACHE_TTL, uma leitura sem as últimas escritas do usuário
+        fixar_primario()
+        valor = carregar()
+        if isinstance(valor, dict) and 'error' not in valor:
+            self.backend.set(chave, valor)
+        return valor
+
+    ################################################################
+    def invalidar(self, usuario_id) -> None:
+        """ Invalida todas as leituras de um usuário avançando a sua geração """
+
+        if self.backend is None or usuario_id is None:
+            return
+
+        # As chaves antigas deixam de ser lidas e saem por LRU ou TTL
+        self.backend.incr(f'{PREFIXO}:geracao:{usuario_id}')
+        with self.lock:
+            self.invalidacoes += 1
+
+    ################################################################
+    def estatisticas(self) -> dict:
+        """ Contadores de uso do cache para dimensionamento """
+
+        consultas = self.acertos + self.falhas
+        return {
+            'backend': type(self.backend).__name__ if self.backend else None,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            'invalidacoes': self.invalidacoes,
+            'entradas': len(self.backend) if self.backend is not None else 0
+        }
+
+################################################################
+class CacheTokens:
+    """ Claims de tokens JWT já verificados, por hash do token, para não refazer a verificação a cada requisição
+
+    Sempre em memória do processo. A entrada expira no `exp` do token (ou em `ttl`, o que vier antes);
+    tokens inválidos ou expirados não são guardados e seguem levantando o erro da verificação.
+    """
+
+    def __init__(self, backend: CacheMemoria = None, ttl: int = TOKENS_TTL):
+        self.backend = backend
+        self.ttl = ttl
+        self.acertos = 0
+        self.falhas = 0
+        self.lock = threading.Lock()  # Contadores incrementados pelas threads das requisições
+
+    ################################################################
+    def decodificar(self, token: str, verificar) -> dict:
+        """ Retorna as claims do token, verificando com `verificar(token)` apenas quando não estiver em cache """
+
+        if self.backend is None:
+            return verificar(token)
+
+        chave = hashlib.sha256(token.encode('utf-8')).hexdigest()
+        claims = self.backend.get(chave)
+        if claims is not None:
+            with self.lock:
+                self.acertos += 1
+            return dict(claims)
+
+        with self.lock:
+            self.falhas += 1
+        claims = verificar(token)
+
+        ttl = self.ttl
+        if 'exp' in claims:
+            ttl = min(ttl, claims['exp'] - time.time())
+        if ttl > 0:
+            self.backend.set(chave, dict(claims), ttl)
+        return claims
+
+    ################################################################
+    def estatisticas(self) -> dict:
+        """ Contadores de uso do cache de tokens """
+
+        consultas = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            'entradas': len(self.backend) if self.backend is not None else 0
+        }
+
+################################################################
+# Helper Functions
+
+def criar_backend(nome: str = None):
+    """ Cria o backend configurado em CACHE_BACKEND (desligado, redis ou memoria)
+
+    O padrão é desligado: em produção há vários workers e só o Redis é compartilhado entre eles. O cache em
+    memória fica restrito a quem pedir explicitamente (ex.: flask run, com um único processo).
+    """
+
+    nome = (nome or os.environ.get('CACHE_BACKEND', 'desligado')).lower()
+
+    if nome == 'redis':
+        import redis  # Dependência opcional, necessária apenas com CACHE_BACKEND=redis
+        return CacheRedis(redis.Redis.from_url(os.environ.get('REDIS_URL', 'redis://localhost:6379/0')))
+
+    if nome == 'memoria':
+        return CacheMemoria()
+
+    return None
+
+################################################################
+# Defined
+
+cache_usuario = CacheUsuario(criar_backend())
+cache_tokens = CacheTokens(CacheMemoria(tamanho=TOKENS_TAMANHO, ttl=TOKENS_TTL) if TOKENS_TAMANHO else None)
+
+################################################################
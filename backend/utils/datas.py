@@ -0,0 +1,23 @@
+################################################################
+# Imports
+
+from datetime import date, datetime      # Manipulação de datas
+
+################################################################
+# Helper Functions
+
+def intervalo_mes(referencia: date = None) -> tuple:
+    """ Retorna o primeiro dia do mês de referência e o primeiro dia do mês seguinte """
+
+    referencia = referencia or datetime.utcnow().date()
+    inicio = date(referencia.year, referencia.month, 1)
+
+    if referencia.month == 12:
+        fim = date(referencia.year + 1, 1, 1)
+    else:
+        fim = date(referencia.year, referencia.month + 1, 1)
+
+    # O intervalo é semiaberto [inicio, fim) para ser usado direto no índice
+    return inicio, fim
+
+################################################################
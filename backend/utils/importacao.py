@@ -0,0 +1,156 @@
+################################################################
+# Imports
+
+import csv                               # Leitura de CSV linha a linha
+import io                                # Decodificação incremental do arquivo enviado
+import itertools                         # Reencadear a linha de cabeçalho já lida
+import re                                # Tags do OFX
+from datetime import date                # Datas das transações
+from decimal import Decimal, InvalidOperation  # Valores monetários
+
+################################################################
+# Constants
+
+FORMATOS = ('csv', 'ofx')
+VALOR_MAXIMO = Decimal('999999.99')      # Limite da coluna valor (NUMERIC(8, 2))
+
+# Nomes aceitos para cada coluna do CSV (cabeçalho sem acento e em minúsculas)
+COLUNAS_CSV = {
+    'data': ('data', 'date', 'dt'),
+    'descricao': ('descricao', 'description', 'historico', 'memo'),
+    'valor': ('valor', 'value', 'amount', 'quantia'),
+    'tipo': ('tipo', 'type'),
+    'categoria': ('categoria', 'category'),
+}
+
+TAG_OFX = re.compile(r'<(/?)([A-Za-z0-9.]+)>([^<\r\n]*)')
+
+################################################################
+# Helper Functions
+
+def detectar_formato(nome_arquivo: str = None, formato: str = None) -> str:
+    """ Define o formato pelo parâmetro informado ou pela extensão do arquivo """
+
+    formato = (formato or '').lower() or (nome_arquivo or '').rsplit('.', 1)[-1].lower()
+    if formato not in FORMATOS:
+        raise ValueError('Formato não suportado. Use csv ou ofx.')
+    return formato
+
+################################################################
+def parse_valor(valor: str) -> Decimal:
+    """ Converte valores como 1234.56, 1.234,56, -10,00 ou R$ 10,00 para Decimal """
+
+    texto = (valor or '').strip().replace('R$', '').replace(' ', '')
+    if not texto:
+        raise ValueError('Valor não informado.')
+
+    # Com vírgula decimal, os pontos são separadores de milhar
+    if ',' in texto:
+        texto = texto.replace('.', '').replace(',', '.')
+
+    try:
+        resultado = Decimal(texto).quantize(Decimal('0.01'))
+    except InvalidOperation:
+        raise ValueError(f'Valor inválido: {valor}.')
+
+    if abs(resultado) > VALOR_MAXIMO:
+        raise ValueError(f'Valor acima do máximo permitido ({VALOR_MAXIMO}).')
+
+    return resultado
+
+################################################################
+def parse_data_importacao(valor: str) -> date:
+    """ Converte datas AAAA-MM-DD, DD/MM/AAAA ou AAAAMMDD (OFX, com hora opcional) """
+
+    # Fatiamento direto: strptime domina o tempo de importação em arquivos grandes
+    texto = (valor or '').strip()
+    try:
+        if texto[4:5] == '-':
+            return date(int(texto[0:4]), int(texto[5:7]), int(texto[8:10]))
+        if texto[2:3] == '/':
+            return date(int(texto[6:10]), int(texto[3:5]), int(texto[0:2]))
+        if texto[:8].isdigit():
+            return date(int(texto[0:4]), int(texto[4:6]), int(texto[6:8]))
+    except ValueError:
+        pass
+
+    raise ValueError(f'Data inválida: {valor}.')
+
+################################################################
+def normalizar_coluna(nome: str) -> str:
+    """ Normaliza o nome de uma coluna do cabeçalho para comparação """
+
+    nome = (nome or '').strip().lower()
+    for acentuado, simples in (('ç', 'c'), ('ã', 'a'), ('á', 'a'), ('é', 'e'), ('ê', 'e'), ('í', 'i'), ('ó', 'o')):
+        nome = nome.replace(acentuado, simples)
+    return nome
+
+################################################################
+def ler_csv(arquivo, encoding: str = 'utf-8-sig'):
+    """ Lê um CSV (separado por vírgula ou ponto e vírgula) e gera (linha, campos) sem carregar o arquivo inteiro """
+
+    texto = io.TextIOWrapper(arquivo, encoding=encoding, newline='')
+    cabecalho = texto.readline()
+    if not cabecalho.strip():
+        raise ValueError('Arquivo CSV vazio.')
+
+    separador = ';' if cabecalho.count(';') > cabecalho.count(',') else ','
+    leitor = csv.reader(itertools.chain([cabecalho], texto), delimiter=separador)
+
+    # Mapeia cada coluna conhecida para a sua posição no arquivo
+    nomes = [normalizar_coluna(nome) for nome in next(leitor)]
+    posicoes = {}
+    for coluna, apelidos in COLUNAS_CSV.items():
+        for apelido in apelidos:
+            if apelido in nomes:
+                posicoes[coluna] = nomes.index(apelido)
+                break
+
+    faltando = [coluna for coluna in ('data', 'valor') if coluna not in posicoes]
+    if faltando:
+        raise ValueError(f'Colunas obrigatórias ausentes no CSV: {", ".join(faltando)}.')
+
+    for numero, campos in enumerate(leitor, start=2):
+        if not any(campo.strip() for campo in campos):
+            continue
+        yield numero, {
+            coluna: campos[posicao].strip() if posicao < len(campos) else ''
+            for coluna, posicao in posicoes.items()
+        }
+
+################################################################
+def ler_ofx(arquivo, encoding: str = 'latin-1'):
+    """ Lê as transações (STMTTRN) de um OFX, SGML ou XML, e gera (linha, campos) sem carregar o arquivo inteiro """
+
+    texto = io.TextIOWrapper(arquivo, encoding=encoding, newline='')
+    transacao = None
+    inicio = 0
+
+    for numero, linha in enumerate(texto, start=1):
+        for fechamento, tag, valor in TAG_OFX.findall(linha):
+            tag = tag.upper()
+
+            if tag == 'STMTTRN':
+                if fechamento and transacao is not None:
+                    yield inicio, {
+                        'data': transacao.get('DTPOSTED', ''),
+                        'valor': transacao.get('TRNAMT', ''),
+                        'descricao': transacao.get('MEMO') or transacao.get('NAME') or '',
+                        'tipo': '',
+                        'categoria': '',
+                    }
+                    transacao = None
+                elif not fechamento:
+                    transacao, inicio = {}, numero
+            elif transacao is not None and not fechamento and valor.strip():
+                transacao[tag] = valor.strip()
+
+################################################################
+def ler_transacoes(arquivo, formato: str, encoding: str = None):
+    """ Gera (linha, campos) do arquivo no formato informado """
+
+    if formato == 'ofx':
+        return ler_ofx(arquivo, encoding or 'latin-1')
+    return ler_csv(arquivo, encoding or 'utf-8-sig')
+
+################################################################
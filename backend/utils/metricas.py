@@ -0,0 +1,464 @@
+################################################################
+# Imports
+
+import cProfile                              # Perfil por amostragem de requisições
+import fcntl                                 # Trava do diretório ao incorporar processos encerrados
+import glob                                  # Estados gravados pelos processos
+import io                                    # Texto do relatório do perfil
+import json                                  # Estado das métricas compartilhado entre processos
+import logging                               # Registro de consultas lentas e de possíveis N+1
+import os                                    # Configuração por variáveis de ambiente
+import pstats                                # Resumo do perfil
+import random                                # Sorteio das requisições perfiladas
+import threading                             # Acesso concorrente aos contadores
+import time                                  # Medição de tempo
+import uuid                                  # Identificador único do processo no diretório das métricas
+from collections import Counter, deque       # Repetições de SQL e últimos perfis
+from flask import g, has_request_context, request  # Estado da requisição atual
+from sqlalchemy import event                 # Eventos de execução do SQLAlchemy
+from sqlalchemy.engine import Engine         # Todos os engines (principal e réplica)
+
+################################################################
+# Constants
+
+BUCKETS_REQUISICAO = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)   # Segundos
+BUCKETS_CONSULTA = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)      # Segundos
+BUCKETS_QUANTIDADE = (1, 2, 5, 10, 20, 50, 100, 200)                               # Consultas por requisição
+
+LIMITE_CONSULTAS = int(os.environ.get('METRICAS_LIMITE_CONSULTAS', 20))            # Acima disso a requisição é sinalizada
+LIMITE_REPETICOES = int(os.environ.get('METRICAS_LIMITE_REPETICOES', 10))          # Mesmo SQL repetido (padrão N+1)
+CONSULTA_LENTA = float(os.environ.get('METRICAS_CONSULTA_LENTA_MS', 200)) / 1000   # Segundos
+AMOSTRA_PERFIL = float(os.environ.get('METRICAS_AMOSTRA_PERFIL', 0))               # Fração das requisições com cProfile
+PERFIS_GUARDADOS = 20                                                               # Últimos perfis mantidos em memória
+LINHAS_PERFIL = 25                                                                  # Funções listadas em cada perfil
+DIRETORIO = os.environ.get('METRICAS_DIRETORIO')                                    # Estado compartilhado entre os workers
+INTERVALO_GRAVACAO = float(os.environ.get('METRICAS_INTERVALO', 5))                 # Segundos entre gravações do estado
+ARQUIVO_ENCERRADOS = 'encerrados.json'                                              # Soma dos processos que já terminaram
+
+logger = logging.getLogger(__name__)
+
+################################################################
+# Helper Functions
+
+def escapar(valor) -> str:
+    """ Escapa barras e aspas do valor de um rótulo """
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"')
+
+################################################################
+def formatar_rotulos(rotulos: dict) -> str:
+    """ Rótulos no formato do Prometheus: {chave="valor",...} """
+
+    if not rotulos:
+        return ''
+    pares = ','.join(f'{chave}="{escapar(valor)}"' for chave, valor in rotulos.items())
+    return '{' + pares + '}'
+
+################################################################
+def formatar_valor(nome: str, valor, ajuda: str, tipo: str = 'gauge', rotulos: dict = None) -> str:
+    """ Uma métrica simples (gauge ou counter) no formato texto do Prometheus """
+    return f'# HELP {nome} {ajuda}\n# TYPE {nome} {tipo}\n{nome}{formatar_rotulos(rotulos)} {valor}\n'
+
+################################################################
+# Main
+
+class Histograma:
+    """ Histograma cumulativo por faixas, como o do Prometheus """
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.contagens = [0] * len(buckets)
+        self.soma = 0.0
+        self.total = 0
+
+    ################################################################
+    def observar(self, valor: float) -> None:
+        """ Registra uma observação """
+
+        self.soma += valor
+        self.total += 1
+        for indice, limite in enumerate(self.buckets):
+            if valor <= limite:
+                self.contagens[indice] += 1
+
+    ################################################################
+    def estado(self) -> dict:
+        """ Contagens do histograma em formato JSON """
+        return {'contagens': list(self.contagens), 'soma': self.soma, 'total': self.total}
+
+    ################################################################
+    def somar(self, estado: dict) -> None:
+        """ Acumula o estado de outro histograma com as mesmas faixas """
+
+        self.contagens = [atual + outra for atual, outra in zip(self.contagens, estado['contagens'])]
+        self.soma += estado['soma']
+        self.total += estado['total']
+
+    ################################################################
+    def exportar(self, nome: str, rotulos: dict) -> list:
+        """ Linhas _bucket, _sum e _count do histograma """
+
+        linhas = []
+        for limite, contagem in zip(self.buckets, self.contagens):
+            linhas.append(f'{nome}_bucket{formatar_rotulos({**rotulos, "le": limite})} {contagem}')
+        linhas.append(f'{nome}_bucket{formatar_rotulos({**rotulos, "le": "+Inf"})} {self.total}')
+        linhas.append(f'{nome}_sum{formatar_rotulos(rotulos)} {self.soma}')
+        linhas.append(f'{nome}_count{formatar_rotulos(rotulos)} {self.total}')
+        return linhas
+
+################################################################
+class Metricas:
+    """ Latência por rota, SQL por requisição e sinais de N+1, acumulados no processo
+
+    Consultas feitas depois do after_request (respostas em streaming, como a exportação) e as das leituras em paralelo
+    (laço de eventos do engine assíncrono ou pool de threads) entram no histograma geral de SQL, mas não na contagem da requisição.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.coletores = []              # Funções que retornam contadores de outros módulos ({nome: valor})
+        self.gravado_em = 0.0
+        self.pid = None                  # Processo dono do arquivo (um processo filho recebe um arquivo novo)
+        self.arquivo = None
+        self.requisicoes = {}            # (método, rota, status) -> Histograma de duração
+        self.consultas_requisicao = {}   # rota -> Histograma de quantidade de consultas
+        self.tempo_sql_requisicao = {}   # rota -> segundos gastos em SQL
+        self.sql = Histograma(BUCKETS_CONSULTA)
+        self.consultas_lentas = 0
+        self.n_mais_1 = Counter()        # rota -> requisições sinalizadas
+        self.perfis = deque(maxlen=PERFIS_GUARDADOS)
+
+    ################################################################
+    def registrar_consulta(self, duracao: float) -> None:
+        """ Registra a duração de uma consulta SQL """
+
+        with self.lock:
+            self.sql.observar(duracao)
+            if duracao >= CONSULTA_LENTA:
+                self.consultas_lentas += 1
+
+    ################################################################
+    def registrar_requisicao(self, metodo: str, rota: str, status: int, duracao: float, consultas: int, tempo_sql: float, sinalizada: bool) -> None:
+        """ Registra a duração e as consultas de uma requisição finalizada """
+
+        with self.lock:
+            chave = (metodo, rota, str(status))
+            if chave not in self.requisicoes:
+                self.requisicoes[chave] = Histograma(BUCKETS_REQUISICAO)
+            self.requisicoes[chave].observar(duracao)
+
+            if rota not in self.consultas_requisicao:
+                self.consultas_requisicao[rota] = Histograma(BUCKETS_QUANTIDADE)
+            self.consultas_requisicao[rota].observar(consultas)
+            self.tempo_sql_requisicao[rota] = self.tempo_sql_requisicao.get(rota, 0.0) + tempo_sql
+
+            if sinalizada:
+                self.n_mais_1[rota] += 1
+
+    ################################################################
+    def estado(self) -> dict:
+        """ Estado acumulado do processo em formato JSON, para ser somado ao dos demais workers """
+
+        externos = {}
+        for coletor in self.coletores:
+            externos.update(coletor())
+
+        with self.lock:
+            return {
+                'requisicoes': [[*chave, histograma.estado()] for chave, histograma in self.requisicoes.items()],
+                'consultas_requisicao': {rota: histograma.estado() for rota, histograma in self.consultas_requisicao.items()},
+                'tempo_sql_requisicao': dict(self.tempo_sql_requisicao),
+                'sql': self.sql.estado(),
+                'consultas_lentas': self.consultas_lentas,
+                'n_mais_1': dict(self.n_mais_1),
+                'externos': externos,
+            }
+
+    ################################################################
+    def somar(self, estado: dict) -> None:
+        """ Acumula o estado de outro processo """
+
+        with self.lock:
+            for metodo, rota, status, histograma in estado['requisicoes']:
+                self.requisicoes.setdefault((metodo, rota, status), Histograma(BUCKETS_REQUISICAO)).somar(histograma)
+            for rota, histograma in estado['consultas_requisicao'].items():
+                self.consultas_requisicao.setdefault(rota, Histograma(BUCKETS_QUANTIDADE)).somar(histograma)
+            for rota, segundos in estado['tempo_sql_requisicao'].items():
+                self.tempo_sql_requisicao[rota] = self.tempo_sql_requisicao.get(rota, 0.0) + segundos
+            self.sql.somar(estado['sql'])
+            self.consultas_lentas += estado['consultas_lentas']
+            self.n_mais_1.update(estado['n_mais_1'])
+
+    ################################################################
+    def gravar(self, forcar: bool = False) -> None:
+        """ Grava o estado do processo em METRICAS_DIRETORIO (no máximo a cada METRICAS_INTERVALO segundos) """
+
+        agora = time.monotonic()
+        if not DIRETORIO or (not forcar and agora - self.gravado_em < INTERVALO_GRAVACAO):
+            return
+        self.gravado_em = agora
+
+        # O nome leva o pid (para saber se o processo terminou) e um identificador único: um pid reutilizado
+        # não sobrescreve o arquivo de um processo encerrado
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.arquivo = os.path.join(DIRETORIO, f'processo-{self.pid}-{uuid.uuid4().hex}.json')
+
+        # Grava em um arquivo temporário e renomeia: quem lê nunca vê um arquivo pela metade
+        gravar_json(self.arquivo, self.estado())
+
+    ################################################################
+    def exportar(self, rotulos_base: dict = None) -> str:
+        """ Todas as métricas no formato texto do Prometheus (`rotulos_base` vai em todas as séries) """
+
+        rotulos_base = rotulos_base or {}
+        with self.lock:
+            linhas = [
+                '# HELP poupabem_requisicao_segundos Duração das requisições por rota.',
+                '# TYPE poupabem_requisicao_segundos histogram',
+            ]
+            for (metodo, rota, status), histograma in sorted(self.requisicoes.items()):
+                linhas += histograma.exportar('poupabem_requisicao_segundos', {**rotulos_base, 'metodo': metodo, 'rota': rota, 'status': status})
+
+            linhas += [
+                '# HELP poupabem_requisicao_consultas Consultas SQL executadas por requisição.',
+                '# TYPE poupabem_requisicao_consultas histogram',
+            ]
+            for rota, histograma in sorted(self.consultas_requisicao.items()):
+                linhas += histograma.exportar('poupabem_requisicao_consultas', {**rotulos_base, 'rota': rota})
+
+            linhas += [
+                '# HELP poupabem_requisicao_sql_segundos_total Tempo gasto em SQL pelas requisições da rota.',
+                '# TYPE poupabem_requisicao_sql_segundos_total counter',
+            ]
+            linhas += [f'poupabem_requisicao_sql_segundos_total{formatar_rotulos({**rotulos_base, "rota": rota})} {segundos}'
+                       for rota, segundos in sorted(self.tempo_sql_requisicao.items())]
+
+            linhas += [
+                '# HELP poupabem_requisicao_n_mais_1_total Requisições com consultas demais ou SQL repetido (possível N+1).',
+                '# TYPE poupabem_requisicao_n_mais_1_total counter',
+            ]
+            linhas += [f'poupabem_requisicao_n_mais_1_total{formatar_rotulos({**rotulos_base, "rota": rota})} {total}'
+                       for rota, total in sorted(self.n_mais_1.items())]
+
+            linhas += [
+                '# HELP poupabem_sql_segundos Duração das consultas SQL.',
+                '# TYPE poupabem_sql_segundos histogram',
+            ]
+            linhas += self.sql.exportar('poupabem_sql_segundos', rotulos_base)
+
+            texto = '\n'.join(linhas) + '\n' + formatar_valor(
+                'poupabem_sql_lentas_total', self.consultas_lentas, 'Consultas SQL acima de METRICAS_CONSULTA_LENTA_MS.',
+                'counter', rotulos_base
+            )
+
+        return texto
+
+################################################################
+# Defined
+
+metricas = Metricas()
+
+################################################################
+# Hooks
+
+def antes_consulta(conexao, cursor, statement, parameters, context, executemany) -> None:
+    """ Marca o início de uma consulta SQL """
+    conexao.info.setdefault('metricas_inicio', []).append(time.perf_counter())
+
+################################################################
+def depois_consulta(conexao, cursor, statement, parameters, context, executemany) -> None:
+    """ Registra a duração da consulta no total do processo e na requisição atual """
+
+    inicios = conexao.info.get('metricas_inicio')
+    if not inicios:
+        return
+    duracao = time.perf_counter() - inicios.pop()
+    metricas.registrar_consulta(duracao)
+
+    if duracao >= CONSULTA_LENTA:
+        logger.warning('consulta lenta (%.0f ms): %s', duracao * 1000, ' '.join(statement.split())[:300])
+
+    if has_request_context() and 'metricas_sql' in g:
+        g.metricas_sql[statement] += 1
+        g.metricas_tempo_sql += duracao
+
+################################################################
+def erro_consulta(contexto) -> None:
+    """ Descarta o início de uma consulta que falhou (after_cursor_execute não é chamado) """
+
+    if contexto.connection is None:
+        return
+    inicios = contexto.connection.info.get('metricas_inicio')
+    if inicios:
+        inicios.pop()
+
+################################################################
+def iniciar_requisicao() -> None:
+    """ Zera os contadores da requisição e inicia o perfil quando sorteada """
+
+    g.metricas_inicio = time.perf_counter()
+    g.metricas_sql = Counter()
+    g.metricas_tempo_sql = 0.0
+    g.metricas_registrada = False
+
+    if AMOSTRA_PERFIL and random.random() < AMOSTRA_PERFIL:
+        perfil = cProfile.Profile()
+        try:
+            perfil.enable()
+            g.metricas_perfil = perfil
+        except ValueError:
+            pass  # Outro perfil já ativo neste processo (requisição concorrente): não perfila esta
+
+################################################################
+def finalizar_requisicao(status: int) -> None:
+    """ Registra a requisição e sinaliza padrões N+1 """
+
+    if 'metricas_inicio' not in g or g.metricas_registrada:
+        return
+    g.metricas_registrada = True
+
+    duracao = time.perf_counter() - g.metricas_inicio
+    rota = request.url_rule.rule if request.url_rule else 'desconhecida'
+    consultas = sum(g.metricas_sql.values())
+    repetida, repeticoes = g.metricas_sql.most_common(1)[0] if g.metricas_sql else ('', 0)
+
+    sinalizada = consultas > LIMITE_CONSULTAS or repeticoes > LIMITE_REPETICOES
+    if sinalizada:
+        logger.warning('possível N+1 em %s %s: %d consultas, %dx a mesma: %s',
+                       request.method, rota, consultas, repeticoes, ' '.join(repetida.split())[:200])
+
+    metricas.registrar_requisicao(request.method, rota, status, duracao, consultas, g.metricas_tempo_sql, sinalizada)
+    metricas.gravar()
+
+    perfil = g.pop('metricas_perfil', None)
+    if perfil is not None:
+        perfil.disable()
+        saida = io.StringIO()
+        pstats.Stats(perfil, stream=saida).sort_stats('cumulative').print_stats(LINHAS_PERFIL)
+        metricas.perfis.append({
+            'metodo': request.method,
+            'rota': rota,
+            'status': status,
+            'duracao_ms': round(duracao * 1000, 2),
+            'consultas': consultas,
+            'perfil': saida.getvalue(),
+        })
+
+################################################################
+def gravar_json(arquivo: str, estado: dict) -> None:
+    """ Grava o estado em um arquivo temporário (um por thread) e o renomeia: quem lê nunca vê um arquivo pela metade """
+
+    temporario = f'{arquivo}.{threading.get_ident()}.tmp'
+    with open(temporario, 'w') as saida:
+        json.dump(estado, saida)
+    os.replace(temporario, arquivo)
+
+################################################################
+def ler_json(arquivo: str) -> dict:
+    """ Estado gravado por `gravar_json` (None se o arquivo sumiu ou está inválido) """
+
+    try:
+        with open(arquivo) as entrada:
+            return json.load(entrada)
+    except (OSError, ValueError):
+        return None
+
+################################################################
+def processo_ativo(pid: int) -> bool:
+    """ Verifica se o processo ainda existe (no mesmo host) """
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+################################################################
+def somar_estados(estados: list) -> tuple:
+    """ Soma os estados gravados: (Metricas com o total, contadores dos coletores somados) """
+
+    total, externos = Metricas(), {}
+    for estado in estados:
+        total.somar(estado)
+        for nome, valor in estado['externos'].items():
+            externos[nome] = externos.get(nome, 0) + valor
+    return total, externos
+
+################################################################
+def incorporar_encerrados() -> list:
+    """ Soma os arquivos dos processos encerrados (ex.: reciclados por max_requests) em ARQUIVO_ENCERRADOS e os apaga
+
+    Os contadores nunca diminuem e o diretório não cresce com a reciclagem dos workers. Roda com o diretório travado,
+    para que dois workers atendendo /metrics ao mesmo tempo não incorporem o mesmo arquivo duas vezes.
+    Retorna os estados de todos os arquivos (encerrados somados e processos ativos).
+    """
+
+    encerrados = os.path.join(DIRETORIO, ARQUIVO_ENCERRADOS)
+
+    with open(os.path.join(DIRETORIO, '.trava'), 'w') as trava:
+        fcntl.flock(trava, fcntl.LOCK_EX)
+
+        ativos, mortos = [], []
+        for arquivo in sorted(glob.glob(os.path.join(DIRETORIO, 'processo-*.json'))):
+            estado = ler_json(arquivo)
+            if estado is None:
+                continue
+            pid = int(os.path.basename(arquivo).split('-')[1])
+            (ativos if processo_ativo(pid) else mortos).append((arquivo, estado))
+
+        anterior = ler_json(encerrados)
+        if mortos:
+            total, externos = somar_estados([estado for estado in [anterior] if estado] + [estado for _, estado in mortos])
+            anterior = {**total.estado(), 'externos': externos}
+            gravar_json(encerrados, anterior)
+            for arquivo, _ in mortos:
+                os.remove(arquivo)
+
+    return [estado for estado in [anterior] if estado] + [estado for _, estado in ativos]
+
+################################################################
+def exportar_processos() -> tuple:
+    """ Métricas de todos os workers somadas (METRICAS_DIRETORIO) ou, sem o diretório, as deste processo com o rótulo pid
+
+    Retorna o texto e os contadores dos coletores (somados entre os processos) com os rótulos que devem acompanhá-los.
+    """
+
+    if not DIRETORIO:
+        rotulos = {'pid': os.getpid()}
+        return metricas.exportar(rotulos), metricas.estado()['externos'], rotulos
+
+    metricas.gravar(forcar=True)
+
+    total, externos = somar_estados(incorporar_encerrados())
+    return total.exportar(), externos, {}
+
+################################################################
+def instalar(app) -> None:
+    """ Registra os eventos de SQL (todos os engines) e os hooks de requisição na aplicação """
+
+    if DIRETORIO:
+        os.makedirs(DIRETORIO, exist_ok=True)
+
+    if not event.contains(Engine, 'before_cursor_execute', antes_consulta):
+        event.listen(Engine, 'before_cursor_execute', antes_consulta)
+        event.listen(Engine, 'after_cursor_execute', depois_consulta)
+        event.listen(Engine, 'handle_error', erro_consulta)
+
+    @app.before_request
+    def metricas_antes():
+        iniciar_requisicao()
+
+    @app.after_request
+    def metricas_depois(resposta):
+        finalizar_requisicao(resposta.status_code)
+        return resposta
+
+    @app.teardown_request
+    def metricas_erro(erro):
+        # Exceções não tratadas não passam pelo after_request
+        if erro is not None:
+            finalizar_requisicao(500)
+
+################################################################
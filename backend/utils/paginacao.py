@@ -0,0 +1,96 @@
+################################################################
+# Imports
+
+from datetime import date, datetime      # Manipulação de datas
+from sqlalchemy import tuple_            # Comparação de tuplas (data, id) para o cursor
+
+################################################################
+# Constants
+
+LIMITE_PADRAO = 100      # Itens por página quando o cliente não informa o limite
+LIMITE_MAXIMO = 500      # Teto de itens por página, independente do que o cliente pedir
+
+################################################################
+# Helper Functions
+
+def parse_limite(valor: str) -> int:
+    """ Converte o parâmetro de limite, aplicando o padrão e o teto de itens por página """
+
+    if valor in (None, ''):
+        return LIMITE_PADRAO
+
+    limite = int(valor)
+    if limite < 1:
+        raise ValueError('O limite deve ser maior que zero.')
+
+    return min(limite, LIMITE_MAXIMO)
+
+################################################################
+def parse_data(valor: str) -> date:
+    """ Converte uma data no formato AAAA-MM-DD, retornando None se não informada """
+
+    if valor in (None, ''):
+        return None
+
+    return datetime.strptime(valor, '%Y-%m-%d').date()
+
+################################################################
+def codificar_cursor(data, registro_id: int) -> str:
+    """ Gera o cursor da próxima página a partir do último registro retornado """
+    return f'{data.isoformat()}_{registro_id}'
+
+################################################################
+def decodificar_cursor(cursor: str) -> tuple:
+    """ Converte o cursor recebido em (data, id), retornando None se não informado """
+
+    if cursor in (None, ''):
+        return None
+
+    # Colunas de data e hora geram cursores com a hora (AAAA-MM-DDTHH:MM:SS)
+    data, registro_id = cursor.split('_', 1)
+    return datetime.fromisoformat(data) if 'T' in data else parse_data(data), int(registro_id)
+
+################################################################
+def parse_paginacao(args: dict) -> dict:
+    """ Lê os parâmetros from/to/cursor/limit de uma query string """
+
+    try:
+        return {
+            'data_inicio': parse_data(args.get('from')),
+            'data_fim': parse_data(args.get('to')),
+            'cursor': decodificar_cursor(args.get('cursor')),
+            'limite': parse_limite(args.get('limit')),
+        }
+    except ValueError:
+        raise ValueError('Parâmetros de paginação inválidos. Use from/to no formato AAAA-MM-DD, um cursor válido e limit positivo.')
+
+################################################################
+def paginar(query, coluna_data, coluna_id, data_inicio: date = None, data_fim: date = None, cursor: tuple = None, limite: int = LIMITE_PADRAO, ler=None, crescente: bool = False) -> tuple:
+    """ Aplica o filtro de período e a paginação por chave (data, id) a uma query, decrescente por padrão
+
+    `query` pode ser uma Query do ORM ou um SELECT; neste caso `ler` recebe o SELECT final e retorna as linhas.
+    """
+
+    if data_inicio:
+        query = query.filter(coluna_data >= data_inicio)
+    if data_fim:
+        query = query.filter(coluna_data <= data_fim)
+    if cursor and crescente:
+        query = query.filter(tuple_(coluna_data, coluna_id) > tuple_(*cursor))
+    elif cursor:
+        query = query.filter(tuple_(coluna_data, coluna_id) < tuple_(*cursor))
+
+    # Busca um item a mais para saber se existe próxima página
+    ordem = (coluna_data, coluna_id) if crescente else (coluna_data.desc(), coluna_id.desc())
+    query = query.order_by(*ordem).limit(limite + 1)
+    registros = ler(query) if ler else query.all()
+
+    proximo_cursor = None
+    if len(registros) > limite:
+        registros = registros[:limite]
+        ultimo = registros[-1]
+        proximo_cursor = codificar_cursor(getattr(ultimo, coluna_data.key), getattr(ultimo, coluna_id.key))
+
+    return registros, proximo_cursor
+
+################################################################
@@ -0,0 +1,104 @@
+################################################################
+# Imports
+
+import os                                    # Configuração por variáveis de ambiente
+import threading                             # Controle das vagas do pool
+from concurrent.futures import ThreadPoolExecutor, TimeoutError  # Pool dedicado ao bcrypt
+import bcrypt                                # Criptografia de senhas
+
+################################################################
+# Constants
+
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))                 # Fator de custo (2^rounds iterações)
+TRABALHADORES = int(os.environ.get('SENHA_TRABALHADORES', os.cpu_count() or 1))  # Hashes calculados em paralelo
+FILA = int(os.environ.get('SENHA_FILA', 16))                             # Pedidos aguardando além dos em execução
+ESPERA = float(os.environ.get('SENHA_ESPERA', 10))                       # Segundos de espera pelo resultado
+
+################################################################
+# Exceptions
+
+class SenhaSobrecarga(Exception):
+    """ Pool de senhas cheio: o pedido deve ser recusado com 503 """
+
+################################################################
+# Helper Functions
+
+def gerar_hash(senha: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    """ Hash bcrypt da senha, como texto """
+    return bcrypt.hashpw(senha.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+################################################################
+def verificar(senha: str, hash_senha: str) -> bool:
+    """ Compara a senha com o hash bcrypt armazenado """
+    return bcrypt.checkpw(senha.encode('utf-8'), hash_senha.encode('utf-8'))
+
+################################################################
+# Main
+
+class PoolSenhas:
+    """ Executa o bcrypt (custoso em CPU de propósito) em um pool de threads limitado, fora da thread da requisição
+
+    O bcrypt libera o GIL durante o cálculo; o pool limita quantos hashes rodam ao mesmo tempo para que uma rajada
+    de logins não ocupe todas as threads do worker, e recusa novos pedidos quando a fila está cheia.
+    """
+
+    def __init__(self, trabalhadores: int = TRABALHADORES, fila: int = FILA, rounds: int = BCRYPT_ROUNDS, espera: float = ESPERA):
+        self.trabalhadores = trabalhadores
+        self.fila = fila
+        self.rounds = rounds
+        self.espera = espera
+        self.executor = ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix='senhas')
+        self.vagas = threading.BoundedSemaphore(trabalhadores + fila)
+        self.lock = threading.Lock()
+        self.recusados = 0
+
+    ################################################################
+    def executar(self, funcao, *args):
+        """ Executa a função no pool e aguarda o resultado; sem vaga livre, levanta SenhaSobrecarga """
+
+        if not self.vagas.acquire(blocking=False):
+            with self.lock:
+                self.recusados += 1
+            raise SenhaSobrecarga('Servidor ocupado, tente novamente em instantes.')
+
+        try:
+            futuro = self.executor.submit(funcao, *args)
+        except Exception:
+            self.vagas.release()
+            raise
+
+        # A vaga é liberada quando o cálculo termina, mesmo que a requisição tenha desistido de esperar
+        futuro.add_done_callback(lambda _: self.vagas.release())
+
+        try:
+            return futuro.result(timeout=self.espera)
+        except TimeoutError:
+            raise SenhaSobrecarga('Tempo de espera esgotado, tente novamente em instantes.')
+
+    ################################################################
+    def gerar_hash(self, senha: str) -> str:
+        """ Gera o hash bcrypt da senha com o fator de custo configurado """
+        return self.executar(gerar_hash, senha, self.rounds)
+
+    ################################################################
+    def verificar(self, senha: str, hash_senha: str) -> bool:
+        """ Verifica a senha contra o hash armazenado (o custo vem do próprio hash) """
+        return self.executar(verificar, senha, hash_senha)
+
+    ################################################################
+    def estatisticas(self) -> dict:
+        """ Configuração do pool e pedidos recusados por sobrecarga """
+
+        return {
+            'trabalhadores': self.trabalhadores,
+            'fila': self.fila,
+            'rounds': self.rounds,
+            'recusados': self.recusados,
+        }
+
+################################################################
+# Defined
+
+pool_senhas = PoolSenhas()
+
+################################################################
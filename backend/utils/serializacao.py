@@ -0,0 +1,146 @@
+################################################################
+# Imports
+
+from flask.json.provider import DefaultJSONProvider  # Provedor JSON padrão do Flask
+from werkzeug.http import http_date                  # Formato de data HTTP (o mesmo do jsonify)
+from sqlalchemy import select                        # Consultas apenas das colunas do esquema
+
+try:
+    import orjson                                    # Codificador JSON rápido (opcional)
+except ImportError:
+    orjson = None
+
+################################################################
+# Helper Functions (conversores de coluna)
+
+def decimal(valor):
+    """ Decimal para float, preservando nulos """
+    return None if valor is None else float(valor)
+
+################################################################
+def decimal_preenchido(valor):
+    """ Decimal para float; zero ou nulo viram None """
+    return float(valor) if valor else None
+
+################################################################
+def data_iso(valor):
+    """ Data ou data e hora em ISO 8601 """
+    return None if valor is None else valor.isoformat()
+
+################################################################
+def data_dia(valor):
+    """ Data e hora no formato AAAA-MM-DD """
+    return None if valor is None else valor.strftime('%Y-%m-%d')
+
+################################################################
+def data_http(valor):
+    """ Data e hora no formato HTTP (ex.: Sat, 17 Oct 2026 00:00:00 GMT) """
+    return None if valor is None else http_date(valor)
+
+################################################################
+def texto_preenchido(valor):
+    """ Texto vazio vira None """
+    return valor if valor else None
+
+################################################################
+# Main
+
+class Campo:
+    """ Campo de saída: nome no JSON, coluna do modelo e conversor opcional """
+
+    def __init__(self, nome: str, coluna, conversor=None):
+        self.nome = nome
+        self.coluna = coluna
+        self.conversor = conversor
+
+################################################################
+class Esquema:
+    """ Serializador declarativo: seleciona apenas as colunas do esquema e monta os dicionários a partir das tuplas """
+
+    def __init__(self, *campos: Campo):
+        self.campos = campos
+        self.nomes = tuple(campo.nome for campo in campos)
+        self.conversores = tuple((indice, campo.conversor) for indice, campo in enumerate(campos) if campo.conversor)
+        self.colunas_tabela = None
+
+    ################################################################
+    def colunas(self) -> list:
+        """ Colunas das tabelas (Core, sem instrumentação do ORM), rotuladas com o nome de saída """
+
+        # Resolvidas na primeira consulta, quando os modelos já estão todos mapeados
+        if self.colunas_tabela is None:
+            self.colunas_tabela = [campo.coluna.property.columns[0].label(campo.nome) for campo in self.campos]
+        return self.colunas_tabela
+
+    ################################################################
+    def consulta(self):
+        """ SELECT apenas das colunas do esquema, para receber filtros e ordenação """
+        return select(*self.colunas())
+
+    ################################################################
+    def ler(self, sessao, consulta) -> list:
+        """ Executa a consulta somente leitura direto na conexão da sessão e retorna as tuplas (Row)
+
+        Não passa pelo processamento de resultados do ORM nem pelo identity map; a conexão é escolhida
+        pela sessão a partir da consulta, então a réplica de leitura continua sendo usada nas rotas GET.
+        """
+        return sessao.connection(bind_arguments={'clause': consulta}).execute(consulta).all()
+
+    ################################################################
+    def ler_serializado(self, sessao, consulta) -> list:
+        """ Executa a consulta e retorna a lista de dicionários """
+        return self.serializar_lista(self.ler(sessao, consulta))
+
+    ################################################################
+    def serializar(self, linha) -> dict:
+        """ Converte uma tupla selecionada por `consulta()` em dicionário """
+
+        if self.conversores:
+            linha = list(linha)
+            for indice, conversor in self.conversores:
+                linha[indice] = conversor(linha[indice])
+
+        return dict(zip(self.nomes, linha))
+
+    ################################################################
+    def serializar_lista(self, linhas) -> list:
+        """ Converte uma lista de tuplas em uma lista de dicionários """
+        return [self.serializar(linha) for linha in linhas]
+
+    ################################################################
+    def serializar_objeto(self, objeto) -> dict:
+        """ Converte uma entidade já carregada (para métodos que precisam do objeto ORM) """
+        return self.serializar(tuple(getattr(objeto, campo.coluna.key) for campo in self.campos))
+
+################################################################
+class JSONRapido(DefaultJSONProvider):
+    """ Provedor JSON do Flask que codifica com orjson quando instalado, mantendo a saída do jsonify
+
+    Decimal continua virando texto, datas continuam no formato HTTP e as chaves continuam ordenadas (sort_keys
+    herdado do provedor padrão), como no codificador padrão.
+    """
+
+    ################################################################
+    def codificar(self, obj) -> bytes:
+        """ Codifica com orjson repassando ao Flask os tipos que ele trata de forma própria """
+
+        opcoes = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            opcoes |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=opcoes)
+
+    ################################################################
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.codificar(obj).decode()
+
+    ################################################################
+    def response(self, *args, **kwargs):
+        if orjson is None or self._app.debug:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.codificar(obj) + b'\n', mimetype=self.mimetype)
+
+################################################################
@@ -0,0 +1,12 @@
+################################################################
+# Imports
+
+from app import app  # Aplicação com as rotas e comandos registrados
+
+################################################################
+# Main
+
+# Ponto de entrada WSGI para servidores com vários processos (ex.: gunicorn -c gunicorn.conf.py wsgi:application)
+application = app
+
+################################################################
@@ -27,6 +27,7 @@ export const apiConfig = {
     listarCategorias: (id: number) => `/categoria/${id}`,
     criarOrcamento: (id: number) => `/categoria/orcamento/${id}`,
     orcamentoStatus: (id: number) => `/categoria/orcamento_status/${id}`,
+    orcamentosStatusUsuario: (usuarioId: number) => `/categoria/orcamento_status/usuario/${usuarioId}`,
     
     // Receitas
     criarReceita: '/receita/create',
@@ -42,6 +43,12 @@ export const apiConfig = {
     listarDespesas: (id: number) => `/despesa/${id}`,
     totalDespesa: (id: number) => `/despesa/total/${id}`,
     dicas: (usuarioId: number) => `/despesa/dicas/${usuarioId}`,
+
+    // Painel da tela inicial (totais, dicas, avisos de orçamento e alertas disparados)
+    dashboard: (usuarioId: number) => `/dashboard/${usuarioId}`,
+
+    // Relatórios
+    graficos: (usuarioId: number) => `/relatorio/graficos/${usuarioId}`,
     
     // Metas Financeiras
     listarMetas: (metaId: number) => `/meta_financeira/${metaId}`,
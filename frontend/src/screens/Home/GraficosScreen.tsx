@@ -45,8 +45,6 @@ const getMonthName = (monthNumber: string) => {
 const GraficosScreen: React.FC = () => {
   const [token, setToken] = useState<string | null>(null);
   const [userId, setUserId] = useState<number | null>(null);
-  const [allExpenses, setAllExpenses] = useState<any[]>([]);
-  const [allIncomes, setAllIncomes] = useState<any[]>([]);
   const [expensesByCategory, setExpensesByCategory] = useState<any[]>([]);
   const [totalExpenses, setTotalExpenses] = useState<number>(0);
   const [totalIncomes, setTotalIncomes] = useState<number>(0);
@@ -54,7 +52,6 @@ const GraficosScreen: React.FC = () => {
   const [startDate, setStartDate] = useState<Date>(moment().startOf('month').toDate());
   const [endDate, setEndDate] = useState<Date>(moment().endOf('month').toDate());
   const [hasData, setHasData] = useState(true);
-  const [categories, setCategories] = useState<any[]>([]);
   const [calendarVisible, setCalendarVisible] = useState<'start' | 'end' | null>(null);
 
   const categoryColors = [
@@ -80,18 +77,6 @@ const GraficosScreen: React.FC = () => {
           return;
         }
         setUserId(userId);
-        
-        const categoriasResponse = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.listarCategorias(userId)}`, {
-          method: 'GET',
-          headers: {
-            'Content-Type': 'application/json',
-            'Authorization': `Bearer ${storedToken}`,
-          },
-        });
-        const todasCategorias = await categoriasResponse.json();
-        setCategories(todasCategorias.categorias || []);
-        
-        fetchData(storedToken, userId);
       } catch (error) {
         console.error('Erro ao carregar token e ID do usuário:', error);
       }
@@ -101,132 +86,52 @@ const GraficosScreen: React.FC = () => {
   }, []);
 
   useEffect(() => {
-    if (allExpenses.length > 0 || allIncomes.length > 0) {
-      filterDataByPeriod();
+    if (token && userId) {
+      fetchData(token, userId);
     }
-  }, [startDate, endDate, allExpenses, allIncomes, categories]);
+  }, [token, userId, startDate, endDate]);
 
+  // Os totais por categoria e a série mensal já chegam agregados pelo backend
   const fetchData = async (token: string, userId: number) => {
     try {
-      const [despesasResponse, receitasResponse] = await Promise.all([
-        fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.listarDespesas(userId)}`, {
-          method: 'GET',
-          headers: {
-            'Content-Type': 'application/json',
-            'Authorization': `Bearer ${token}`,
-          },
-        }),
-        fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.listarReceitas(userId)}`, {
-          method: 'GET',
-          headers: {
-            'Content-Type': 'application/json',
-            'Authorization': `Bearer ${token}`,
-          },
-        })
-      ]);
-
-      const despesas = await despesasResponse.json();
-      const receitas = await receitasResponse.json();
-      
-      setAllExpenses(despesas.despesas || []);
-      setAllIncomes(receitas.receitas || []);
-    } catch (error) {
-      console.error('Erro ao buscar dados:', error);
-    }
-  };
-
-  const filterDataByPeriod = () => {
-    const start = moment(startDate).startOf('day');
-    const end = moment(endDate).endOf('day');
-
-    const filteredExpenses = allExpenses.filter((expense: any) => {
-      const expenseDate = moment(expense.data);
-      return expenseDate.isBetween(start, end, null, '[]');
-    });
+      const params = new URLSearchParams({
+        from: moment(startDate).format('YYYY-MM-DD'),
+        to: moment(endDate).format('YYYY-MM-DD'),
+      }).toString();
 
-    const filteredIncomes = allIncomes.filter((income: any) => {
-      const incomeDate = moment(income.data);
-      return incomeDate.isBetween(start, end, null, '[]');
-    });
+      const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.graficos(userId)}?${params}`, {
+        method: 'GET',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${token}`,
+        },
+      });
+      const data = await response.json();
 
-    const hasDataToShow = filteredExpenses.length > 0 || filteredIncomes.length > 0;
-    setHasData(hasDataToShow);
+      if (!data.status) {
+        console.error('Erro ao buscar dados:', data.message);
+        return;
+      }
 
-    if (hasDataToShow) {
-      const totalExpensesValue = filteredExpenses.reduce((sum: number, expense: any) => sum + expense.valor, 0);
-      const totalIncomesValue = filteredIncomes.reduce((sum: number, income: any) => sum + income.valor, 0);
-      
-      setTotalExpenses(totalExpensesValue);
-      setTotalIncomes(totalIncomesValue);
-      
-      const expenseCategories = categories.filter((cat: any) => cat.tipo === 'despesa');
-      
-      const expensesByCategoryId = new Map();
-      filteredExpenses.forEach((expense: any) => {
-        const categoryId = expense.categoria_id;
-        expensesByCategoryId.set(
-          categoryId, 
-          (expensesByCategoryId.get(categoryId) || 0) + expense.valor
-        );
-      });
+      setHasData(data.quantidade > 0);
+      setTotalExpenses(data.total_despesas);
+      setTotalIncomes(data.total_receitas);
 
-      const expensesByCat = [];
-      
-      expensesByCategoryId.forEach((amount, categoryId) => {
-        const category = categories.find(cat => cat.id === categoryId);
-        if (category) {
-          expensesByCat.push({
-            name: category.nome,
-            amount: amount,
-            color: categoryColors[categoryId % categoryColors.length],
-            legendFontColor: '#7F7F7F',
-            legendFontSize: 12,
-          });
-        } else {
-          expensesByCat.push({
-            name: `Categoria ${categoryId} (não encontrada)`,
-            amount: amount,
-            color: categoryColors[categoryId % categoryColors.length],
-            legendFontColor: '#7F7F7F',
-            legendFontSize: 12,
-          });
-        }
-      });
+      setExpensesByCategory(data.despesas_por_categoria.map((categoria: any) => ({
+        name: categoria.nome,
+        amount: categoria.total,
+        color: categoryColors[categoria.categoria_id % categoryColors.length],
+        legendFontColor: '#7F7F7F',
+        legendFontSize: 12,
+      })));
 
-      expensesByCat.sort((a, b) => b.amount - a.amount);
-      
-      setExpensesByCategory(expensesByCat);
-      
-      const monthlyExpenses: Record<string, number> = {};
-      const monthlyIncomes: Record<string, number> = {};
-      
-      filteredExpenses.forEach((expense: any) => {
-        const month = expense.data.substring(0, 7);
-        monthlyExpenses[month] = (monthlyExpenses[month] || 0) + expense.valor;
-      });
-      
-      filteredIncomes.forEach((income: any) => {
-        const month = income.data.substring(0, 7);
-        monthlyIncomes[month] = (monthlyIncomes[month] || 0) + income.valor;
-      });
-      
-      const allMonths = Array.from(new Set([
-        ...Object.keys(monthlyExpenses),
-        ...Object.keys(monthlyIncomes)
-      ])).sort();
-      
-      const monthlyChartData = allMonths.map(month => ({
-        month,
-        expenses: monthlyExpenses[month] || 0,
-        incomes: monthlyIncomes[month] || 0
-      }));
-      
-      setMonthlyData(monthlyChartData);
-    } else {
-      setExpensesByCategory([]);
-      setTotalExpenses(0);
-      setTotalIncomes(0);
-      setMonthlyData([]);
+      setMonthlyData(data.mensal.map((item: any) => ({
+        month: item.mes,
+        expenses: item.despesas,
+        incomes: item.receitas,
+      })));
+    } catch (error) {
+      console.error('Erro ao buscar dados:', error);
     }
   };
 
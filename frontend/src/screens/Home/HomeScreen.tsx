@@ -36,45 +36,10 @@ const HomeScreen: React.FC = () => {
     });
   };
 
-  const fetchReceitas = async (token: string, userId: number) => {
+  // Totais, dicas e alertas disparados em uma única requisição (as consultas rodam em paralelo no servidor)
+  const fetchDashboard = async (token: string, userId: number) => {
     try {
-      const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.totalReceita(userId)}`, {
-        method: 'GET',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${token}`,
-        },
-      });
-      const data = await response.json();
-      if (data.status) {
-        setReceitas(Number(data.total));
-      }
-    } catch (error) {
-      console.error('Erro ao buscar receitas:', error);
-    }
-  };
-
-  const fetchDespesas = async (token: string, userId: number) => {
-    try {
-      const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.totalDespesa(userId)}`, {
-        method: 'GET',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${token}`,
-        },
-      });
-      const data = await response.json();
-      if (data.status) {
-        setDespesas(Number(data.total));
-      }
-    } catch (error) {
-      console.error('Erro ao buscar despesas:', error);
-    }
-  };
-
-  const fetchDicas = async (token: string, userId: number) => {
-    try {
-      const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.dicas(userId)}`, {
+      const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.dashboard(userId)}`, {
         method: 'GET',
         headers: {
           'Content-Type': 'application/json',
@@ -83,26 +48,13 @@ const HomeScreen: React.FC = () => {
       });
       const data = await response.json();
       if (data.status) {
+        setReceitas(Number(data.receitas));
+        setDespesas(Number(data.despesas));
         setDicas(data.dicas);
+        setHasTodayAlerts(data.alertas_disparados && data.alertas_disparados.length > 0);
       }
     } catch (error) {
-      console.error('Erro ao buscar dicas:', error);
-    }
-  };
-
-  const checkTodayAlerts = async (token: string, userId: number) => {
-    try {
-      const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.verificarAlerta(userId)}`, {
-        method: 'GET',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${token}`,
-        },
-      });
-      const data = await response.json();
-      setHasTodayAlerts(data.alertas_disparados && data.alertas_disparados.length > 0);
-    } catch (error) {
-      console.error('Erro ao verificar alertas:', error);
+      console.error('Erro ao buscar o painel:', error);
     }
   };
 
@@ -125,10 +77,7 @@ const HomeScreen: React.FC = () => {
         const decodedToken: any = jwtDecode(token);
         const userId = decodedToken.id;
         
-        await fetchReceitas(token, userId);
-        await fetchDespesas(token, userId);
-        await fetchDicas(token, userId);
-        await checkTodayAlerts(token, userId);
+        await fetchDashboard(token, userId);
       } catch (error) {
         console.error('Error fetching data:', error);
       }
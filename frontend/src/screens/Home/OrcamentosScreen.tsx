@@ -60,10 +60,10 @@ const OrcamentosScreen: React.FC<OrcamentosProps> = ({ formatCurrency }) => {
     loadTokenAndUserId();
   }, []);
 
-  // Busca categorias e orçamentos
+  // Busca o status de todos os orçamentos em uma única requisição
   const fetchCategories = async (token: string, userId: number) => {
     try {
-      const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.listarCategorias(userId)}`, {
+      const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.orcamentosStatusUsuario(userId)}`, {
         method: 'GET',
         headers: {
           'Content-Type': 'application/json',
@@ -72,29 +72,16 @@ const OrcamentosScreen: React.FC<OrcamentosProps> = ({ formatCurrency }) => {
       });
       const data = await response.json();
 
-      const expenseCategories = data.categorias.filter((category: any) => category.tipo === 'despesa' && category.orcamento_mensal > 0);
+      const budgetsData = (data.orcamentos || []).filter((budget: any) => budget.orcamento_mensal > 0);
 
-      const budgetsPromises = expenseCategories.map(async (category: any) => {
-        const budgetResponse = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.orcamentoStatus(category.id)}`, {
-          method: 'GET',
-          headers: {
-            'Content-Type': 'application/json',
-            'Authorization': `Bearer ${token}`,
-          },
-        });
-        return await budgetResponse.json();
-      });
-
-      const budgetsData = await Promise.all(budgetsPromises);
-      
-      const formattedBudgets = budgetsData.map((budget: any, index: number) => ({
-        id: expenseCategories[index].id,
-        nome: budget.categoria_nome || expenseCategories[index].nome,
+      const formattedBudgets = budgetsData.map((budget: any) => ({
+        id: budget.categoria_id,
+        nome: budget.categoria_nome,
         orcamento_mensal: budget.orcamento_mensal || 0,
         gasto_atual_mes: budget.gasto_atual_mes || 0,
         orcamento_restante: budget.orcamento_restante || 0,
         percentual_gasto: Math.min(budget.percentual_gasto || 0, 100),
-        status: budget.status || false
+        status: true
       }));
 
       setBudgets(formattedBudgets);
@@ -3,6 +3,7 @@ import AsyncStorage from '@react-native-async-storage/async-storage';
 import { jwtDecode } from 'jwt-decode';
 import { Category, DecodedToken, Expense } from '../types/expense';
 import * as Notifications from 'expo-notifications'
+import { fetchAllPages } from './pagination';
 
 export class ExpenseService {
   private static async getToken(): Promise<string> {
@@ -50,13 +51,10 @@ export class ExpenseService {
     const token = await this.getToken();
     const userId = await this.getUserId();
 
-    const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.listarDespesas(userId)}`, {
-      method: 'GET',
-      headers: { 'Content-Type': 'application/json', Authorization: `Bearer ${token}` },
-    });
-
-    const data = await response.json();
-    if (!data.status) {
+    let despesas: any[];
+    try {
+      despesas = await fetchAllPages(apiConfig.endpoints.listarDespesas(userId), token, 'despesas');
+    } catch {
       throw new Error('Não foi possível carregar as despesas');
     }
 
@@ -64,7 +62,7 @@ export class ExpenseService {
     const categories = await this.getCategories();
 
     // Formatar as despesas
-    const formattedExpenses = data.despesas.map((expense: any) => {
+    const formattedExpenses = despesas.map((expense: any) => {
       const categoriaEncontrada = categories.find(cat => cat.id === expense.categoria_id);
       return {
         id: expense.id.toString(),
@@ -2,6 +2,7 @@ import { apiConfig } from '../config/api';
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { jwtDecode } from 'jwt-decode';
 import { Category, DecodedToken, Income } from '../types/income';
+import { fetchAllPages } from './pagination';
 
 export class IncomeService {
   private static async getToken(): Promise<string> {
@@ -49,21 +50,17 @@ export class IncomeService {
     const token = await this.getToken();
     const userId = await this.getUserId();
 
-    const response = await fetch(`${apiConfig.baseUrl}${apiConfig.endpoints.listarReceitas(userId)}`, {
-      method: 'GET',
-      headers: { 'Content-Type': 'application/json', Authorization: `Bearer ${token}` },
-    });
-
-    const data = await response.json();
-    
-    if (!data.status) {
+    let receitas: any[];
+    try {
+      receitas = await fetchAllPages(apiConfig.endpoints.listarReceitas(userId), token, 'receitas');
+    } catch {
       throw new Error('Não foi possível carregar as receitas');
     }
 
     const categories = await this.getCategories();
 
     // Formatar as receitas
-    const formattedIncomes = data.receitas.map((income: any) => {
+    const formattedIncomes = receitas.map((income: any) => {
       const categoriaEncontrada = categories.find(cat => cat.id === income.categoria_id);
       return {
         id: income.id.toString(),
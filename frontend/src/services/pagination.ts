@@ -0,0 +1,30 @@
+import { apiConfig } from '../config/api';
+
+// Percorre todas as páginas de uma listagem paginada por cursor (proximo_cursor)
+export const fetchAllPages = async (
+  endpoint: string,
+  token: string,
+  key: string,
+  params: Record<string, string> = {}
+): Promise<any[]> => {
+  const items: any[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const query = new URLSearchParams({ ...params, ...(cursor ? { cursor } : {}) }).toString();
+    const response = await fetch(`${apiConfig.baseUrl}${endpoint}${query ? `?${query}` : ''}`, {
+      method: 'GET',
+      headers: { 'Content-Type': 'application/json', Authorization: `Bearer ${token}` },
+    });
+
+    const data = await response.json();
+    if (!data.status) {
+      throw new Error(data.message || 'Não foi possível carregar os dados');
+    }
+
+    items.push(...(data[key] || []));
+    cursor = data.proximo_cursor || null;
+  } while (cursor);
+
+  return items;
+};